@@ -1,4 +1,6 @@
 from ursina import *
+from world import asteroids, mesh_collision
+from world.map_gen import MAP_SIZE, HALF_MAP
 
 lazer_container = Entity()
 
@@ -30,7 +32,7 @@ class Lazer(Entity):
         self.position += self.direction * self.speed * time.dt
 
         # Détruire hors map
-        if not (-1024 < self.x < 1024 and 0 < self.y < 2048 and -1024 < self.z < 1024):
+        if not (-HALF_MAP < self.x < HALF_MAP and 0 < self.y < MAP_SIZE and -HALF_MAP < self.z < HALF_MAP):
             destroy(self)
             return
 
@@ -43,6 +45,13 @@ class Lazer(Entity):
             debug=False
         )
 
+        # Astéroïdes et Lucrehulk n'ont plus de collider : s'ils sont devant le vaisseau, ils le protègent toujours
+        if hit.hit and hit.entity.name in ('player1', 'player2'):
+            if asteroids.field is not None and asteroids.field.segment_hit(prev_pos, self.direction, hit.distance) is not None:
+                return
+            if any(hull.segment_hit(prev_pos, self.direction, hit.distance) is not None for hull in mesh_collision.hulls):
+                return
+
         if hit.hit and hit.entity.name in ('player1', 'player2'):
             print(f"Touché : {hit.entity} à {hit.world_point}")
             if hit.entity.pv <= 0:
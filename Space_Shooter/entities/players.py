@@ -1,13 +1,16 @@
 from ursina import *
 from ursina.prefabs.first_person_controller import FirstPersonController
-from entities.lazer import Lazer
+from entities.lazer import Lazer, lazer_container
+from panda3d.core import ClockObject
+from world import asteroids, mesh_collision
+from utils.model_cache import cached_model
 from ursina.shaders import lit_with_shadows_shader
 
 def players_creation(editor_camera):
     player = FirstPersonController(model='cube', color=color.blue, collider='box', position=(0, 500, 0))
     player.visible_self = editor_camera.enabled
     player.name = 'player1'
-    player.body = Entity(parent=player, model='models/Xwing', texture='models/Xwing_color',shader=lit_with_shadows_shader,color=color.rgb(255, 255, 255), position=(0,0,0), scale=(0.3,0.3,0.3))
+    player.body = Entity(parent=player, model=cached_model('models/Xwing'), texture='models/Xwing_color',shader=lit_with_shadows_shader,color=color.rgb(255, 255, 255), position=(0,0,0), scale=(0.3,0.3,0.3))
     player.body.rotation = Vec3(0, 180, 0)  # Pour que le joueur regarde dans la direction opposée
 
     player.speed = 20
@@ -25,7 +28,7 @@ def players_creation(editor_camera):
     player2.pv = 5
     player2.visible_self = editor_camera.enabled
     player2.name = 'player2'
-    player2.body = Entity(parent=player2, model='models/imp_fly_tieinterceptor', texture = 'models/imp_fly_tiefighter',shader=lit_with_shadows_shader, position=(0,-0.5,0), scale=(0.5,0.5,0.5), color=color.rgb(255, 255, 255))
+    player2.body = Entity(parent=player2, model=cached_model('models/imp_fly_tieinterceptor'), texture = 'models/imp_fly_tiefighter',shader=lit_with_shadows_shader, position=(0,-0.5,0), scale=(0.5,0.5,0.5), color=color.rgb(255, 255, 255))
     player2.body.rotation = Vec3(0, 180, 0)  # Pour que le joueur regarde dans la direction opposée
     player2.update = Func(lambda: None)
     player2.collider = BoxCollider(player2, Vec3(0,0,.5), Vec3(3.5,2.5,3))
@@ -227,10 +230,33 @@ def players_input(player, player2, cam1, cam2, focus_circle_1, focus_circle_2,
     player.body.color  = color.rgb(255-(6-player.pv)*30, 255-(6-player.pv)*30, 255-(6-player.pv)*30)
     player2.body.color = color.rgb(255, 255-(6-player2.pv)*30, 255-(6-player2.pv)*30)
 
-def entities_interaction(player, player2):
+# Rayon de la requête broadphase autour d'un vaisseau (demi-diagonale des BoxCollider, arrondie au-dessus)
+SHIP_QUERY_RADIUS = 6
+
+# main.update peut demander le résultat plusieurs fois par frame : on ne le calcule qu'une fois
+_interaction_cache = {'frame': None, 'result': 0}
+
+def entities_interaction(player, player2, collision_index):
+    frame = ClockObject.get_global_clock().get_frame_count()
+    if _interaction_cache['frame'] != frame:
+        _interaction_cache['frame'] = frame
+        _interaction_cache['result'] = _entities_interaction(player, player2, collision_index)
+    return _interaction_cache['result']
+
+def _entities_interaction(player, player2, collision_index):
+    # Broadphase : décor statique proche de chaque vaisseau (BVH), puis joueurs et lasers en vol
+    near1 = collision_index.query_sphere(tuple(player.world_position), SHIP_QUERY_RADIUS)
+    near2 = collision_index.query_sphere(tuple(player2.world_position), SHIP_QUERY_RADIUS)
+    dynamic = [player, player2] + list(lazer_container.children)
+    check1 = set(near1 + dynamic)
+    check2 = set(near2 + dynamic)
+    check1.discard(player)
+    check2.discard(player2)
+    candidates = list(dict.fromkeys(near1 + near2 + dynamic))
+
     # Détection collision player <-> sphères
-    for e in scene.entities:
-        if player.intersects(e).hit:
+    for e in candidates:
+        if e in check1 and player.intersects(e).hit:
             print(f"Collision1 avec une sphère à la position {e.position}, name: {e.name}, model: {e.model}")
             if player.pv <= 0 or e.name == 'wall' or e.name == 'player2':
                 if e.name == 'player2':
@@ -239,7 +265,7 @@ def entities_interaction(player, player2):
             else:
                 player.pv -= 1
             # Tu peux ajouter ici une action (détruire la sphère, perdre de la vie, etc.)
-        if player2.intersects(e).hit:
+        if e in check2 and player2.intersects(e).hit:
             print(f"Collision avec une sphère à la position {e.position}, name: {e.name}, model: {e.model}")
             if player2.pv <= 0 or e.name == 'wall' or e.name == 'player1':
                 if e.name == 'player1':
@@ -248,4 +274,24 @@ def entities_interaction(player, player2):
             else:
                 player.pv -= 1
             # Tu peux ajouter ici une action (détruire la sphère, perdre de la vie, etc.)
-    return 0  # Pas de collision détectée
\ No newline at end of file
+
+    # Gros modèles statiques (Lucrehulk) : BVH de triangles, mortels comme un mur
+    for hull in mesh_collision.hulls:
+        if hull.ship_hits(player):
+            print(f"Collision1 avec {hull.entity.name} à la position {hull.entity.position}")
+            return 1
+        if hull.ship_hits(player2):
+            print(f"Collision avec {hull.entity.name} à la position {hull.entity.position}")
+            return 2
+
+    # Astéroïdes (champ instancié, sans Entity) : mortels comme un mur
+    if asteroids.field is not None:
+        hit = asteroids.field.ship_hit(player, SHIP_QUERY_RADIUS)
+        if hit is not None:
+            print(f"Collision1 avec l'astéroïde {hit} à la position {tuple(asteroids.field.centers[hit])}")
+            return 1
+        hit = asteroids.field.ship_hit(player2, SHIP_QUERY_RADIUS)
+        if hit is not None:
+            print(f"Collision avec l'astéroïde {hit} à la position {tuple(asteroids.field.centers[hit])}")
+            return 2
+    return 0  # Pas de collision détectée
@@ -9,6 +9,8 @@ from panda3d.core import BitMask32
 from direct.showbase.Loader import Loader
 from panda3d.core import MovieTexture
 from world.map_gen import map_generation
+from world import asteroids
+from utils.model_cache import print_load_report
 from entities.players import players_creation, players_input, entities_interaction, players_setup
 from ui.camera import camera_creation
 from ui.hud import hud_creation, update_hud_play, update_hud_pause, update_hud_end_game, update_hud_menu
@@ -34,7 +36,7 @@ random.seed(0)
 rng_fx = random.Random()
 Entity.default_shader = lit_with_shadows_shader
 
-map_generation()
+collision_index = map_generation()
 
 editor_camera = EditorCamera(enabled=False, ignore_paused=True)
 
@@ -47,6 +49,7 @@ pivot_rotation_x = 10
 player_win = None
 
 crosshair_p1, crosshair_p2, focus_circle_1, focus_circle_2, pause_panel, pauser_text, boussole, modelwayfinderP1, modelwayfinderP2, boussole2, hyperspeed, video_tex, hyperspeed_preview, control = hud_creation(player, player2)
+print_load_report()
 music_menu = Audio('audio/Star_Wars_The_Imperial_March_Theme_Song.ogg', loop=True, autoplay=True, volume=0.5)
 music_play = Audio('audio/Battle_Of_The_Heroes.ogg', loop=True, autoplay=False, volume=0.5)
 list_music = ['Anakin_Vs_Obi-Wan.ogg', 'Battle_Of_The_Heroes.ogg', 'Imperial_Attack.ogg', 'The_Battle_Of_Endor_I.ogg', 'The_Battle_Of_Endor_III.ogg']
@@ -95,6 +98,8 @@ def update():
                     control.enabled = True
 
     # ── normal per‐frame logic ───────────────────────────────
+    # chunks d'astéroïdes autour des vaisseaux (générés en arrière-plan)
+    asteroids.field.update((tuple(player.world_position), tuple(player2.world_position)))
     cam1.look_at(player)
     cam2.look_at(player2)
     if GameState.current == 'play':
@@ -104,8 +109,9 @@ def update():
         update_hud_play(crosshair_p1, crosshair_p2, focus_circle_1, focus_circle_2, player, player2, cam1, cam2, lens1, lens2, pause_panel, pauser_text, boussole, modelwayfinderP1, modelwayfinderP2, boussole2, CAM1_MASK, CAM2_MASK, video_tex)
         #print(player.pv, player2.pv)
 
-        if entities_interaction(player, player2) != 0:
-            player_win = 'PLAYER 2 WIN' if entities_interaction(player, player2) == 1 else 'PLAYER 1 WIN' if entities_interaction(player, player2) == 2 else "ALL PLAYERS LOOSE"
+        collision = entities_interaction(player, player2, collision_index)
+        if collision != 0:
+            player_win = 'PLAYER 2 WIN' if collision == 1 else 'PLAYER 1 WIN' if collision == 2 else "ALL PLAYERS LOOSE"
             GameState.end_game()
             music_play.stop()
             music_menu.play()
@@ -160,7 +166,8 @@ def pause_input(key):
         else:
             GameState.toggle()
     elif key == 'z':
-        #quitter la fenetre
+        #quitter la fenetre (et arrêter le thread des chunks d'astéroïdes)
+        asteroids.field.close()
         application.quit()
     elif key == 'tab':    # press tab to toggle edit/play mode
         editor_camera.enabled = not editor_camera.enabled
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Les modules du jeu s'importent depuis Space_Shooter/ (comme quand main.py est lancé)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
@@ -0,0 +1,40 @@
+import numpy as np
+
+from world.chunk_gen import CHUNK_SIZE, RADIUS_RANGE, chunk_of, generate_chunk
+
+
+def test_same_seed_and_key_give_the_same_chunk():
+    for key in [(0, 0, 0), (-3, 2, 1), (7, 7, -8)]:
+        first = generate_chunk(12345, key, count=20)
+        second = generate_chunk(12345, key, count=20)
+        for a, b in zip(first, second):
+            assert np.array_equal(a, b)
+
+
+def test_seed_and_key_change_the_chunk():
+    base = generate_chunk(1, (0, 0, 0), count=20)[0]
+    assert not np.array_equal(base, generate_chunk(2, (0, 0, 0), count=20)[0])
+    assert not np.array_equal(base, generate_chunk(1, (0, 0, 1), count=20)[0])
+
+
+def test_asteroids_stay_in_their_chunk():
+    key = (-2, 1, 3)
+    centers, radii, tints = generate_chunk(7, key, count=50)
+    assert len(centers) == len(radii) == len(tints)
+    assert all(chunk_of(center) == key for center in centers.tolist())
+    assert ((radii >= RADIUS_RANGE[0]) & (radii <= RADIUS_RANGE[1])).all()
+
+
+def test_keep_clear_removes_asteroids_near_the_point():
+    key = (0, 0, 0)
+    point = (CHUNK_SIZE / 2,) * 3
+    clearance = CHUNK_SIZE / 3
+    centers, radii, _ = generate_chunk(3, key, count=200, keep_clear=[point], clearance=clearance)
+    distances = np.linalg.norm(centers - np.array(point, dtype=np.float32), axis=1)
+    assert len(centers) < 200
+    assert (distances > radii + clearance - 1e-3).all()
+
+
+def test_negative_seed_and_coordinates():
+    centers, _, _ = generate_chunk(-1, (-1, -1, -1), count=5)
+    assert all(chunk_of(center) == (-1, -1, -1) for center in centers.tolist())
@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+
+from world.triangle_bvh import TriangleBVH, obb_hits_triangles, segment_hits_triangles
+
+
+@pytest.fixture(scope='module')
+def tris():
+    # Petits triangles éparpillés dans un cube de 100, plus un grand qui traverse tout
+    rng = np.random.default_rng(1)
+    corners = rng.uniform(-50, 50, (500, 1, 3)) + rng.uniform(-3, 3, (500, 3, 3))
+    big = np.array([[[-60, -60, 0], [60, -60, 0], [0, 60, 0]]], dtype=np.float64)
+    return np.concatenate([corners, big])
+
+
+@pytest.fixture(scope='module')
+def bvh(tris):
+    return TriangleBVH.build(tris, leaf_size=4)
+
+
+def _rotation(rng):
+    q, _ = np.linalg.qr(rng.normal(size=(3, 3)))
+    return q
+
+
+def test_build_keeps_every_triangle(tris, bvh):
+    assert len(bvh.tris) == len(tris)
+    ordered = np.sort(bvh.tris.reshape(len(tris), -1), axis=0)
+    expected = np.sort(tris.astype(np.float32).reshape(len(tris), -1), axis=0)
+    assert np.array_equal(ordered, expected)
+
+
+def test_obb_hits_match_brute_force(bvh):
+    rng = np.random.default_rng(2)
+    for _ in range(300):
+        center = rng.uniform(-55, 55, 3)
+        half_axes = _rotation(rng) * rng.uniform(0.5, 6, 3)[:, None]
+        expected = bool(obb_hits_triangles(center, half_axes, bvh.tris.astype(np.float64)).any())
+        assert bvh.obb_hits(center, half_axes) == expected
+
+
+def test_segment_hit_matches_brute_force(bvh):
+    rng = np.random.default_rng(3)
+    hits = 0
+    for _ in range(300):
+        origin = rng.uniform(-55, 55, 3)
+        delta = rng.normal(size=3) * rng.uniform(1, 60)
+        expected = segment_hits_triangles(origin, delta, bvh.tris.astype(np.float64))
+        got = bvh.segment_hit(origin, delta)
+        if expected is None:
+            assert got is None
+        else:
+            hits += 1
+            assert got == pytest.approx(expected)
+    assert hits > 0
+
+
+def test_segment_through_the_big_triangle():
+    bvh = TriangleBVH.build([[[-60, -60, 0], [60, -60, 0], [0, 60, 0]]])
+    assert bvh.segment_hit(np.array([0.0, 0.0, -10.0]), np.array([0.0, 0.0, 40.0])) == pytest.approx(0.25)
+    assert bvh.segment_hit(np.array([0.0, 0.0, 10.0]), np.array([0.0, 0.0, 40.0])) is None
+
+
+def test_empty_bvh():
+    bvh = TriangleBVH.build(np.zeros((0, 3, 3)))
+    assert not bvh.obb_hits(np.zeros(3), np.eye(3))
+    assert bvh.segment_hit(np.zeros(3), np.ones(3)) is None
+
+
+def test_save_load_round_trip(tmp_path, bvh):
+    path = str(tmp_path / 'hull.npz')
+    bvh.save(path)
+    loaded = TriangleBVH.load(path)
+    assert np.array_equal(loaded.tris, bvh.tris)
+    assert loaded.nodes == bvh.nodes
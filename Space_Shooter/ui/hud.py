@@ -6,6 +6,7 @@ from math import atan2, degrees, radians, sin, cos
 from ursina import Vec3
 from direct.showbase.Loader import Loader
 from panda3d.core import MovieTexture
+from utils.model_cache import cached_model
 
 
 def project_to_screen(entity, cam_np, lens, region_offset=Vec2(0,0), region_scale=Vec2(1,1)):
@@ -100,7 +101,7 @@ def hud_creation(player, player2):
 
     modelwayfinderP1 = Entity(
         parent=boussole,
-        model='models/modelwayfinder',  # Utilise un modèle circulaire au lieu de 'quad'
+        model=cached_model('models/modelwayfinder'),  # Utilise un modèle circulaire au lieu de 'quad'
         texture='models/modelwayfinderTexture',
         color=color.rgba(255,255,255,128),
         position=Vec3(0, 0, 5),  # coin haut droit
@@ -115,7 +116,7 @@ def hud_creation(player, player2):
 
     modelwayfinderP2 = Entity(
         parent=boussole2,
-        model='models/modelwayfinder',  # Utilise un modèle circulaire au lieu de 'quad'
+        model=cached_model('models/modelwayfinder'),  # Utilise un modèle circulaire au lieu de 'quad'
         texture='models/modelwayfinderTexture',
         color=color.rgba(255,255,255,128),
         position=Vec3(0, 0, 5),  # coin haut droit
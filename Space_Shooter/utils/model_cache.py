@@ -0,0 +1,73 @@
+"""
+Cache binaire des modèles OBJ : chaque OBJ (+ son MTL) est converti une fois en
+.bam Panda3D dans cache/models/, sous le hash de son contenu. Les lancements
+suivants chargent directement le .bam au lieu de re-parser le texte de l'OBJ.
+
+    model = cached_model('models/lucrehulk')     # à passer à Entity(model=...)
+
+Un OBJ modifié change de hash, donc de fichier de cache : il est reconverti
+tout seul. Chaque chargement est chronométré (load_times, print_load_report).
+"""
+import os
+import time
+import hashlib
+
+from ursina import load_model
+from panda3d.core import Filename, PandaSystem
+from direct.showbase import ShowBaseGlobal
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+GAME_DIR = os.path.join(HERE, '..')
+CACHE_DIR = os.path.join(GAME_DIR, 'cache', 'models')
+# À incrémenter si la conversion change (invalide les caches)
+CACHE_VERSION = 1
+
+# (nom, millisecondes, 'cache' ou 'obj') de chaque chargement, dans l'ordre
+# (un même modèle chargé deux fois apparaît deux fois)
+load_times = []
+
+
+def source_hash(name):
+    # Contenu de l'OBJ et de son MTL, plus la version de Panda3D (format .bam)
+    digest = hashlib.sha1(f'v{CACHE_VERSION}:{PandaSystem.get_version_string()}:'.encode())
+    for ext in ('.obj', '.mtl'):
+        path = os.path.join(GAME_DIR, name + ext)
+        if not os.path.exists(path):
+            continue
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+    return digest.hexdigest()
+
+
+def cached_model(name):
+    """
+    Modèle name (chemin sans extension, comme pour Entity(model=...)), depuis le cache .bam.
+    Chaque appel rend une copie, utilisable par une Entity différente.
+    """
+    # Le loader Panda3D du ShowBase créé par Ursina() (garde le modèle en mémoire et en rend une copie)
+    showbase = getattr(ShowBaseGlobal, 'base', None)
+    if showbase is None:
+        raise RuntimeError('cached_model : créer Ursina() avant de charger des modèles')
+    start = time.perf_counter()
+    path = os.path.abspath(os.path.join(CACHE_DIR, f'{os.path.basename(name)}-{source_hash(name)[:16]}.bam'))
+    source = 'cache'
+    if not os.path.exists(path):
+        # Conversion : parsing de l'OBJ par Ursina, puis écriture du .bam
+        model = load_model(name)
+        if model is None:
+            raise FileNotFoundError(f'modèle introuvable : {name}')
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = path + '.tmp.bam'
+        model.write_bam_file(Filename.from_os_specific(tmp))
+        os.replace(tmp, path)
+        source = 'obj'
+    model = showbase.loader.load_model(Filename.from_os_specific(path))
+    load_times.append((name, (time.perf_counter() - start) * 1000, source))
+    return model
+
+
+def print_load_report():
+    total = sum(ms for _, ms, _ in load_times)
+    parts = ', '.join(f'{os.path.basename(name)} {ms:.0f} ms ({source})' for name, ms, source in load_times)
+    print(f'[modèles] {total:.0f} ms : {parts}')
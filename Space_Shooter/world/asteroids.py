@@ -0,0 +1,156 @@
+"""
+Champ d'astéroïdes instancié : une seule géométrie (la sphère d'Ursina) dessinée
+N fois par le GPU en un seul draw call par caméra, au lieu de N Entities.
+
+Chaque instance lit sa position, son rayon et sa teinte dans une texture buffer
+(2 texels RGBA32 par astéroïde) avec gl_InstanceID. Les données de collision
+restent côté CPU dans des tableaux NumPy (centers, radii) : distance vectorisée
+sur tout le champ, puis test sphère / boîte exact pour les quelques proches.
+"""
+import numpy as np
+from ursina import Entity, Shader, Vec3, scene
+from panda3d.core import Texture, GeomEnums, BoundingBox, Point3
+
+# Champ courant, créé par map_generation (les lasers s'en servent pour s'arrêter sur les astéroïdes)
+field = None
+
+# Direction de la lumière (celle du DirectionalLight de main.py) et part de lumière ambiante
+SUN_DIRECTION = Vec3(1, -1, -1).normalized()
+AMBIENT = 0.3
+
+asteroid_shader = Shader(language=Shader.GLSL, vertex='''
+#version 140
+uniform mat4 p3d_ModelViewProjectionMatrix;
+uniform samplerBuffer instance_data;
+uniform vec2 texture_scale;
+in vec4 p3d_Vertex;
+in vec3 p3d_Normal;
+in vec2 p3d_MultiTexCoord0;
+out vec2 uv;
+out vec3 normal;
+out vec4 tint;
+
+void main() {
+    // texel 0 : centre + rayon, texel 1 : teinte
+    vec4 sphere = texelFetch(instance_data, gl_InstanceID * 2);
+    tint = texelFetch(instance_data, gl_InstanceID * 2 + 1);
+    // le modèle 'sphere' a un rayon de 0.5
+    vec3 position = p3d_Vertex.xyz * (sphere.w * 2.0) + sphere.xyz;
+    gl_Position = p3d_ModelViewProjectionMatrix * vec4(position, 1.0);
+    uv = p3d_MultiTexCoord0 * texture_scale;
+    normal = p3d_Normal;
+}
+''', fragment='''
+#version 140
+uniform sampler2D p3d_Texture0;
+uniform vec3 sun_direction;
+uniform float ambient;
+in vec2 uv;
+in vec3 normal;
+in vec4 tint;
+out vec4 fragColor;
+
+void main() {
+    vec4 albedo = texture(p3d_Texture0, uv) * tint;
+    float light = ambient + (1.0 - ambient) * max(dot(normalize(normal), -sun_direction), 0.0);
+    fragColor = vec4(albedo.rgb * light, albedo.a);
+}
+''')
+
+
+def sphere_hits_box(local_center, radius, box_center, box_size):
+    # Sphère (déjà dans le repère de la boîte) contre boîte alignée : point le plus proche
+    d2 = 0.0
+    for axis in range(3):
+        half = box_size[axis] / 2
+        offset = local_center[axis] - box_center[axis]
+        if offset > half:
+            d2 += (offset - half) ** 2
+        elif offset < -half:
+            d2 += (offset + half) ** 2
+    return d2 < radius * radius
+
+
+class AsteroidField:
+    """
+    N astéroïdes : centers (N, 3), radii (N,) et tints (N, 4) en float32.
+      - entity : le nœud instancié qui les dessine tous
+      - set_data(centers, radii, tints) : remplace le champ (un seul envoi au GPU)
+      - update(points) : appelé à chaque frame avec la position des vaisseaux (rien à faire ici)
+      - close() : appelé en quittant (rien à faire ici)
+      - ship_hit(ship, reach) : index d'un astéroïde qui touche le BoxCollider du vaisseau, ou None
+      - segment_hit(origin, direction, distance) : distance du premier astéroïde sur le segment, ou None
+    """
+
+    def __init__(self, centers=(), radii=(), tints=(), texture='models/sol_lune', texture_scale=(2, 2)):
+        self.entity = Entity(model='sphere', texture=texture, shader=asteroid_shader, name='asteroids')
+        self.entity.set_shader_input('texture_scale', texture_scale)
+        self.entity.set_shader_input('sun_direction', SUN_DIRECTION)
+        self.entity.set_shader_input('ambient', AMBIENT)
+        self.buffer = Texture('asteroid_instances')
+        self.set_data(centers, radii, tints)
+
+    def __len__(self):
+        return len(self.radii)
+
+    def set_data(self, centers, radii, tints):
+        self.centers = np.asarray(centers, dtype=np.float32).reshape(-1, 3)
+        self.radii = np.asarray(radii, dtype=np.float32).reshape(-1)
+        self.tints = np.asarray(tints, dtype=np.float32).reshape(-1, 4)
+        self.upload()
+
+    def upload(self):
+        # (Re)envoie centres / rayons / teintes au GPU après un changement des tableaux
+        count = len(self.radii)
+        # un nombre d'instances de 0 désactive l'instanciation : on cache le nœud à la place
+        self.entity.enabled = count > 0
+        if not count:
+            return
+        data = np.empty((count, 2, 4), dtype=np.float32)
+        data[:, 0, :3] = self.centers
+        data[:, 0, 3] = self.radii
+        data[:, 1] = self.tints
+        self.buffer.setup_buffer_texture(count * 2, Texture.T_float, Texture.F_rgba32, GeomEnums.UH_static)
+        self.buffer.set_ram_image(data.tobytes())
+        self.entity.set_shader_input('instance_data', self.buffer)
+        self.entity.set_instance_count(count)
+
+        # Panda3D culle avec les bornes d'une seule sphère : on lui donne celles du champ entier
+        lo = (self.centers - self.radii[:, None]).min(axis=0)
+        hi = (self.centers + self.radii[:, None]).max(axis=0)
+        self.entity.node().set_bounds(BoundingBox(Point3(*lo), Point3(*hi)))
+        self.entity.node().set_final(True)
+
+    def update(self, points):
+        pass
+
+    def close(self):
+        pass
+
+    def hits_ship(self, ship, i):
+        local = ship.get_relative_point(scene, Point3(*self.centers[i].tolist()))
+        collider = ship.collider
+        return sphere_hits_box(local, float(self.radii[i]), collider.center, collider.size)
+
+    def ship_hit(self, ship, reach):
+        # reach : rayon d'une sphère englobant le collider du vaisseau (broadphase)
+        offset = self.centers - np.array(tuple(ship.world_position), dtype=np.float32)
+        limit = self.radii + reach
+        for i in np.flatnonzero((offset * offset).sum(axis=1) < limit * limit):
+            if self.hits_ship(ship, i):
+                return int(i)
+        return None
+
+    def segment_hit(self, origin, direction, distance):
+        # Intersection segment / sphères vectorisée sur tout le champ
+        origin = np.array(tuple(origin), dtype=np.float32)
+        direction = np.array(tuple(direction), dtype=np.float32)
+        to_center = self.centers - origin
+        along = to_center @ direction
+        gap2 = self.radii * self.radii - ((to_center * to_center).sum(axis=1) - along * along)
+        half_chord = np.sqrt(np.maximum(gap2, 0.0))
+        enter = along - half_chord
+        hit = (gap2 > 0) & (enter <= distance) & (along + half_chord >= 0)
+        if not hit.any():
+            return None
+        return float(max(0.0, enter[hit].min()))
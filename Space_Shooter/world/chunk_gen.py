@@ -0,0 +1,41 @@
+"""
+Contenu d'un chunk d'astéroïdes, fonction de (seed, coordonnées du chunk)
+seulement : world/chunks.py le (re)génère à la demande autour des vaisseaux.
+Pas d'import Ursina ici : le module se teste sans fenêtre.
+"""
+import numpy as np
+
+# Côté d'un chunk (la map de 2048 en compte 8 x 8 x 8)
+CHUNK_SIZE = 256
+# Nombre moyen d'astéroïdes par chunk (loi de Poisson) : même densité que la map
+# d'origine (512 astéroïdes pour un cube de 2048)
+ASTEROIDS_PER_CHUNK = 1
+# Rayon des astéroïdes (scale 2..30 sur une sphère de rayon .5)
+RADIUS_RANGE = (1, 15)
+
+WHITE = (1.0, 1.0, 1.0, 1.0)
+GRAY = (0.5, 0.5, 0.5, 1.0)
+
+
+def chunk_of(point, size=CHUNK_SIZE):
+    return tuple(int(np.floor(c / size)) for c in point)
+
+
+def generate_chunk(seed, key, count=ASTEROIDS_PER_CHUNK, size=CHUNK_SIZE, keep_clear=(), clearance=0):
+    """
+    Astéroïdes du chunk key : (centers, radii, tints). Déterministe pour (seed, key).
+    count est un nombre moyen. Les astéroïdes à moins de clearance d'un point de
+    keep_clear (spawns) sont retirés.
+    """
+    # SeedSequence n'accepte que des entiers positifs : complément à deux sur 32 bits
+    rng = np.random.default_rng([v & 0xffffffff for v in (seed,) + tuple(key)])
+    count = int(rng.poisson(count))
+    radii = rng.uniform(*RADIUS_RANGE, count)
+    centers = np.asarray(key, dtype=np.float64) * size + rng.uniform(0, size, (count, 3))
+    tints = np.where(rng.random(count)[:, None] < 0.5, WHITE, GRAY)
+
+    keep = np.ones(count, dtype=bool)
+    for point in keep_clear:
+        offset = centers - np.asarray(point, dtype=np.float64)
+        keep &= (offset * offset).sum(axis=1) > (radii + clearance) ** 2
+    return (centers[keep].astype(np.float32), radii[keep].astype(np.float32), tints[keep].astype(np.float32))
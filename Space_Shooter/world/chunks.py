@@ -0,0 +1,119 @@
+"""
+Astéroïdes générés par chunks autour des vaisseaux, pour des maps plus grandes
+que ce qu'on peut garder entièrement en mémoire.
+
+L'espace est découpé en cubes de CHUNK_SIZE. Le contenu d'un chunk ne dépend
+que de (seed, coordonnées du chunk) (world/chunk_gen.py) : on peut le jeter et
+le régénérer à l'identique. Les chunks proches d'un vaisseau sont générés en
+arrière-plan (un thread), ceux que les deux vaisseaux ont quittés restent dans
+un cache LRU limité à MAX_CACHED_CHUNKS, puis sont oubliés. Tous les chunks actifs sont
+dessinés par un seul nœud instancié (world/asteroids.py), ré-envoyé au GPU
+seulement quand l'ensemble des chunks actifs change.
+
+Le rendu n'attend jamais le thread. Un chunk pas encore généré n'existe ni à
+l'écran ni pour les collisions : le thread reçoit donc toujours en premier les
+chunks manquants les plus proches d'un vaisseau, et seulement MAX_QUEUED à la
+fois pour qu'un chunk proche ne patiente pas derrière toute une file de chunks
+lointains. Un chunk entre dans le rayon de chargement LOAD_RADIUS - 1 chunks
+avant que le vaisseau ne l'atteigne (~0.1 ms de génération contre ~1 s de trajet
+par chunk à pleine vitesse) : il est prêt bien avant d'être touché.
+"""
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from world.asteroids import AsteroidField
+from world.chunk_gen import chunk_of, generate_chunk
+
+# Chunks chargés autour de chaque vaisseau (2 = cube de 5 x 5 x 5 chunks, ~120 sur 512 au spawn)
+LOAD_RADIUS = 2
+# Chunks confiés au thread en même temps (les suivants sont choisis à la frame d'après)
+MAX_QUEUED = 4
+# Chunks gardés en mémoire au total (actifs + cache), ~200 octets par astéroïde
+MAX_CACHED_CHUNKS = 256
+
+
+def _chunk_distance(a, b):
+    return max(abs(a[0] - b[0]), abs(a[1] - b[1]), abs(a[2] - b[2]))
+
+
+class AsteroidStreamer(AsteroidField):
+    """
+    AsteroidField dont le contenu suit les vaisseaux : update(points) à chaque frame.
+    bounds = ((min_x, min_y, min_z), (max_x, max_y, max_z)) : seuls les chunks de
+    cette zone existent (la map).
+    """
+
+    def __init__(self, seed, bounds, keep_clear=(), clearance=0, **kwargs):
+        self.seed = seed
+        self.keep_clear = keep_clear
+        self.clearance = clearance
+        self.chunk_lo = chunk_of(bounds[0])
+        self.chunk_hi = chunk_of(tuple(c - 1e-6 for c in bounds[1]))
+        self.cache = OrderedDict()    # key -> (centers, radii, tints), le plus ancien d'abord
+        self.pending = {}             # key -> Future
+        self.active = ()
+        self.ship_chunks = None
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='asteroid-chunks')
+        super().__init__(**kwargs)
+
+    def _generate(self, key):
+        return generate_chunk(self.seed, key, keep_clear=self.keep_clear, clearance=self.clearance)
+
+    def wanted(self, points, radius=LOAD_RADIUS):
+        keys = set()
+        for point in points:
+            cx, cy, cz = chunk_of(point)
+            for x in range(max(cx - radius, self.chunk_lo[0]), min(cx + radius, self.chunk_hi[0]) + 1):
+                for y in range(max(cy - radius, self.chunk_lo[1]), min(cy + radius, self.chunk_hi[1]) + 1):
+                    for z in range(max(cz - radius, self.chunk_lo[2]), min(cz + radius, self.chunk_hi[2]) + 1):
+                        keys.add((x, y, z))
+        return keys
+
+    def prime(self, points):
+        # Au chargement de la map : génère tout de suite les chunks des spawns
+        for key in self.wanted(points):
+            if key not in self.cache:
+                self.cache[key] = self._generate(key)
+        self.ship_chunks = None
+        self.update(points)
+
+    def update(self, points):
+        ship_chunks = tuple(chunk_of(p) for p in points)
+        if ship_chunks == self.ship_chunks and not self.pending:
+            return
+        self.ship_chunks = ship_chunks
+        wanted = self.wanted(points)
+
+        # Récupère ce que le thread a fini, sans jamais attendre
+        for key, future in list(self.pending.items()):
+            if future.done():
+                del self.pending[key]
+                self.cache[key] = future.result()
+        # Les chunks manquants les plus proches d'un vaisseau d'abord, MAX_QUEUED à la fois
+        missing = [key for key in wanted if key not in self.cache and key not in self.pending]
+        missing.sort(key=lambda key: min(_chunk_distance(key, ship) for ship in ship_chunks))
+        for key in missing[:max(0, MAX_QUEUED - len(self.pending))]:
+            self.pending[key] = self.executor.submit(self._generate, key)
+
+        active = tuple(sorted(key for key in wanted if key in self.cache))
+        if active == self.active:
+            return
+        self.active = active
+        for key in active:
+            self.cache.move_to_end(key)
+        # Limite mémoire : oublie les chunks quittés depuis le plus longtemps
+        while len(self.cache) > max(MAX_CACHED_CHUNKS, len(active)):
+            self.cache.popitem(last=False)
+
+        chunks = [self.cache[key] for key in active]
+        if chunks:
+            self.set_data(*(np.concatenate(parts) for parts in zip(*chunks)))
+        else:
+            self.set_data((), (), ())
+
+    def close(self):
+        # À appeler en quittant : abandonne les chunks pas encore commencés
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self.pending.clear()
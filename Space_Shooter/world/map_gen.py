@@ -1,15 +1,63 @@
 from ursina import *
+from world.spatial_index import StaticBVH
+from world import asteroids
+from world.asteroids import AsteroidField
+from world.chunks import AsteroidStreamer
+from world import mesh_collision
+from world.mesh_collision import MeshCollision
+from utils.model_cache import cached_model
+
+# Côté du cube de jeu (multiple de chunk_gen.CHUNK_SIZE) : x et z dans ±MAP_SIZE/2, y dans 0..MAP_SIZE
+MAP_SIZE = 2048
+HALF_MAP = MAP_SIZE / 2
+
+# Astéroïdes générés par chunks autour des vaisseaux (world/chunks.py), ou champ fixe tiré au lancement.
+# Désactivé tant que la map tient en mémoire : à 2048, le champ fixe (random.seed(0) de
+# main.py, même map à chaque lancement) est entièrement visible, le streaming ne ferait
+# qu'apparaître les astéroïdes au-delà de LOAD_RADIUS chunks. À activer quand MAP_SIZE grandit.
+ASTEROID_STREAMING = False
+# Graine des chunks : None = nouvelle graine à chaque lancement (affichée pour rejouer une map)
+ASTEROID_SEED = None
+# Nombre d'astéroïdes du champ fixe (instanciés : le coût de rendu ne dépend presque plus de ce nombre)
+ASTEROID_COUNT = 512
+# Positions de départ des vaisseaux (voir players_setup), gardées libres d'astéroïdes
+SPAWN_POINTS = [(0, 500, 10), (0, 500, -10)]
+SPAWN_CLEARANCE = 40
+
+def build_collision_index(entities):
+    # Boîtes monde du décor statique à collider (sol et murs) -> BVH (à reconstruire si la map change)
+    # Les astéroïdes et le Lucrehulk n'y sont pas : tests NumPy dans world/asteroids.py et world/mesh_collision.py
+    entries = []
+    for e in entities:
+        lo, hi = e.get_tight_bounds(scene)
+        entries.append(((lo.x, lo.y, lo.z), (hi.x, hi.y, hi.z), e))
+    return StaticBVH(entries)
+
+def asteroid_field_generation(count):
+    # Même tirage (et même ordre d'appels à random) qu'avec les anciennes Entities
+    centers, radii, tints = [], [], []
+    for i in range(count):
+        scale_x_value = random.uniform(2,30)
+        x = random.uniform(-HALF_MAP,HALF_MAP)
+        z = random.uniform(-HALF_MAP,HALF_MAP)
+        y = random.uniform(0,MAP_SIZE)
+        tint = color.white if random.random() < 0.5 else color.gray
+        # modèle 'sphere' de rayon .5 avec origin_y=-.5 : posé sur (x, y, z)
+        centers.append((x, y + scale_x_value / 2, z))
+        radii.append(scale_x_value / 2)
+        tints.append(tuple(tint))
+    return AsteroidField(centers, radii, tints)
 
 def map_generation():
-    ground = Entity(model='plane', collider='box',name='wall', scale=2048, texture='models/quadrillage', texture_scale=(4,4), color=color.rgba(255, 255, 255, 64))
+    ground = Entity(model='plane', collider='box',name='wall', scale=MAP_SIZE, texture='models/quadrillage', texture_scale=(MAP_SIZE/512,MAP_SIZE/512), color=color.rgba(255, 255, 255, 64))
     wall = Entity(
         model='quad',
         collider='box',
         name='wall',
-        scale=2048,
+        scale=MAP_SIZE,
         texture='models/quadrillage',
-        texture_scale=(4,4),
-        position=(0, 1024, 1024),
+        texture_scale=(MAP_SIZE/512,MAP_SIZE/512),
+        position=(0, HALF_MAP, HALF_MAP),
         color=color.rgba(255, 255, 255, 64)  # transparence ajoutée
     )
     #wall.collider.visible = True
@@ -17,10 +65,10 @@ def map_generation():
         model='quad',
         collider='box',
         name='wall',
-        scale=2048,
+        scale=MAP_SIZE,
         texture='models/quadrillage',
-        texture_scale=(4,4),
-        position=(0, 1024, -1024),
+        texture_scale=(MAP_SIZE/512,MAP_SIZE/512),
+        position=(0, HALF_MAP, -HALF_MAP),
         rotation_y=180,
         color=color.rgba(255, 255, 255, 64)
     )
@@ -28,10 +76,10 @@ def map_generation():
         model='quad',
         collider='box',
         name='wall',
-        scale=2048,
+        scale=MAP_SIZE,
         texture='models/quadrillage',
-        texture_scale=(4,4),
-        position=(1024, 1024, 0),
+        texture_scale=(MAP_SIZE/512,MAP_SIZE/512),
+        position=(HALF_MAP, HALF_MAP, 0),
         rotation_y=90,
         color=color.rgba(255, 255, 255, 64)
     )
@@ -39,10 +87,10 @@ def map_generation():
         model='quad',
         collider='box',
         name='wall',
-        scale=2048,
+        scale=MAP_SIZE,
         texture='models/quadrillage',
-        texture_scale=(4,4),
-        position=(-1024, 1024, 0),
+        texture_scale=(MAP_SIZE/512,MAP_SIZE/512),
+        position=(-HALF_MAP, HALF_MAP, 0),
         rotation_y=-90,
         color=color.rgba(255, 255, 255, 64)
     )
@@ -50,31 +98,30 @@ def map_generation():
         model='quad',
         collider='box',
         name='wall',
-        scale=2048,
+        scale=MAP_SIZE,
         texture='models/quadrillage',
-        texture_scale=(4,4),
-        position=(0, 2048, 0),
+        texture_scale=(MAP_SIZE/512,MAP_SIZE/512),
+        position=(0, MAP_SIZE, 0),
         rotation_x=-90,
         color=color.rgba(255, 255, 255, 64)
     )
     #ground.collider.visible = True
 
-    for i in range(512):
-        scale_x_value = random.uniform(2,30)
-        Entity(model='sphere', origin_y=-.5, scale=2, texture='models/sol_lune', texture_scale=(2,2),
-            x=random.uniform(-1024,1024),
-            z=random.uniform(-1024,1024),
-            y=random.uniform(0,2048),
-            collider='sphere',
-            name='wall',
-            scale_x=scale_x_value,
-            scale_y=scale_x_value,
-            scale_z=scale_x_value,
-            color=color.white if random.random() < 0.5 else color.gray,
-            )
-        #e = scene.entities[-1]
-        #if hasattr(e, 'collider') and e.collider:
-            #e.collider.visible = True
-    lucrehulk = Entity(model='models/lucrehulk', texture = 'models/lucrehulk', name='wall', collider='mesh', position=(0,250,0), scale=40)
+    static_entities = [ground, wall, wall2, wall3, wall4, wall5]
+
+    if ASTEROID_STREAMING:
+        # main.py fixe random.seed(0) : la graine vient de l'OS pour changer à chaque lancement
+        seed = ASTEROID_SEED if ASTEROID_SEED is not None else random.SystemRandom().getrandbits(32)
+        print(f'[astéroïdes] graine {seed}')
+        asteroids.field = AsteroidStreamer(seed, ((-HALF_MAP, 0, -HALF_MAP), (HALF_MAP, MAP_SIZE, HALF_MAP)),
+                                           keep_clear=SPAWN_POINTS, clearance=SPAWN_CLEARANCE)
+        asteroids.field.prime(SPAWN_POINTS)
+    else:
+        asteroids.field = asteroid_field_generation(ASTEROID_COUNT)
+
+    # Pas de collider='mesh' : collisions par la BVH en cache de world/mesh_collision.py
+    lucrehulk = Entity(model=cached_model('models/lucrehulk'), texture = 'models/lucrehulk', name='wall', position=(0,250,0), scale=40)
     lucrehulk.rotation = Vec3(90, 0, 0)  # Pour que le Lucrehulk regarde dans la direction opposée
-    #lucrehulk.collider.visible = True
\ No newline at end of file
+    mesh_collision.hulls[:] = [MeshCollision(lucrehulk, 'models/lucrehulk.obj')]
+
+    return build_collision_index(static_entities)
@@ -0,0 +1,106 @@
+"""
+Collisions contre les gros modèles statiques (le Lucrehulk) sans collider='mesh'.
+
+Les triangles du modèle sont rangés une fois pour toutes dans une BVH (world/triangle_bvh.py),
+enregistrée dans cache/collision/ sous le hash du fichier du modèle : tant que
+le fichier ne change pas, le lancement suivant la relit directement. Les tests
+se font dans le repère de l'entité (échelle et rotation comprises) :
+  - vaisseau : sa BoxCollider (boîte orientée) contre les triangles, par axes séparateurs
+  - laser : segment contre les triangles (Möller-Trumbore)
+Seuls les triangles des feuilles touchées par la boîte de la requête sont testés.
+"""
+import os
+import time
+import hashlib
+import zipfile
+
+import numpy as np
+from ursina import Vec3, scene
+from panda3d.core import GeomVertexReader, Point3
+
+from world.triangle_bvh import TriangleBVH, LEAF_SIZE
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.path.join(HERE, '..', 'cache', 'collision')
+# À incrémenter si le format ou la construction de la BVH change (invalide les caches)
+CACHE_VERSION = 1
+
+# Modèles statiques avec une collision par BVH (remplis par map_generation)
+hulls = []
+
+
+def file_hash(path):
+    digest = hashlib.sha1(f'v{CACHE_VERSION}:{LEAF_SIZE}:'.encode())
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def model_triangles(entity):
+    # Triangles du modèle tel qu'il est chargé, dans le repère de l'entité
+    tris = []
+    for geom_np in entity.model.find_all_matches('**/+GeomNode'):
+        mat = geom_np.get_mat(entity)
+        node = geom_np.node()
+        for g in range(node.get_num_geoms()):
+            geom = node.get_geom(g).decompose()
+            reader = GeomVertexReader(geom.get_vertex_data(), 'vertex')
+            verts = []
+            while not reader.is_at_end():
+                verts.append(tuple(mat.xform_point(Point3(reader.get_data3()))))
+            verts = np.array(verts, dtype=np.float64).reshape(-1, 3)
+            for p in range(geom.get_num_primitives()):
+                indices = np.array(geom.get_primitive(p).get_vertex_list(), dtype=np.int64)
+                tris.append(verts[indices[:len(indices) // 3 * 3].reshape(-1, 3)])
+    if not tris:
+        return np.zeros((0, 3, 3))
+    return np.concatenate(tris)
+
+
+class MeshCollision:
+    """
+    Collision par BVH d'une entité statique dont le modèle vient de source_path.
+      - ship_hits(ship) : la BoxCollider du vaisseau touche-t-elle le modèle
+      - segment_hit(origin, direction, distance) : distance (monde) du premier impact, ou None
+    """
+
+    def __init__(self, entity, source_path, cache_dir=CACHE_DIR):
+        self.entity = entity
+        start = time.perf_counter()
+        name = os.path.splitext(os.path.basename(source_path))[0]
+        path = os.path.abspath(os.path.join(cache_dir, f'{name}-{file_hash(source_path)[:16]}.npz'))
+        self.bvh = None
+        source = 'cache'
+        if os.path.exists(path):
+            try:
+                self.bvh = TriangleBVH.load(path)
+            except (zipfile.BadZipFile, ValueError, KeyError, EOFError, OSError) as e:
+                # Cache tronqué ou d'un autre format : on le jette et on reconstruit
+                print(f'[collision] cache illisible {path} ({e}), reconstruction')
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+        if self.bvh is None:
+            self.bvh = TriangleBVH.build(model_triangles(entity))
+            self.bvh.save(path)
+            source = 'construite'
+        print(f'[collision] {name} : BVH de {len(self.bvh.tris)} triangles {source} en '
+              f'{(time.perf_counter() - start) * 1000:.0f} ms')
+
+    def ship_hits(self, ship):
+        collider = ship.collider
+        center = self.entity.get_relative_point(ship, Point3(*collider.center))
+        half_axes = np.array([
+            tuple(self.entity.get_relative_vector(ship, axis * (collider.size[i] / 2)))
+            for i, axis in enumerate((Vec3(1, 0, 0), Vec3(0, 1, 0), Vec3(0, 0, 1)))
+        ], dtype=np.float64)
+        return self.bvh.obb_hits(np.array(tuple(center), dtype=np.float64), half_axes)
+
+    def segment_hit(self, origin, direction, distance):
+        local_origin = self.entity.get_relative_point(scene, Point3(*origin))
+        local_delta = self.entity.get_relative_vector(scene, Vec3(*direction) * distance)
+        fraction = self.bvh.segment_hit(np.array(tuple(local_origin), dtype=np.float64),
+                                        np.array(tuple(local_delta), dtype=np.float64))
+        return None if fraction is None else fraction * distance
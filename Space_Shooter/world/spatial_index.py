@@ -0,0 +1,98 @@
+"""
+Broadphase pour les collisions des vaisseaux : une BVH (arbre de boîtes
+englobantes alignées sur les axes) sur le décor statique qui a un collider
+Ursina, c'est-à-dire aujourd'hui le sol et les 5 murs de la map. Les
+astéroïdes (world/asteroids.py) et le Lucrehulk (world/mesh_collision.py) ont
+leurs propres tests et n'y sont plus.
+
+Six boîtes restent utiles à indexer : un ship.intersects() passe par le
+traverser de collision de Panda3D et coûte cher, et la BVH en évite presque
+tous les appels (un vaisseau n'est en général près d'aucun mur). Tout nouvel
+objet statique avec un collider n'a qu'à être ajouté à l'index. L'arbre est
+construit une fois par map (rebuild) et chaque vaisseau ne teste ensuite que
+les objets dont la boîte touche la sienne, au lieu de tout scene.entities.
+Les boîtes sont des tuples (min_x, min_y, min_z), (max_x, max_y, max_z) en
+coordonnées monde. Pas d'import Ursina ici : le module se teste sans fenêtre.
+"""
+
+# Objets max par feuille (en dessous, tester la liste coûte moins que descendre)
+LEAF_SIZE = 4
+
+
+def _overlaps(lo_a, hi_a, lo_b, hi_b):
+    return (lo_a[0] <= hi_b[0] and lo_b[0] <= hi_a[0]
+            and lo_a[1] <= hi_b[1] and lo_b[1] <= hi_a[1]
+            and lo_a[2] <= hi_b[2] and lo_b[2] <= hi_a[2])
+
+
+def _merge(entries):
+    lo = tuple(min(e[0][axis] for e in entries) for axis in range(3))
+    hi = tuple(max(e[1][axis] for e in entries) for axis in range(3))
+    return lo, hi
+
+
+class StaticBVH:
+    """
+    BVH sur des entrées (lo, hi, item), coupée à la médiane de l'axe le plus long.
+      - rebuild(entries) : reconstruit l'arbre (à appeler quand la map change)
+      - query(lo, hi) : items dont la boîte chevauche (lo, hi), dans l'ordre d'insertion
+    Les nœuds sont stockés à plat : (lo, hi, gauche, droite, items) ; une feuille
+    a gauche = droite = -1.
+    """
+
+    def __init__(self, entries=()):
+        self.rebuild(entries)
+
+    def __len__(self):
+        return self.count
+
+    def rebuild(self, entries):
+        # l'index d'insertion sert à rendre les résultats dans l'ordre d'origine
+        entries = [(lo, hi, order, item) for order, (lo, hi, item) in enumerate(entries)]
+        self.count = len(entries)
+        self.nodes = []
+        if entries:
+            self._build(entries)
+
+    def _build(self, entries):
+        lo, hi = _merge(entries)
+        index = len(self.nodes)
+        if len(entries) <= LEAF_SIZE:
+            self.nodes.append((lo, hi, -1, -1, [(order, e_lo, e_hi, item) for e_lo, e_hi, order, item in entries]))
+            return index
+
+        self.nodes.append(None)   # réservé, rempli une fois les enfants construits
+        axis = max(range(3), key=lambda a: hi[a] - lo[a])
+        entries.sort(key=lambda e: e[0][axis] + e[1][axis])
+        middle = len(entries) // 2
+        left = self._build(entries[:middle])
+        right = self._build(entries[middle:])
+        self.nodes[index] = (lo, hi, left, right, None)
+        return index
+
+    def query(self, lo, hi):
+        if not self.nodes:
+            return []
+        found = []
+        stack = [0]
+        nodes = self.nodes
+        while stack:
+            node_lo, node_hi, left, right, items = nodes[stack.pop()]
+            if not _overlaps(lo, hi, node_lo, node_hi):
+                continue
+            if items is None:
+                stack.append(right)
+                stack.append(left)
+                continue
+            for order, item_lo, item_hi, item in items:
+                if _overlaps(lo, hi, item_lo, item_hi):
+                    found.append((order, item))
+        found.sort(key=lambda f: f[0])
+        return [item for _, item in found]
+
+    def query_sphere(self, center, radius):
+        """
+        Items dont la boîte touche la boîte englobante de la sphère (center, radius).
+        """
+        x, y, z = center
+        return self.query((x - radius, y - radius, z - radius), (x + radius, y + radius, z + radius))
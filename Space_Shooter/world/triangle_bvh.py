@@ -0,0 +1,150 @@
+"""
+BVH sur les triangles d'un modèle statique, et les tests exacts contre ses
+triangles (NumPy) : boîte orientée par axes séparateurs, segment par
+Möller-Trumbore. world/mesh_collision.py s'en sert pour le Lucrehulk et met
+l'arbre en cache. Pas d'import Ursina ici : le module se teste sans fenêtre.
+"""
+import os
+
+import numpy as np
+
+# Triangles max par feuille
+LEAF_SIZE = 8
+
+
+def obb_hits_triangles(center, half_axes, tris):
+    """
+    Pour chaque triangle de tris (T, 3, 3) : touche-t-il la boîte orientée de
+    centre center et de demi-axes half_axes (3 vecteurs orthogonaux) ? 13 axes
+    séparateurs : normale du triangle, axes de la boîte, arêtes x axes.
+    """
+    v = tris - center
+    edges = np.stack([v[:, 1] - v[:, 0], v[:, 2] - v[:, 1], v[:, 0] - v[:, 2]], axis=1)
+    count = len(tris)
+    axes = np.concatenate([
+        np.cross(edges[:, 0], edges[:, 1])[:, None, :],
+        np.broadcast_to(half_axes, (count, 3, 3)),
+        np.cross(edges[:, :, None, :], half_axes[None, None, :, :]).reshape(count, 9, 3),
+    ], axis=1)
+    projections = np.einsum('tvk,tak->tav', v, axes)
+    radius = np.abs(np.einsum('ik,tak->tai', half_axes, axes)).sum(axis=2)
+    separated = (projections.min(axis=2) > radius) | (projections.max(axis=2) < -radius)
+    return ~separated.any(axis=1)
+
+
+def segment_hits_triangles(origin, delta, tris):
+    """
+    Fraction (0..1) du segment origin -> origin + delta au premier triangle touché, ou None.
+    """
+    e1 = tris[:, 1] - tris[:, 0]
+    e2 = tris[:, 2] - tris[:, 0]
+    p = np.cross(delta, e2)
+    det = (e1 * p).sum(axis=1)
+    valid = np.abs(det) > 1e-12
+    inv = np.where(valid, 1.0 / np.where(valid, det, 1.0), 0.0)
+    s = origin - tris[:, 0]
+    u = (s * p).sum(axis=1) * inv
+    q = np.cross(s, e1)
+    w = (delta * q).sum(axis=1) * inv
+    t = (e2 * q).sum(axis=1) * inv
+    hit = valid & (u >= 0) & (w >= 0) & (u + w <= 1) & (t >= 0) & (t <= 1)
+    if not hit.any():
+        return None
+    return float(t[hit].min())
+
+
+class TriangleBVH:
+    """
+    BVH sur des triangles (T, 3, 3), coupée à la médiane des centres sur l'axe le plus long.
+    Les nœuds sont des tableaux à plat (lo, hi, left, right, start, count) ; les
+    triangles sont réordonnés pour qu'une feuille soit tris[start:start + count].
+    """
+
+    def __init__(self, tris, lo, hi, left, right, start, count):
+        self.tris = tris
+        self.arrays = (lo, hi, left, right, start, count)
+        # listes Python pour le parcours (bien plus rapide que d'indexer NumPy élément par élément)
+        self.nodes = list(zip(lo.tolist(), hi.tolist(), left.tolist(), right.tolist(), start.tolist(), count.tolist()))
+
+    @classmethod
+    def build(cls, tris, leaf_size=LEAF_SIZE):
+        tris = np.asarray(tris, dtype=np.float64).reshape(-1, 3, 3)
+        tri_lo = tris.min(axis=1)
+        tri_hi = tris.max(axis=1)
+        centers = (tri_lo + tri_hi) / 2
+        order = np.arange(len(tris))
+        nodes = []
+
+        def build_node(begin, end):
+            index = len(nodes)
+            ids = order[begin:end]
+            nodes.append([tri_lo[ids].min(axis=0), tri_hi[ids].max(axis=0), -1, -1, begin, end - begin])
+            if end - begin <= leaf_size:
+                return index
+            extent = centers[ids].max(axis=0) - centers[ids].min(axis=0)
+            axis = int(np.argmax(extent))
+            middle = (end - begin) // 2
+            order[begin:end] = ids[np.argpartition(centers[ids, axis], middle)]
+            nodes[index][2] = build_node(begin, begin + middle)
+            nodes[index][3] = build_node(begin + middle, end)
+            nodes[index][5] = 0   # nœud interne : pas de triangles propres
+            return index
+
+        if len(tris):
+            build_node(0, len(tris))
+        columns = list(zip(*nodes)) if nodes else [[]] * 6
+        return cls(
+            tris[order].astype(np.float32),
+            np.array(columns[0], dtype=np.float32).reshape(-1, 3),
+            np.array(columns[1], dtype=np.float32).reshape(-1, 3),
+            np.array(columns[2], dtype=np.int32),
+            np.array(columns[3], dtype=np.int32),
+            np.array(columns[4], dtype=np.int32),
+            np.array(columns[5], dtype=np.int32),
+        )
+
+    def save(self, path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = path + '.tmp'
+        lo, hi, left, right, start, count = self.arrays
+        with open(tmp, 'wb') as f:
+            np.savez(f, tris=self.tris, lo=lo, hi=hi, left=left, right=right, start=start, count=count)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            return cls(data['tris'], data['lo'], data['hi'], data['left'], data['right'], data['start'], data['count'])
+
+    def candidates(self, lo, hi):
+        """
+        Triangles des feuilles dont la boîte chevauche (lo, hi).
+        """
+        ranges = []
+        stack = [0] if self.nodes else []
+        nodes = self.nodes
+        while stack:
+            node_lo, node_hi, left, right, start, count = nodes[stack.pop()]
+            if (node_lo[0] > hi[0] or node_hi[0] < lo[0] or node_lo[1] > hi[1] or node_hi[1] < lo[1]
+                    or node_lo[2] > hi[2] or node_hi[2] < lo[2]):
+                continue
+            if left < 0:
+                ranges.append(self.tris[start:start + count])
+            else:
+                stack.append(left)
+                stack.append(right)
+        if not ranges:
+            return self.tris[:0]
+        return np.concatenate(ranges)
+
+    def obb_hits(self, center, half_axes):
+        reach = np.abs(half_axes).sum(axis=0)
+        tris = self.candidates((center - reach).tolist(), (center + reach).tolist())
+        return bool(len(tris)) and bool(obb_hits_triangles(center, half_axes, tris).any())
+
+    def segment_hit(self, origin, delta):
+        end = origin + delta
+        tris = self.candidates(np.minimum(origin, end).tolist(), np.maximum(origin, end).tolist())
+        if not len(tris):
+            return None
+        return segment_hits_triangles(origin, delta, tris)
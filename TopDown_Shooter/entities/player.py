@@ -1,44 +1,47 @@
-from ursina import Entity, Vec3, held_keys, time
-from .projectile import Projectile
-import pygame
+from ursina import Entity, held_keys
+from simulation.match import PlayerInput
+from simulation.collision import DEBUG_PANDA_COLLIDERS
+from utils.profiler import profiled
 
 
 class Player(Entity):
     """
-    A Player extends Ursina’s Entity. It handles rotation‐based movement:
+    A Player extends Ursina’s Entity, as a view of a simulation PlayerState:
+      - read_input() samples the joystick (or keyboard) into a PlayerInput
+      - sync() copies the simulated position/rotation onto the entity
+    Rotation‐based movement itself lives in simulation/match.py:
       - Left/Right arrows rotate the character (swapped direction)
       - Up/Down move forward/backward in facing direction
     """
 
-    def __init__(self, name, position, keys, color, hp_penalty, spawn_callback=None, controller=None):
-        super().__init__(model='cube', color=color, scale=1, position=position, collider='box')
+    def __init__(self, name, position, keys, color, hp_penalty, state, controller=None):
+        super().__init__(model='cube', color=color, scale=1, position=position,
+                         collider='box' if DEBUG_PANDA_COLLIDERS else None)
         self.name = name
         self.keys = keys
         self.hp_penalty = hp_penalty
-        self.spawn_callback = spawn_callback
-        # Store the pygame joystick.Joystick (or None)
+        # simulation.match.PlayerState driving this entity
+        self.state = state
+        # utils.input_service.Pad for this player's joystick (or None)
         self.controller = controller
 
-        # Stats (overridden by GameManager.start_game)
-        self.turn_speed = 120
-        self.move_speed = 5
-        self.health_max = 100
-        self.health = 100
-        self.shoot_cooldown = 0.3
-        self._last_shot = time.time()
-        self.shot_power = 10
-        self.projectile_speed = 10
+    @property
+    def health(self):
+        return self.state.health
+
+    @property
+    def health_max(self):
+        return self.state.health_max
 
     def update(self):
-        # no-op so Ursina doesn’t auto-call game_update
+        # no-op so Ursina doesn’t drive the player itself
         pass
 
-    def game_update(self, game_state):
-        if game_state != 'playing':
-            return
-
-        dt = time.dt
-
+    @profiled('player.input')
+    def read_input(self):
+        """
+        Sample this player's controls for the next simulation tick(s).
+        """
         # ─── JOYSTICK INPUT IF AVAILABLE ─────────────────────────────
         if self.controller:
             # Read axes: 0 = horizontal (±1), 1 = vertical (±1)
@@ -46,72 +49,43 @@ class Player(Entity):
             ay = self.controller.get_axis(1)
             deadzone = 0.2
 
-            # Rotation from horizontal axis
-            if abs(ax) > deadzone:
-                # invert sign if you want left-stick-left to rotate left
-                self.rotation_y += ax * self.turn_speed * dt
+            # Rotation from horizontal axis, movement from vertical axis
+            turn = ax if abs(ax) > deadzone else 0.0
+            move = -ay if abs(ay) > deadzone else 0.0
 
-            # Movement from vertical axis
-            if abs(ay) > deadzone:
-                self.position += self.forward * (-ay) * self.move_speed * dt
-
-            # Shooting from button 0
-            if self.controller.get_button(0):
-                now = time.time()
-                if now - self._last_shot >= self.shoot_cooldown:
-                    self._shoot()
-                    self._last_shot = now
-
-            # Keep within bounds & handle collisions just as before
-            # ... (you can reuse your clamp-and-intersect logic) ...
-            return  # skip keyboard if joystick plugged in
+            # Shooting from button 0, including taps released again within the frame
+            tapped = self.controller.take_press(0)
+            return PlayerInput(turn, move, tapped or bool(self.controller.get_button(0)))
 
         # ─── FALLBACK TO KEYBOARD ────────────────────────────────────
-        # 1) Rotation (directions swapped)
+        # Rotation (directions swapped)
+        turn = 0.0
         if held_keys[self.keys['left']]:
-            self.rotation_y -= self.turn_speed * dt
+            turn -= 1
         if held_keys[self.keys['right']]:
-            self.rotation_y += self.turn_speed * dt
+            turn += 1
 
-        # 2) Movement forward/back
-        move_dir = Vec3(0, 0, 0)
+        # Movement forward/back
+        move = 0.0
         if held_keys[self.keys['up']]:
-            move_dir += self.forward
+            move += 1
         if held_keys[self.keys['down']]:
-            move_dir -= self.forward
-
-        if move_dir != Vec3(0, 0, 0):
-            movement = move_dir.normalized() * self.move_speed * dt
-            old_pos = self.position
-            new_pos = old_pos + movement
-
-            # clamp within bounds
-            if abs(new_pos.x) > 19.5 or abs(new_pos.z) > 10.5:
-                new_pos = old_pos
-
-            # attempt move
-            self.position = new_pos
-
-            # collision check: walls or covers
-            hit = self.intersects()
-            if hit.hit and hasattr(hit.entity, 'tag') and hit.entity.tag in ('wall', 'cover'):
-                self.position = old_pos
-
-        # 3) Shooting
-        if held_keys[self.keys['shoot']]:
-            now = time.time()
-            if (now - self._last_shot) >= self.shoot_cooldown:
-                self._shoot()
-                self._last_shot = now
-
-    def _shoot(self):
-        spawn_pos = self.position + self.forward * 1.1
-        proj = Projectile(
-            position=Vec3(spawn_pos.x, 0.5, spawn_pos.z),
-            direction=self.forward,
-            owner=self,
-            speed=self.projectile_speed,
-            damage=self.shot_power
-        )
-        if self.spawn_callback:
-            self.spawn_callback(proj)
+            move -= 1
+
+        return PlayerInput(turn, move, bool(held_keys[self.keys['shoot']]))
+
+    @profiled('player.sync')
+    def sync(self, prev=None, alpha=1.0):
+        """
+        Copy the simulated transform onto the entity.
+        prev: (x, z, rotation_y) one tick earlier; the entity is placed alpha of the
+        way from prev to the current state so motion stays smooth between ticks.
+        """
+        s = self.state
+        if prev is None:
+            self.x, self.z, self.rotation_y = s.x, s.z, s.rotation_y
+            return
+        px, pz, pr = prev
+        self.x = px + (s.x - px) * alpha
+        self.z = pz + (s.z - pz) * alpha
+        self.rotation_y = pr + (s.rotation_y - pr) * alpha
@@ -1,22 +1,23 @@
-from ursina import Entity, color, time, destroy
+from ursina import Entity, color
+from simulation.collision import DEBUG_PANDA_COLLIDERS
 
 class Projectile(Entity):
     """
-    A small sphere that travels in ‘direction’ and damages the other player.
+    A small red sphere showing one simulated shot.
+    Movement, bounds and hits are resolved in simulation/match.py;
+    this entity only mirrors the simulated position.
+    Instances are recycled by ProjectilePool: created disabled, then
+    attach()/detach() hand them from one shot to the next.
     """
 
-    def __init__(self, position, direction, owner, speed=10, damage=10):
+    def __init__(self):
         super().__init__(
             model='sphere',
             color=color.red,
             scale=0.3,
-            position=position,
-            collider='sphere'
+            collider='sphere' if DEBUG_PANDA_COLLIDERS else None,
+            enabled=False
         )
-        self.owner = owner
-        self.direction = direction.normalized()
-        self.speed = speed
-        self.damage = damage
         self.tag = 'projectile'
 
     def update(self):
@@ -25,56 +26,13 @@ class Projectile(Entity):
         """
         pass
 
-    def game_update(self, game_state, end_game_callback):
-        """
-        Move each frame; check for collisions. If it hits a player (not the owner), deal damage.
-        If that lowers the player’s HP ≤ 0, call end_game_callback(owner).
-        We set self.enabled = False before destroy(self) so that GameManager removes this projectile next frame.
-        """
-        if game_state != 'playing':
-            return
-
-        # If somehow already disabled, bail
-        if not self.enabled:
-            return
-
-        # 1) Move forward (wrap in try/except to avoid leftover‐node assertions)
-        try:
-            self.position += self.direction * self.speed * time.dt
-        except AssertionError:
-            # Node is already empty/destroyed; bail
-            return
-
-        # 2) Out‐of‐bounds? disable + destroy, then return
-        try:
-            # Out of bounds: Z beyond ±11.5 (north/south) or X beyond ±20 (east/west)
-            if abs(self.position.z) > 11.5 or abs(self.position.x) > 20:
-                self.enabled = False
-                destroy(self)
-                return
-        except AssertionError:
-            return
+    def attach(self, x, z):
+        self.position = (x, 0.5, z)
+        self.enabled = True
 
-        # 3) Check for collisions (wrap in try/except)
-        try:
-            hit = self.intersects()
-        except AssertionError:
-            return
+    def detach(self):
+        self.enabled = False
 
-        if hit.hit:
-            ent = hit.entity
-            from .player import Player
-            # hit other player?
-            if isinstance(ent, Player) and ent is not self.owner:
-                ent.health -= self.damage
-                if ent.health <= 0:
-                    end_game_callback(self.owner)
-                # disable then destroy so GameManager removes us
-                self.enabled = False
-                destroy(self)
-                return
-            # hit wall or cover?
-            if hasattr(ent, 'tag') and ent.tag in ('wall', 'cover'):
-                self.enabled = False
-                destroy(self)
-                return
+    def sync(self, x, z):
+        self.x = x
+        self.z = z
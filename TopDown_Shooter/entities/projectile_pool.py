@@ -0,0 +1,61 @@
+from .projectile import Projectile
+
+# Enough for both players firing at the lowest shot_delay across the whole arena
+DEFAULT_CAPACITY = 64
+
+
+class ProjectilePool:
+    """
+    Preallocated, disabled Projectile entities handed out per shot and recycled
+    afterwards, so firing never creates or destroys scene-graph nodes.
+
+    grow_step: how many entities to add when the pool runs dry
+               (0 = fixed size: the shot is still simulated but not drawn).
+    """
+
+    def __init__(self, capacity=DEFAULT_CAPACITY, grow_step=16):
+        self.grow_step = grow_step
+        self.free = []
+        self.capacity = 0
+        self.in_use = 0
+        # Stats
+        self.high_water = 0
+        self.grows = 0
+        self.dropped = 0
+        self._allocate(capacity)
+
+    def _allocate(self, count):
+        for _ in range(count):
+            self.free.append(Projectile())
+        self.capacity += count
+
+    def acquire(self, x, z):
+        """
+        Return a Projectile placed at (x, z), or None if the pool is full and fixed-size.
+        """
+        if not self.free:
+            if self.grow_step <= 0:
+                self.dropped += 1
+                return None
+            self._allocate(self.grow_step)
+            self.grows += 1
+
+        proj = self.free.pop()
+        proj.attach(x, z)
+        self.in_use += 1
+        self.high_water = max(self.high_water, self.in_use)
+        return proj
+
+    def release(self, proj):
+        proj.detach()
+        self.free.append(proj)
+        self.in_use -= 1
+
+    def stats(self):
+        return {
+            'capacity': self.capacity,
+            'in_use': self.in_use,
+            'high_water': self.high_water,
+            'grows': self.grows,
+            'dropped': self.dropped,
+        }
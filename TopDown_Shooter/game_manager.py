@@ -1,7 +1,9 @@
 import time
+import random
 import pygame
 from ursina import camera, application, time, destroy
 from entities.player import Player
+from entities.projectile_pool import ProjectilePool
 from map.world import World
 from ui.hud import HUD
 from ui.menu import MainMenu
@@ -10,8 +12,22 @@ from ui.name_entry import NameEntryScreen
 from ui.leaderboard import LeaderboardScreen
 from ui.instructions import InstructionsScreen
 from ui.settings import SettingsScreen
-from utils.file_manager import load_leaderboard, add_score_to_leaderboard
-from utils.settings_manager import load_settings, DEFAULTS, STAT_LIMITS
+from ui.profiler_overlay import ProfilerOverlay
+from utils.match_history import MatchHistory
+from utils.settings_manager import load_settings, DEFAULTS
+from utils.profiler import profiler, profiled
+from utils.persistence import write_behind
+from simulation.arena import P1_SPAWN, P2_SPAWN, P1_SPAWN_ROTATION, P2_SPAWN_ROTATION, spawn_exclusions
+from simulation.match import MatchSimulation, PLAYER_RADIUS, PROJECTILE_RADIUS
+from simulation.collision import DEBUG_PANDA_COLLIDERS, circle_vs_aabbs, circle_vs_circle
+from simulation.scoring import match_score
+from simulation.replay import ReplayRecorder, quantize_input, replay_path, prune_replays
+
+# Simulation rate (ticks per second), independent of the render frame rate
+SIM_TICK_RATE = 120
+# Most ticks a single frame may run to catch up; beyond that the backlog is dropped
+# (the game slows down for a moment instead of spiralling after a long hitch)
+MAX_TICKS_PER_FRAME = 8
 
 
 class GameManager:
@@ -22,118 +38,192 @@ class GameManager:
     def __init__(self, app, controllers):
         # Keep reference to the Ursina app
         self.app = app
-        # keep the two pygame joystick.Joystick instances
+        # keep the two joystick views (utils.input_service.Pad)
         self.controllers = controllers
 
         # ------------ STATE VARIABLES ------------
         self.game_state = 'menu'      # 'menu' | 'playing' | 'gameover' | 'name_entry' | 'leaderboard' | 'instructions'
-        self.match_start_time = 0
-        self.match_end_time = 0
         self.last_score = 0
+        self.last_match_id = None
         self.score_saved = False
 
         # Delay before accepting Space on Game Over to avoid accidental restarts
         self.gameover_shown_time = 0
         self.gameover_space_delay = 0.5   # seconds
 
-        # ------------ LOAD / WORLD / PLAYERS ------------
-        # Load leaderboard
-        self.leaderboard_data = load_leaderboard()
-
-        # Define player spawn positions (x, y, z)
-        p1_spawn = (-5, 0.5, -5)
-        p2_spawn = (5, 0.5, 5)
+        # Milliseconds spent building each component, reported once the menu is up
+        self.startup_times = {}
+        step = time.perf_counter()
 
-        # Create world with covers excluding those spawns
+        # ------------ LOAD / WORLD / PLAYERS ------------
+        # Match history (SQLite) backing the leaderboards
+        self.history = MatchHistory()
+        self.top_scores = profiled('leaderboard_io')(self.history.top_scores)
+        self.leaderboard_data = self.top_scores('all')
+        step = self._record_startup('history', step)
+
+        # Headless match simulation: owns player / projectile / cover state
+        self.sim = MatchSimulation(tick_rate=SIM_TICK_RATE)
+        self.sim_accumulator = 0.0
+        # Transforms one tick before the current one, for render interpolation
+        self.prev_players = []
+        self.prev_projectiles = {}
+        # Inputs of the match in progress (simulation/replay.py), saved with its history row
+        self.recorder = None
+        step = self._record_startup('simulation', step)
+
+        # Create world with covers excluding the player spawns
         # Note: World expects exclude_positions as list of (x, z)
-        self.world = World(exclude_positions=[
-            (p1_spawn[0], p1_spawn[2]),
-            (p2_spawn[0], p2_spawn[2])
-        ])
+        self.world = World(exclude_positions=spawn_exclusions())
+        step = self._record_startup('world', step)
 
-        # Track active projectiles
-        self.projectiles = []
+        # Projectile entities currently shown, keyed by simulation projectile id.
+        # Entities come from a preallocated pool and are recycled, never destroyed.
+        self.projectile_pool = ProjectilePool()
+        self.projectiles = {}
 
         from ursina import color
         self.p1 = Player(
             name='Player 1',
-            position=(-5, 0.5, -5),
+            position=P1_SPAWN,
             keys={'up': 'w', 'down': 's', 'left': 'a', 'right': 'd', 'shoot': 'space'},
             color=color.azure,
             hp_penalty=2,
-            spawn_callback=self.register_projectile,
+            state=self.sim.players[0],
             controller = controllers[0] if len(controllers) > 0 else None
         )
         self.p2 = Player(
             name='Player 2',
-            position=(5, 0.5, 5),
+            position=P2_SPAWN,
             keys={'up': 'up arrow', 'down': 'down arrow', 'left': 'left arrow', 'right': 'right arrow', 'shoot': 'right shift'},
             color=color.orange,
             hp_penalty=2,
-            spawn_callback=self.register_projectile,
+            state=self.sim.players[1],
             controller = controllers[1] if len(controllers) > 1 else None
         )
+        self.players = [self.p1, self.p2]
+        step = self._record_startup('players', step)
 
         # Create HUD
         self.hud = HUD()
 
         # ------------ UI SCREENS ------------
-        self.main_menu = MainMenu(
-            ui_parent=camera.ui,
-            on_play=self.start_game,
-            on_settings=self.show_settings,
-            on_instructions=self.show_instructions,
-            on_leaderboard=self.show_leaderboard_from_menu,
-            on_quit=application.quit    # call quit directly
-        )
-        self.gameover_screen = GameOverScreen(
-            ui_parent=camera.ui,
-            on_restart=self.start_game,
-            on_main_menu=self.show_main_menu,
-            on_save=self.show_name_entry,
-            on_view_leaderboard=self.show_leaderboard
-        )
-        self.settings_screen = SettingsScreen(
-            ui_parent = camera.ui,
-            on_done = self.back_from_settings
-        )
-        self.name_entry = NameEntryScreen(
-            ui_parent=camera.ui,
-            on_finish=self.finish_name_entry
-        )
-        self.leaderboard_screen = LeaderboardScreen(
-            ui_parent=camera.ui,
-            on_back=self.back_to_gameover
-        )
-        self.instructions_screen = InstructionsScreen(
-            ui_parent=camera.ui,
-            on_back=self.back_from_instructions
-        )
+        # Built on first use (see _screen) or prewarmed one per idle menu frame
+        self._screen_factories = {
+            'main_menu': lambda: MainMenu(
+                ui_parent=camera.ui,
+                on_play=self.start_game,
+                on_settings=self.show_settings,
+                on_instructions=self.show_instructions,
+                on_leaderboard=self.show_leaderboard_from_menu,
+                on_quit=application.quit    # call quit directly
+            ),
+            'gameover_screen': lambda: GameOverScreen(
+                ui_parent=camera.ui,
+                on_restart=self.start_game,
+                on_main_menu=self.show_main_menu,
+                on_save=self.show_name_entry,
+                on_view_leaderboard=self.show_leaderboard
+            ),
+            'settings_screen': lambda: SettingsScreen(
+                ui_parent = camera.ui,
+                on_done = self.back_from_settings
+            ),
+            'name_entry': lambda: NameEntryScreen(
+                ui_parent=camera.ui,
+                on_finish=self.finish_name_entry
+            ),
+            'leaderboard_screen': lambda: LeaderboardScreen(
+                ui_parent=camera.ui,
+                on_back=self.back_to_gameover,
+                load_entries=self.top_scores
+            ),
+            'instructions_screen': lambda: InstructionsScreen(
+                ui_parent=camera.ui,
+                on_back=self.back_from_instructions
+            ),
+        }
+        self._screens = {}
+        # Screens still to build in idle menu frames, most likely first
+        self._prewarm_queue = ['gameover_screen', 'leaderboard_screen', 'settings_screen',
+                               'instructions_screen', 'name_entry']
 
         # Attach HUD texts to camera.ui
         self.hud.attach_to_ui(camera.ui)
 
+        # Frame-time overlay (F3), see utils/profiler.py
+        self.profiler_overlay = ProfilerOverlay(camera.ui, profiler)
+        step = self._record_startup('hud', step)
+
         # Collect all world entities + players
         self.game_entities = self.world.entities + [self.p1, self.p2]
 
         # ------------ BUTTON SCALES FOR OUTLINE ------------
-        # Store each button's original scale so we can enlarge/shrink on focus
+        # Each button's original scale so we can enlarge/shrink on focus (filled in by _screen)
         self.original_scales = {}
-        for btn in (
-            self.main_menu.buttons +
-            self.gameover_screen.buttons +
-            self.leaderboard_screen.buttons +
-            self.instructions_screen.buttons
-        ):
-            self.original_scales[btn] = btn.scale
 
         # ------------ KEYBOARD NAVIGATION ------------
+        self.focus_screen = None     # screen whose buttons are focusable
         self.focused_buttons = []
         self.focus_index = 0
 
-        # Initially hide everything except main menu
+        # Initially hide everything except main menu (built here, timed by _screen)
         self._hide_all_entities_and_ui()
         self.show_main_menu()
+        # Reported in one line once the last screen is prewarmed (see _screen)
+        self._ready_ms = sum(self.startup_times.values())
+
+    # ─── STARTUP ────────────────────────────────────────────────────────────────
+
+    def _record_startup(self, name, since):
+        now = time.perf_counter()
+        self.startup_times[name] = (now - since) * 1000
+        return now
+
+    def _print_startup_report(self):
+        prewarm = sum(self.startup_times.values()) - self._ready_ms
+        parts = ', '.join(f'{name} {ms:.1f}' for name, ms in self.startup_times.items())
+        mode = 'batched' if self.world.batched else 'per-entity'
+        print(f'[startup] GameManager ready in {self._ready_ms:.1f} ms, '
+              f'screens prewarmed in {prewarm:.1f} ms ({parts}); '
+              f'world {self.world.draw_calls()} draw calls ({mode})')
+
+    # ─── LAZY SCREENS ───────────────────────────────────────────────────────────
+
+    def _screen(self, name):
+        """
+        The UI screen called name, built the first time it is needed.
+        """
+        screen = self._screens.get(name)
+        if screen is None:
+            start = time.perf_counter()
+            screen = self._screens[name] = self._screen_factories[name]()
+            for btn in getattr(screen, 'buttons', []):
+                self.original_scales[btn] = btn.scale
+            self.startup_times[name] = (time.perf_counter() - start) * 1000
+            if name in self._prewarm_queue:
+                self._prewarm_queue.remove(name)
+                if not self._prewarm_queue:
+                    self._print_startup_report()
+        return screen
+
+    def _hide_screen(self, name):
+        if name in self._screens:
+            self._screens[name].hide()
+
+    def _prewarm_next_screen(self):
+        """
+        Build one not-yet-used screen (called from idle menu frames).
+        """
+        if self._prewarm_queue:
+            self._screen(self._prewarm_queue[0])
+
+    main_menu = property(lambda self: self._screen('main_menu'))
+    gameover_screen = property(lambda self: self._screen('gameover_screen'))
+    settings_screen = property(lambda self: self._screen('settings_screen'))
+    name_entry = property(lambda self: self._screen('name_entry'))
+    leaderboard_screen = property(lambda self: self._screen('leaderboard_screen'))
+    instructions_screen = property(lambda self: self._screen('instructions_screen'))
 
     # ─── INTERNAL HELPERS ───────────────────────────────────────────────────────
 
@@ -144,63 +234,148 @@ class GameManager:
         # Hide HUD
         self.hud.disable()
         # Hide every UI screen
-        self.main_menu.hide()
-        self.gameover_screen.hide()
-        self.name_entry.hide()
-        self.leaderboard_screen.hide()
-        self.instructions_screen.hide()
-        self.settings_screen.hide()
+        self._hide_screen('main_menu')
+        self._hide_screen('gameover_screen')
+        self._hide_screen('name_entry')
+        self._hide_screen('leaderboard_screen')
+        self._hide_screen('instructions_screen')
+        self._hide_screen('settings_screen')
         # Clear any button focus
         self._clear_focus()
 
-    def register_projectile(self, proj):
-        """
-        Called by Player._shoot() whenever a new Projectile is created.
-        We append it to our list so we can update it each frame.
-        """
-        self.projectiles.append(proj)
+    def _snapshot_previous(self):
+        """
+        Remember the current simulated transforms before the next tick runs.
+        """
+        self.prev_players = [(p.x, p.z, p.rotation_y) for p in self.sim.players]
+        self.prev_projectiles = {
+            proj_id: (x, z) for proj_id, _, x, z in self.sim.live_projectiles()
+        }
+
+    def _advance_simulation(self, inputs):
+        """
+        Run as many fixed ticks as the accumulated frame time covers (at most
+        MAX_TICKS_PER_FRAME). Returns the render interpolation factor in [0, 1):
+        how far the display sits between the previous tick and the current one.
+        """
+        dt = self.sim.dt
+        self.sim_accumulator += time.dt
+        steps = int(self.sim_accumulator / dt)
+        if steps > MAX_TICKS_PER_FRAME:
+            steps = MAX_TICKS_PER_FRAME
+            self.sim_accumulator = steps * dt
+
+        for i in range(steps):
+            if self.sim.over:
+                break
+            if i == steps - 1:
+                self._snapshot_previous()
+            self.recorder.record(inputs)
+            self.sim.step(inputs)
+            self.sim_accumulator -= dt
+
+        return min(1.0, max(0.0, self.sim_accumulator / dt))
+
+    def _sync_projectiles(self, alpha=1.0):
+        """
+        Mirror the simulation's live projectiles: take a pooled entity for each new shot,
+        move the existing ones, give back those the simulation has removed.
+        Positions are blended between the last two ticks by alpha.
+        """
+        live_ids = set()
+        for proj_id, _, x, z in self.sim.live_projectiles():
+            live_ids.add(proj_id)
+            prev = self.prev_projectiles.get(proj_id)
+            if prev is not None:
+                x = prev[0] + (x - prev[0]) * alpha
+                z = prev[1] + (z - prev[1]) * alpha
+            if proj_id not in self.projectiles:
+                # None if the pool is fixed-size and exhausted: simulated but not drawn
+                self.projectiles[proj_id] = self.projectile_pool.acquire(x, z)
+            else:
+                proj = self.projectiles[proj_id]
+                if proj is not None:
+                    proj.sync(x, z)
+
+        for proj_id in [i for i in self.projectiles if i not in live_ids]:
+            proj = self.projectiles.pop(proj_id)
+            if proj is not None:
+                self.projectile_pool.release(proj)
+
+    def _debug_check_collisions(self):
+        """
+        Debug only (DEBUG_PANDA_COLLIDERS): compare Panda3D's Entity.intersects()
+        with the simulation's analytic tests and report any disagreement.
+        """
+        for player in self.players:
+            hit = player.intersects()
+            panda = hit.hit and getattr(hit.entity, 'tag', '') in ('wall', 'cover')
+            analytic = circle_vs_aabbs(player.state.x, player.state.z, PLAYER_RADIUS, self.sim.static_boxes) is not None
+            if panda != analytic:
+                print(f'[collision] {player.name}: panda={panda} analytic={analytic} at {player.position}')
+
+        for proj_id, owner, x, z in self.sim.live_projectiles():
+            proj = self.projectiles.get(proj_id)
+            if proj is None:
+                continue
+            hit = proj.intersects()
+            panda = hit.hit and (isinstance(hit.entity, Player) or getattr(hit.entity, 'tag', '') in ('wall', 'cover'))
+            analytic = circle_vs_aabbs(x, z, PROJECTILE_RADIUS, self.sim.static_boxes) is not None or any(
+                circle_vs_circle(x, z, PROJECTILE_RADIUS, p.x, p.z, PLAYER_RADIUS)
+                for i, p in enumerate(self.sim.players) if i != owner
+            )
+            if panda != analytic:
+                print(f'[collision] projectile {proj_id}: panda={panda} analytic={analytic} at {proj.position}')
+
+    def _clear_projectiles(self):
+        for proj in self.projectiles.values():
+            if proj is not None:
+                self.projectile_pool.release(proj)
+        self.projectiles.clear()
+
+    def _highlight(self, btn):
+        try:
+            btn.on_mouse_enter()
+        except:
+            pass
+        # Enlarge scale for outline effect
+        if btn in self.original_scales:
+            btn.scale = self.original_scales[btn] * 1.1
+
+    def _unhighlight(self, btn):
+        try:
+            btn.on_mouse_exit()
+        except:
+            pass
+        if btn in self.original_scales:
+            btn.scale = self.original_scales[btn]
 
     def _clear_focus(self):
         """
-        Remove hover‐outline from all buttons on all screens (reset scale).
-        """
-        for btn_list in (
-            self.main_menu.buttons,
-            self.gameover_screen.buttons,
-            self.leaderboard_screen.buttons,
-            self.instructions_screen.buttons
-        ):
-            for btn in btn_list:
-                try:
-                    btn.on_mouse_exit()
-                except:
-                    pass
-                # Reset scale
-                if btn in self.original_scales:
-                    btn.scale = self.original_scales[btn]
-
+        Remove the hover‐outline from the focused button (the only one that has it).
+        The screen keeps its focus_index for when it is shown again.
+        """
+        if self.focused_buttons:
+            self._unhighlight(self.focused_buttons[self.focus_index])
+        self.focus_screen = None
         self.focused_buttons = []
         self.focus_index = 0
 
-    def _set_focus(self, buttons_list):
+    def _set_focus(self, screen):
         """
-        Assign a new list of focusable buttons, highlight the first enabled one.
+        Make screen's buttons the focusable ones and highlight the one it last had
+        focused (or its first enabled button, if that one is disabled now).
         """
         self._clear_focus()
-        self.focused_buttons = buttons_list
-        if not buttons_list:
+        self.focus_screen = screen
+        self.focused_buttons = screen.buttons
+        enabled_indices = [i for i, b in enumerate(screen.buttons) if b.enabled]
+        if not enabled_indices:
             return
-        # Find first enabled button
-        for idx, btn in enumerate(buttons_list):
-            if btn.enabled:
-                self.focus_index = idx
-                try:
-                    btn.on_mouse_enter()
-                except:
-                    pass
-                # Enlarge scale for outline effect
-                btn.scale = self.original_scales[btn] * 1.1
-                return
+        if screen.focus_index not in enabled_indices:
+            screen.focus_index = enabled_indices[0]
+        self.focus_index = screen.focus_index
+        self._highlight(screen.buttons[self.focus_index])
 
     def _move_focus(self, direction):
         """
@@ -254,28 +429,14 @@ class GameManager:
                 new_idx = enabled_indices[pos]
 
         if new_idx != old_idx:
-            # Reset old button
-            try:
-                btns[old_idx].on_mouse_exit()
-            except:
-                pass
-            # Restore old scale
-            if btns[old_idx] in self.original_scales:
-                btns[old_idx].scale = self.original_scales[btns[old_idx]]
-
-            # Highlight new button
-            try:
-                btns[new_idx].on_mouse_enter()
-            except:
-                pass
-            # Enlarge new scale
-            if btns[new_idx] in self.original_scales:
-                btns[new_idx].scale = self.original_scales[btns[new_idx]] * 1.1
-
+            self._unhighlight(btns[old_idx])
+            self._highlight(btns[new_idx])
             self.focus_index = new_idx
+            self.focus_screen.focus_index = new_idx
 
     # ─── SCREEN TRANSITIONS ─────────────────────────────────────────────────────
 
+    @profiled('transition.show_main_menu')
     def show_main_menu(self):
         """
         Enter the 'menu' state: hide all others, show only main menu.
@@ -283,73 +444,50 @@ class GameManager:
         self.game_state = 'menu'
         self._hide_all_entities_and_ui()
         self.main_menu.show()
-        self._set_focus(self.main_menu.buttons)
+        self._set_focus(self.main_menu)
 
+    @profiled('transition.start_game')
     def start_game(self):
         """
         Enter the 'playing' state: reset HP & timer, enable world & players & HUD.
-        Also destroy any old covers (tag=='cover') and regenerate them.
+        Also move the (reused) cover entities onto a new layout.
         """
         # 1) Core state reset
         self.game_state = 'playing'
-        self.match_start_time = time.time()
         self.last_score = 0
         self.score_saved = False
 
-        # 2) Clear any lingering projectiles
-        for proj in self.projectiles:
-            proj.enabled = False
-            destroy(proj)
-        self.projectiles.clear()
+        # 2) Clear any lingering projectiles, and forget the menu presses (no shot from "Play")
+        self._clear_projectiles()
+        for controller in self.controllers:
+            controller.sync_presses()
 
         # 3) Load & apply settings to both players
         settings = load_settings()  # {'Player 1': {...}, 'Player 2': {...}}
-
-        # Player 1 settings
-        s1 = settings['Player 1']
-        self.p1.turn_speed = s1['rotation_speed']
-        self.p1.move_speed = s1['movement_speed']
-        self.p1.health_max = s1['health_points']
-        self.p1.health = self.p1.health_max
-        self.p1.shoot_cooldown = s1['shot_delay']
-        self.p1.shot_power = s1['shot_power']
-        self.p1.projectile_speed = s1['projectile_speed']
-
-        # Player 2 settings
-        s2 = settings['Player 2']
-        self.p2.turn_speed = s2['rotation_speed']
-        self.p2.move_speed = s2['movement_speed']
-        self.p2.health_max = s2['health_points']
-        self.p2.health = self.p2.health_max
-        self.p2.shoot_cooldown = s2['shot_delay']
-        self.p2.shot_power = s2['shot_power']
-        self.p2.projectile_speed = s2['projectile_speed']
+        for player in self.players:
+            player.state.apply_stats(settings[player.name])
 
         # 4) Hide all UI screens
-        self.main_menu.hide()
-        self.gameover_screen.hide()
-        self.name_entry.hide()
-        self.leaderboard_screen.hide()
-        self.instructions_screen.hide()
-        self.settings_screen.hide()
-
-        # 5) Reset player positions & rotations
-        p1_spawn = (-5, 0.5, -5)
-        p2_spawn = (5, 0.5, 5)
-        self.p1.position = p1_spawn
-        self.p2.position = p2_spawn
-        self.p1.rotation_y = 0  # face “north”
-        self.p2.rotation_y = 180  # face “south”
-
-        # 6) Regenerate covers
-        survivors = []
-        for e in self.world.entities:
-            if getattr(e, 'tag', '') == 'cover':
-                destroy(e)
-            else:
-                survivors.append(e)
-        self.world.entities = survivors
-        self.world._create_covers()
+        self._hide_screen('main_menu')
+        self._hide_screen('gameover_screen')
+        self._hide_screen('name_entry')
+        self._hide_screen('leaderboard_screen')
+        self._hide_screen('instructions_screen')
+        self._hide_screen('settings_screen')
+
+        # 5) New cover layout (same entities, new positions), from a seed the replay keeps
+        seed = random.getrandbits(32)
+        self.world.place_covers(random.Random(seed))
+
+        # 6) Reset the simulation (spawns, health, covers) and the entities showing it
+        self.sim.reset(self.world.cover_positions)
+        self.recorder = ReplayRecorder(self.sim, seed, self.world.cover_positions)
+        self.sim_accumulator = 0.0
+        self._snapshot_previous()
+        self.p1.position = P1_SPAWN
+        self.p2.position = P2_SPAWN
+        self.p1.rotation_y = P1_SPAWN_ROTATION  # face “north”
+        self.p2.rotation_y = P2_SPAWN_ROTATION  # face “south”
 
         # 7) Enable all map entities and players
         for e in self.world.entities + [self.p1, self.p2]:
@@ -364,12 +502,12 @@ class GameManager:
         # Reset focus if you’re returning to play
         self._clear_focus()
 
+    @profiled('transition.end_game')
     def end_game(self, winner: Player):
         """
         Called when one player's HP ≤ 0. Calculate final score, show game-over UI.
         """
         self.game_state = 'gameover'
-        self.match_end_time = time.time()
         self.score_saved = False
 
         # Disable map + players
@@ -378,61 +516,81 @@ class GameManager:
         # Disable HUD
         self.hud.disable()
 
-        # Base score calculation
-        elapsed = self.match_end_time - self.match_start_time
+        # Base score calculation, on simulated time so replays of a match score the same
+        elapsed = self.sim.tick * self.sim.dt
         hp_lost = winner.health_max - winner.health
-        penalty = winner.hp_penalty
-        base_score = 1000
-        raw = base_score - int(elapsed * 5) - (hp_lost * penalty)
-        raw = max(0, raw)
 
-        # Load the saved stats (or defaults) and grab defaults
+        # Load the saved stats (or defaults) and score against the defaults
         settings = load_settings()  # e.g. {'Player 1':{...}, 'Player 2':{...}}
-        player_stats = settings[winner.name]
-        default_stats = DEFAULTS[winner.name]
-
-        product = 1.0
-        for stat in STAT_LIMITS:
-            cur = player_stats[stat]
-            df = default_stats[stat]
-            if stat == 'shot_delay':
-                # higher delay = disadvantage → multiplier >1; lower = advantage → <1
-                m = cur / df if df != 0 else 1.0
-            else:
-                # higher stat = advantage → multiplier <1; lower = disadvantage → >1
-                m = df / cur if cur != 0 else 1.0
-            product *= m
-
-        # Clamp overall multiplier between 0.1 and 2.0
-        multiplier = max(0.1, min(product, 2.0))
+        self.last_score, multiplier = match_score(
+            elapsed, hp_lost, winner.hp_penalty, settings[winner.name], DEFAULTS[winner.name]
+        )
 
-        # Apply multiplier
-        final_score = int(raw * multiplier)
-        self.last_score = max(0, final_score)
+        # Every match goes into the history (committed on the writer thread);
+        # Save Score later attaches a name to it
+        with profiler.scope('leaderboard_io'):
+            self.last_match_id = self.history.record_match(
+                winner=winner.name,
+                score=self.last_score,
+                duration=elapsed,
+                hp_lost=hp_lost,
+                multiplier=multiplier
+            )
+        self._save_replay(self.last_match_id)
+        self._report_projectile_pool()
 
         # Show Game Over UI
         self.gameover_screen.show(winner.name, self.last_score, self.score_saved)
         self.gameover_shown_time = time.time()
-        self._set_focus(self.gameover_screen.buttons)
+        # A new result starts on Restart; round trips to the leaderboard keep their place
+        self.gameover_screen.focus_index = 0
+        self._set_focus(self.gameover_screen)
 
+    def _report_projectile_pool(self):
+        """
+        Log the projectile pool's sizing stats for the match just played (a high
+        high_water, grows or dropped shots mean DEFAULT_CAPACITY is too small), and
+        hand them to the profiler overlay.
+        """
+        stats = self.projectile_pool.stats()
+        print('[projectiles] pool ' + ', '.join(f'{name} {value}' for name, value in stats.items()))
+        for name, value in stats.items():
+            profiler.set_counter(f'projectiles.pool.{name}', value)
+
+    def _save_replay(self, match_id):
+        """
+        Write the finished match's replay as data/replays/match_<id>.tdr (a few KB),
+        and prune old ones, on the write-behind thread.
+        """
+        replay = self.recorder.finish(self.sim.winner)
+        path = replay_path(match_id)
+
+        def save():
+            replay.save(path)
+            prune_replays()
+        write_behind(save, path)
+
+    @profiled('transition.show_name_entry')
     def show_name_entry(self):
         """
         Switch to the username-entry UI.
         """
         self.game_state = 'name_entry'
-        self.gameover_screen.hide()
+        self._hide_screen('gameover_screen')
         self.name_entry.show()
         self._clear_focus()
 
+    @profiled('transition.finish_name_entry')
     def finish_name_entry(self, username):
         """
         Player finished entering their name. Save if any, then return to Game Over.
         """
         if username:
-            add_score_to_leaderboard(username, self.last_score)
+            with profiler.scope('leaderboard_io'):
+                self.history.set_name(self.last_match_id, username)
             self.score_saved = True
 
-        self.name_entry.hide()
+        self._hide_screen('name_entry')
         self.gameover_screen.show(
             self.gameover_screen.gameover_winner_text.text.split('\n')[0].replace(' Wins!', ''),
             self.last_score,
@@ -440,83 +598,92 @@ class GameManager:
         )
         self.gameover_shown_time = time.time()
         self.game_state = 'gameover'
-        self._set_focus(self.gameover_screen.buttons)
+        self._set_focus(self.gameover_screen)
 
+    @profiled('transition.show_leaderboard')
     def show_leaderboard(self):
         """
         (Called from Game Over) Hide GameOver UI and display leaderboard. Back → Game Over.
         """
         self.game_state = 'leaderboard'
-        self.main_menu.hide()
-        self.gameover_screen.hide()
-        self.name_entry.hide()
-        self.instructions_screen.hide()
+        self._hide_screen('main_menu')
+        self._hide_screen('gameover_screen')
+        self._hide_screen('name_entry')
+        self._hide_screen('instructions_screen')
 
-        self.leaderboard_data = load_leaderboard()
+        self.leaderboard_data = self.top_scores('all')
         self.leaderboard_screen.btn_back.on_click = self.back_to_gameover
         self.leaderboard_screen.show(self.leaderboard_data)
-        self._set_focus(self.leaderboard_screen.buttons)
+        self.leaderboard_screen.focus_index = self.leaderboard_screen.back_index
+        self._set_focus(self.leaderboard_screen)
 
+    @profiled('transition.show_leaderboard_from_menu')
     def show_leaderboard_from_menu(self):
         """
         (Called from Main Menu) Hide MainMenu and show leaderboard. Back → Main Menu.
         """
         self.game_state = 'leaderboard'
-        self.main_menu.hide()
-        self.gameover_screen.hide()
-        self.name_entry.hide()
-        self.instructions_screen.hide()
+        self._hide_screen('main_menu')
+        self._hide_screen('gameover_screen')
+        self._hide_screen('name_entry')
+        self._hide_screen('instructions_screen')
 
-        self.leaderboard_data = load_leaderboard()
+        self.leaderboard_data = self.top_scores('all')
         self.leaderboard_screen.btn_back.on_click = self.back_to_menu_from_leaderboard
         self.leaderboard_screen.show(self.leaderboard_data)
-        self._set_focus(self.leaderboard_screen.buttons)
+        self.leaderboard_screen.focus_index = self.leaderboard_screen.back_index
+        self._set_focus(self.leaderboard_screen)
 
+    @profiled('transition.back_to_gameover')
     def back_to_gameover(self):
         """
         From leaderboard (launched by Game Over), return to Game Over.
         """
         self.game_state = 'gameover'
-        self.leaderboard_screen.hide()
+        self._hide_screen('leaderboard_screen')
         self.gameover_screen.show(
             self.gameover_screen.gameover_winner_text.text.split('\n')[0].replace(' Wins!', ''),
             self.last_score,
             self.score_saved
         )
         self.gameover_shown_time = time.time()
-        self._set_focus(self.gameover_screen.buttons)
+        self._set_focus(self.gameover_screen)
 
+    @profiled('transition.back_to_menu_from_leaderboard')
     def back_to_menu_from_leaderboard(self):
         """
         From leaderboard (launched by Main Menu), return to Main Menu.
         """
         self.game_state = 'menu'
-        self.leaderboard_screen.hide()
+        self._hide_screen('leaderboard_screen')
         self.main_menu.show()
-        self._set_focus(self.main_menu.buttons)
+        self._set_focus(self.main_menu)
 
+    @profiled('transition.show_instructions')
     def show_instructions(self):
         """
         Hide Main Menu (or any) and display the instructions screen.
         """
         self.game_state = 'instructions'
-        self.main_menu.hide()
-        self.gameover_screen.hide()
-        self.name_entry.hide()
-        self.leaderboard_screen.hide()
+        self._hide_screen('main_menu')
+        self._hide_screen('gameover_screen')
+        self._hide_screen('name_entry')
+        self._hide_screen('leaderboard_screen')
 
         self.instructions_screen.show()
-        self._set_focus(self.instructions_screen.buttons)
+        self._set_focus(self.instructions_screen)
 
+    @profiled('transition.back_from_instructions')
     def back_from_instructions(self):
         """
         From instructions, return to Main Menu.
         """
         self.game_state = 'menu'
-        self.instructions_screen.hide()
+        self._hide_screen('instructions_screen')
         self.main_menu.show()
-        self._set_focus(self.main_menu.buttons)
+        self._set_focus(self.main_menu)
 
+    @profiled('transition.show_settings')
     def show_settings(self):
         """
         Hide Main Menu (or any) and display the settings screen.
@@ -525,20 +692,21 @@ class GameManager:
         self._hide_all_entities_and_ui()
         self.settings_screen.show()
 
+    @profiled('transition.back_from_settings')
     def back_from_settings(self):
         """
         From settings, return to Main Menu.
         """
         self.game_state = 'menu'
-        self.settings_screen.hide()
+        self._hide_screen('settings_screen')
         self.main_menu.show()
-        self._set_focus(self.main_menu.buttons)
+        self._set_focus(self.main_menu)
 
     # ─── URSINA UPDATE & INPUT ─────────────────────────────────────────────────
 
     def process_joystick_event(self, event):
         """
-        Handle pygame joystick events for:
+        Handle joystick edges (utils.input_service.JoystickEdge, shaped like pygame events) for:
           - NameEntry screen
           - Settings screen
           - Other UI screens (MainMenu, GameOver, Leaderboard, Instructions)
@@ -635,33 +803,54 @@ class GameManager:
     def update(self):
         """
         Called every frame by Ursina.
-        - If ‘playing’, update players, projectiles, HUD, and check for simultaneous death.
+        - If ‘playing’, advance the simulation in fixed ticks with this frame's inputs,
+          copy its state onto the entities and HUD, and end the match once it has a winner.
         """
-        if self.game_state == 'playing':
-            elapsed = time.time() - self.match_start_time
-            self.hud.update(elapsed, self.p1.health, self.p2.health)
-
-            # Update players
-            self.p1.game_update(self.game_state)
-            self.p2.game_update(self.game_state)
+        # Close the previous frame's timings (no-op unless profiling)
+        profiler.next_frame()
+        self.profiler_overlay.update()
 
-            # Update projectiles
-            for proj in self.projectiles.copy():
-                if proj.enabled:
-                    proj.game_update(self.game_state, self.end_game)
-                else:
-                    self.projectiles.remove(proj)
+        # Menu is up and idle: build one of the screens not used yet
+        if self.game_state == 'menu' and self._prewarm_queue:
+            self._prewarm_next_screen()
 
-            # If both died simultaneously, default winner = p1
-            if self.p1.health <= 0 and self.p2.health <= 0:
-                self.end_game(self.p1)
+        if self.game_state == 'playing':
+            with profiler.scope('hud'):
+                elapsed = self.sim.tick * self.sim.dt
+                self.hud.update(elapsed, self.p1.health, self.p2.health, self.p1.health_max, self.p2.health_max)
+            profiler.set_counter('hud.text_rebuilds_per_s', self.hud.text_rebuilds_per_second)
+
+            # Run the fixed ticks this frame covers
+            # (quantized so the replay reproduces exactly what was simulated)
+            inputs = [quantize_input(player.read_input()) for player in self.players]
+            with profiler.scope('simulation'):
+                alpha = self._advance_simulation(inputs)
+            if DEBUG_PANDA_COLLIDERS:
+                alpha = 1.0   # compare colliders at the exact simulated positions
+
+            # Copy simulated state onto the entities, interpolated between the last two ticks
+            for player, prev in zip(self.players, self.prev_players):
+                player.sync(prev, alpha)
+            with profiler.scope('projectiles.sync'):
+                self._sync_projectiles(alpha)
+            if DEBUG_PANDA_COLLIDERS:
+                with profiler.scope('debug_collisions'):
+                    self._debug_check_collisions()
+
+            if self.sim.over:
+                self.end_game(self.players[self.sim.winner])
 
     def input(self, key):
         """
         Called whenever a key is pressed or released.
+        - F3 toggles the profiler overlay in any state.
         - If we’re in name‐entry, delegate there.
         - Otherwise, handle W/S/A/D/Space for UI navigation if a screen with buttons is active.
         """
+        if key == 'f3':
+            self.profiler_overlay.toggle()
+            return
+
         if self.game_state == 'settings':
             self.settings_screen.input(key)
             return
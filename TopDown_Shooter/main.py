@@ -1,6 +1,8 @@
+import time
 import pygame
 from ursina import Ursina, camera, window, mouse
 from game_manager import GameManager
+from utils.input_service import InputService
 
 if __name__ == '__main__':
     # ─── Initialize pygame & joysticks ─────────────────────────────────────────
@@ -13,8 +15,14 @@ if __name__ == '__main__':
         print(f"Detected joystick {i}: {js.get_name()}")
         controllers.append(js)
 
+    # ─── Joystick edges & state, read once per frame (every queued event kept) ─
+    input_service = InputService(controllers)
+    input_service.pump()   # have a snapshot before the first frame
+
     # ─── Start Ursina fullscreen, hide mouse ────────────────────────────────────
+    boot = time.perf_counter()
     app = Ursina(fullscreen=True, vsync=True)
+    print(f'[startup] Ursina window in {(time.perf_counter() - boot) * 1000:.1f} ms')
     window.fullscreen = True
     mouse.visible = False
 
@@ -22,13 +30,15 @@ if __name__ == '__main__':
     camera.position = (0, 60, 0)
     camera.rotation_x = 90
 
-    # ─── Create GameManager with joystick list ──────────────────────────────────
-    gm = GameManager(app, controllers)
+    # ─── Create GameManager with the joystick pads ─────────────────────────────
+    gm = GameManager(app, input_service.pads)
+    print(f'[startup] boot to menu in {(time.perf_counter() - boot) * 1000:.1f} ms')
 
-    # ─── Main update: pump pygame events for joysticks, then game logic ────────
+    # ─── Main update: joystick edges since last frame, then game logic ─────────
     def update():
-        for event in pygame.event.get():
-            gm.process_joystick_event(event)
+        input_service.pump()
+        for edge in input_service.drain_edges():
+            gm.process_joystick_event(edge)
         gm.update()
 
     def input(key):
@@ -1,20 +1,73 @@
 import random
-import math
-from ursina import Entity, color
+from ursina import Entity, Mesh, color
+from simulation.arena import WALL_SPECS, COVER_Y, COVER_SCALE, COVER_COUNT
+from simulation.layouts import LayoutBank
+from simulation.collision import DEBUG_PANDA_COLLIDERS
+
+# Merge walls and covers into one vertex-colored mesh (one draw call) instead of one
+# Entity each. Set to False to compare draw calls with World.draw_calls().
+# Debug colliders need one Entity per box, so DEBUG_PANDA_COLLIDERS turns it off.
+BATCH_STATIC_GEOMETRY = True
+
+# Unit cube faces: (normal, 4 corners), corners counter-clockwise seen from outside
+_CUBE_FACES = [
+    ((1, 0, 0),  [(1, -1, -1), (1, 1, -1), (1, 1, 1), (1, -1, 1)]),
+    ((-1, 0, 0), [(-1, -1, 1), (-1, 1, 1), (-1, 1, -1), (-1, -1, -1)]),
+    ((0, 1, 0),  [(-1, 1, -1), (-1, 1, 1), (1, 1, 1), (1, 1, -1)]),
+    ((0, -1, 0), [(-1, -1, 1), (-1, -1, -1), (1, -1, -1), (1, -1, 1)]),
+    ((0, 0, 1),  [(1, -1, 1), (1, 1, 1), (-1, 1, 1), (-1, -1, 1)]),
+    ((0, 0, -1), [(-1, -1, -1), (-1, 1, -1), (1, 1, -1), (1, -1, -1)]),
+]
+
+
+def _append_box(geometry, position, scale, col):
+    """
+    Add a box (Entity-style position / scale) to geometry = (vertices, triangles, normals, colors).
+    """
+    vertices, triangles, normals, colors = geometry
+    hx, hy, hz = scale[0] / 2, scale[1] / 2, scale[2] / 2
+    for normal, corners in _CUBE_FACES:
+        base = len(vertices)
+        for cx, cy, cz in corners:
+            vertices.append((position[0] + cx * hx, position[1] + cy * hy, position[2] + cz * hz))
+            normals.append(normal)
+            colors.append(col)
+        triangles.extend((base, base + 1, base + 2, base, base + 2, base + 3))
 
 class World:
     """
     Creates the floor, four border walls, and a set of dynamically placed red cover blocks.
     Covers avoid any positions in exclude_positions (player spawns), are 8+ units apart,
     and there are between 4 and 6 of them each run.
+    Layouts are drawn from a precomputed LayoutBank (simulation/layouts.py), cached on disk.
+    The chosen (x, z) positions are handed to the simulation so it sees the same map;
+    collisions are resolved analytically there, colliders are only built for debugging.
+    The cover entities are created once and reused: place_covers() only moves them
+    onto each new layout and disables the spare ones.
+
+    With batched=True (BATCH_STATIC_GEOMETRY) walls and covers are instead one combined
+    mesh, so the arena draws as floor + blocks. The mesh is created once with room for
+    the largest layout; place_covers() moves the cover vertices in place and collapses
+    the spare covers, so restarting creates no new nodes in either mode.
     """
 
-    def __init__(self, exclude_positions=None):
-        self.entities = []
+    def __init__(self, exclude_positions=None, batched=None):
+        if batched is None:
+            batched = BATCH_STATIC_GEOMETRY
+        self.batched = batched and not DEBUG_PANDA_COLLIDERS
+        self.static_entities = []   # floor + walls (floor + blocks when batched)
+        self.cover_entities = []    # fixed pool, one per possible cover (unbatched only)
+        self.entities = []          # static entities + covers in the current layout
         self.exclude_positions = exclude_positions or []
+        self.cover_positions = []
+        self.layout_bank = LayoutBank.load_or_build(self.exclude_positions)
         self._create_floor()
-        self._create_borders()
-        self._create_covers()
+        if self.batched:
+            self._create_blocks()
+        else:
+            self._create_borders()
+            self._create_covers()
+        self.place_covers()
 
     def _create_floor(self):
         floor = Entity(
@@ -23,66 +76,91 @@ class World:
             texture='white_cube',
             texture_scale=(40, 40),
             color=color.gray,
-            collider='box'
+            collider='box' if DEBUG_PANDA_COLLIDERS else None
         )
-        self.entities.append(floor)
+        self.static_entities.append(floor)
 
     def _create_borders(self):
-        wall_specs = [
-            ((0,1,11.5),(40,2,1)),
-            ((0,1,-11.5),(40,2,1)),
-            ((20.5,1,0),(1,2,40)),
-            ((-20.5,1,0),(1,2,40)),
-        ]
-        for pos, scale in wall_specs:
+        for pos, scale in WALL_SPECS:
             wall = Entity(
                 model='cube',
                 color=color.dark_gray,
                 scale=scale,
                 position=pos,
-                collider='box',
+                collider='box' if DEBUG_PANDA_COLLIDERS else None,
                 tag='wall'
             )
-            self.entities.append(wall)
+            self.static_entities.append(wall)
+
+    def _create_blocks(self):
+        # Wall geometry never changes: build it once, covers are appended per layout
+        self._wall_geometry = ([], [], [], [])
+        for pos, scale in WALL_SPECS:
+            _append_box(self._wall_geometry, pos, scale, color.dark_gray)
+        # Cover slots come after the walls, the same 24 vertices each whatever the layout
+        vertices, triangles, normals, colors = (list(part) for part in self._wall_geometry)
+        geometry = (vertices, triangles, normals, colors)
+        for _ in range(COVER_COUNT[1]):
+            _append_box(geometry, (0, COVER_Y, 0), (0, 0, 0), color.red)
+        self.blocks_mesh = Mesh(vertices=vertices, triangles=triangles, normals=normals, colors=colors, static=False)
+        self.blocks = Entity(model=self.blocks_mesh, tag='static')
+        self.static_entities.append(self.blocks)
 
     def _create_covers(self):
-        # Possible grid points
-        xs = list(range(-15, 16, 5))   # -15, -10, -5, 0, 5, 10, 15
-        zs = list(range(-8, 9, 4))     # -8, -4, 0, 4, 8
-        candidates = [(x, 0.5, z) for x in xs for z in zs]
-
-        # Exclude any too‐close to spawn positions
-        def too_close_to_spawn(pos):
-            x, _, z = pos
-            for sx, sz in self.exclude_positions:
-                if abs(x - sx) < 2 and abs(z - sz) < 2:
-                    return True
-            return False
-
-        safe = [pos for pos in candidates if not too_close_to_spawn(pos)]
-
-        # Decide how many covers: 4 to 6
-        target = random.randint(4, 6)
-        selected = []
-        attempts = 0
-
-        # Greedy random packing with minimum 8‐unit separation
-        while len(selected) < target and attempts < 1000:
-            pos = random.choice(safe)
-            # Check 8‐unit min distance from existing selection
-            if all(math.hypot(pos[0] - s[0], pos[2] - s[2]) >= 8 for s in selected):
-                selected.append(pos)
-                safe.remove(pos)  # don't pick same one again
-            attempts += 1
-
-        # Instantiate covers
-        for pos in selected:
+        # As many cover entities as a layout can use, all parked until placed
+        for _ in range(COVER_COUNT[1]):
             cover = Entity(
                 model='cube',
                 color=color.red,
-                scale=(2, 1, 2),
-                position=pos,
-                collider='box',
-                tag='cover'
+                scale=COVER_SCALE,
+                collider='box' if DEBUG_PANDA_COLLIDERS else None,
+                tag='cover',
+                enabled=False
             )
-            self.entities.append(cover)
+            self.cover_entities.append(cover)
+
+    def place_covers(self, rng=random):
+        """
+        Pick a new layout and move the pooled cover entities onto it; spare ones are disabled.
+        The (x, z) positions are shared with the simulation through cover_positions.
+        """
+        self.cover_positions = self.layout_bank.pick(rng)
+
+        if self.batched:
+            self._rebuild_blocks()
+            self.entities = list(self.static_entities)
+            return
+
+        active = []
+        for i, cover in enumerate(self.cover_entities):
+            if i < len(self.cover_positions):
+                x, z = self.cover_positions[i]
+                cover.position = (x, COVER_Y, z)
+                active.append(cover)
+            else:
+                cover.enabled = False
+        self.entities = self.static_entities + active
+
+    def _rebuild_blocks(self):
+        # Only the cover vertices move; spare slots collapse to a point (nothing drawn)
+        covers = ([], [], [], [])
+        for i in range(COVER_COUNT[1]):
+            if i < len(self.cover_positions):
+                x, z = self.cover_positions[i]
+                _append_box(covers, (x, COVER_Y, z), COVER_SCALE, color.red)
+            else:
+                _append_box(covers, (0, COVER_Y, 0), (0, 0, 0), color.red)
+        self.blocks_mesh.vertices = self._wall_geometry[0] + covers[0]
+        self.blocks_mesh.generate()
+
+    def draw_calls(self):
+        """
+        Number of Geoms (one draw call each) the world renders during a match with the
+        current layout, to compare batched and per-entity builds. ';+s' also counts
+        entities that are disabled (stashed) while the menus are up.
+        """
+        return sum(
+            path.node().get_num_geoms()
+            for entity in self.entities
+            for path in entity.find_all_matches('**/+GeomNode;+s')
+        )
@@ -0,0 +1,38 @@
+# Plain-data description of the arena, shared by the headless simulation
+# and by map/world.py (which only turns it into Ursina entities).
+
+# Player spawns (x, y, z) and the rotation_y they face at match start
+P1_SPAWN = (-5, 0.5, -5)
+P2_SPAWN = (5, 0.5, 5)
+P1_SPAWN_ROTATION = 0      # face “north”
+P2_SPAWN_ROTATION = 180    # face “south”
+
+# Players are clamped inside |x| <= 19.5, |z| <= 10.5
+PLAYER_BOUNDS = (19.5, 10.5)
+# Projectiles beyond |x| > 20 or |z| > 11.5 are out of bounds
+PROJECTILE_BOUNDS = (20, 11.5)
+
+# Border walls: (position, scale)
+WALL_SPECS = [
+    ((0, 1, 11.5), (40, 2, 1)),
+    ((0, 1, -11.5), (40, 2, 1)),
+    ((20.5, 1, 0), (1, 2, 40)),
+    ((-20.5, 1, 0), (1, 2, 40)),
+]
+
+# Cover blocks
+COVER_Y = 0.5
+COVER_SCALE = (2, 1, 2)
+COVER_XS = list(range(-15, 16, 5))   # -15, -10, -5, 0, 5, 10, 15
+COVER_ZS = list(range(-8, 9, 4))     # -8, -4, 0, 4, 8
+COVER_COUNT = (4, 6)                 # min / max covers per match
+COVER_MIN_SPACING = 8
+SPAWN_CLEARANCE = 2
+
+
+def spawn_exclusions():
+    """
+    The (x, z) positions covers must stay away from (both player spawns).
+    """
+    return [(P1_SPAWN[0], P1_SPAWN[2]), (P2_SPAWN[0], P2_SPAWN[2])]
+
@@ -0,0 +1,101 @@
+import math
+import random
+
+from simulation.match import PlayerInput, PROJECTILE_RADIUS
+from simulation.collision import sweep_circle_vs_aabbs
+
+# Simple aim-and-shoot opponent for headless matches (balance sweeps, benchmarks).
+# A Bot is a policy for MatchSimulation.play(): bot(sim, index) -> PlayerInput.
+
+# Degrees of aim error at which the bot turns at full speed
+FULL_TURN_ANGLE = 15
+# Fires when the aim is within this many degrees
+SHOOT_ANGLE = 8
+# Keeps between these distances from the opponent
+PREFERRED_RANGE = (3, 7)
+# Degrees off the direct line the bot walks to get around a cover in the way
+FLANK_ANGLE = 70
+# Seconds (±50%) spent walking around an obstacle before waiting behind it instead, and back
+FLANK_SWITCH_TIME = 2.0
+# Ticks without moving (while trying to) before the bot backs off and turns away
+STUCK_TICKS = 30
+
+
+class Bot:
+    """
+    Turns towards the opponent, closes in or backs off to PREFERRED_RANGE and
+    shoots when roughly aimed; with a wall or cover in the line of fire it walks
+    around it instead. aim_error (degrees) adds a random wobble that is
+    re-rolled every half second, so two bots do not play a mirror match.
+    """
+
+    def __init__(self, rng=None, aim_error=6):
+        self.rng = rng or random.Random()
+        self.aim_error = aim_error
+        self.offset = 0.0
+        self.last_pos = None
+        self.last_move = 0.0
+        self.stuck = 0
+        self.escape = 0          # ticks left in the current escape manoeuvre
+        self.escape_turn = 1.0
+        self.flank = self.rng.choice((-FLANK_ANGLE, FLANK_ANGLE))
+        self.blocked = 0         # ticks the line of fire has been blocked
+        self.flank_time = FLANK_SWITCH_TIME
+        self.ambush = False
+
+    def __call__(self, sim, index):
+        me = sim.players[index]
+        them = sim.players[1 - index]
+
+        if sim.tick % max(1, int(0.5 / sim.dt)) == 0:
+            self.offset = self.rng.uniform(-self.aim_error, self.aim_error)
+
+        # Blocked by a wall or cover: reverse while turning for a moment
+        pos = (me.x, me.z)
+        self.stuck = self.stuck + 1 if pos == self.last_pos and self.last_move else 0
+        self.last_pos = pos
+        if self.stuck > STUCK_TICKS and not self.escape:
+            self.escape = int(0.6 / sim.dt)
+            self.escape_turn = self.rng.choice((-1.0, 1.0))
+            self.flank = self.rng.choice((-FLANK_ANGLE, FLANK_ANGLE))
+        control = self._decide(sim, me, them)
+        self.last_move = control.move
+        return control
+
+    def _decide(self, sim, me, them):
+        if self.escape:
+            self.escape -= 1
+            return PlayerInput(self.escape_turn, -1.0, False)
+
+        dx = them.x - me.x
+        dz = them.z - me.z
+        target = math.degrees(math.atan2(dx, dz)) + self.offset
+        nearby = sim.grid.query_segment(me.x, me.z, dx, dz, PROJECTILE_RADIUS)
+        if sweep_circle_vs_aabbs(me.x, me.z, dx, dz, PROJECTILE_RADIUS, nearby) is not None:
+            # no clear shot: walk around the obstacle, now and then waiting in ambush
+            # instead (two bots can otherwise chase each other round a cover forever)
+            self.blocked += 1
+            if self.blocked * sim.dt > self.flank_time:
+                self.blocked = 0
+                self.ambush = not self.ambush
+                self.flank = self.rng.choice((-FLANK_ANGLE, FLANK_ANGLE))
+                self.flank_time = FLANK_SWITCH_TIME * self.rng.uniform(0.5, 1.5)
+            if self.ambush:
+                diff = (target - me.rotation_y + 180) % 360 - 180
+                return PlayerInput(max(-1.0, min(1.0, diff / FULL_TURN_ANGLE)), 0.0, False)
+            diff = (target + self.flank - me.rotation_y + 180) % 360 - 180
+            return PlayerInput(max(-1.0, min(1.0, diff / FULL_TURN_ANGLE)), 1.0, False)
+
+        self.blocked = 0
+        self.ambush = False
+        diff = (target - me.rotation_y + 180) % 360 - 180
+        turn = max(-1.0, min(1.0, diff / FULL_TURN_ANGLE))
+
+        dist = math.hypot(dx, dz)
+        if dist > PREFERRED_RANGE[1]:
+            move = 1.0
+        elif dist < PREFERRED_RANGE[0]:
+            move = -1.0
+        else:
+            move = 0.0
+        return PlayerInput(turn, move, abs(diff) < SHOOT_ANGLE)
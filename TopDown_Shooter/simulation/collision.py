@@ -0,0 +1,123 @@
+"""
+Analytic 2D collision on the arena floor (the x, z plane).
+
+Everything in the TopDown arena is either an axis-aligned box (walls, covers)
+or a circle (players, projectiles), so overlap tests are plain arithmetic instead
+of a Panda3D collision traversal. Boxes are tuples (x, z, half_x, half_z).
+Touching shapes do not count as overlapping, so a player clamped against a wall
+can still slide along it.
+"""
+
+# When True, entities keep their Panda3D colliders and GameManager cross-checks
+# Entity.intersects() against these tests every frame (debug only: slow).
+DEBUG_PANDA_COLLIDERS = False
+
+
+def aabb_from_spec(position, scale):
+    """
+    Box tuple for an Entity-style (position, scale) pair, e.g. a WALL_SPECS entry.
+    """
+    return (position[0], position[2], scale[0] / 2, scale[2] / 2)
+
+
+def circle_vs_circle(ax, az, ar, bx, bz, br):
+    dx = ax - bx
+    dz = az - bz
+    reach = ar + br
+    return dx * dx + dz * dz < reach * reach
+
+
+def circle_vs_aabb(cx, cz, r, box):
+    bx, bz, hx, hz = box
+    # distance from the circle center to the closest point of the box
+    dx = abs(cx - bx) - hx
+    dz = abs(cz - bz) - hz
+    if dx < 0:
+        dx = 0
+    if dz < 0:
+        dz = 0
+    return dx * dx + dz * dz < r * r
+
+
+def circle_vs_aabbs(cx, cz, r, boxes):
+    """
+    First box in boxes overlapped by the circle, or None.
+    """
+    for box in boxes:
+        if circle_vs_aabb(cx, cz, r, box):
+            return box
+    return None
+
+
+# ─── SWEPT TESTS ────────────────────────────────────────────────────────────────
+# A circle at (x0, z0) moving by (mx, mz) over one tick. Each test returns the
+# fraction t in [0, 1] of that motion at which the circle first touches the shape
+# (0 if it already overlaps), or None if it never does, so fast shots cannot
+# tunnel through thin walls or players between two ticks.
+
+def _segment_enters_rect(x0, z0, mx, mz, cx, cz, hx, hz):
+    t_min, t_max = 0.0, 1.0
+    for p, m, c, h in ((x0, mx, cx, hx), (z0, mz, cz, hz)):
+        if m == 0:
+            if abs(p - c) >= h:
+                return None
+            continue
+        t1 = (c - h - p) / m
+        t2 = (c + h - p) / m
+        if t1 > t2:
+            t1, t2 = t2, t1
+        t_min = max(t_min, t1)
+        t_max = min(t_max, t2)
+        if t_min >= t_max:
+            return None
+    return t_min
+
+
+def _segment_enters_circle(x0, z0, mx, mz, cx, cz, radius):
+    fx = x0 - cx
+    fz = z0 - cz
+    c = fx * fx + fz * fz - radius * radius
+    if c < 0:
+        return 0.0
+    b = fx * mx + fz * mz
+    if b >= 0:
+        return None   # moving away (or not moving)
+    a = mx * mx + mz * mz
+    disc = b * b - a * c
+    if disc <= 0:
+        return None
+    t = (-b - disc ** 0.5) / a
+    return t if t <= 1 else None
+
+
+def sweep_circle_vs_circle(x0, z0, mx, mz, r, cx, cz, cr):
+    return _segment_enters_circle(x0, z0, mx, mz, cx, cz, r + cr)
+
+
+def sweep_circle_vs_aabb(x0, z0, mx, mz, r, box):
+    # The box grown by r is a rounded rectangle: two rectangles plus four corner circles
+    bx, bz, hx, hz = box
+    best = None
+    for t in (
+        _segment_enters_rect(x0, z0, mx, mz, bx, bz, hx + r, hz),
+        _segment_enters_rect(x0, z0, mx, mz, bx, bz, hx, hz + r),
+        _segment_enters_circle(x0, z0, mx, mz, bx - hx, bz - hz, r),
+        _segment_enters_circle(x0, z0, mx, mz, bx + hx, bz - hz, r),
+        _segment_enters_circle(x0, z0, mx, mz, bx - hx, bz + hz, r),
+        _segment_enters_circle(x0, z0, mx, mz, bx + hx, bz + hz, r),
+    ):
+        if t is not None and (best is None or t < best):
+            best = t
+    return best
+
+
+def sweep_circle_vs_aabbs(x0, z0, mx, mz, r, boxes):
+    """
+    Earliest contact fraction against any box in boxes, or None.
+    """
+    best = None
+    for box in boxes:
+        t = sweep_circle_vs_aabb(x0, z0, mx, mz, r, box)
+        if t is not None and (best is None or t < best):
+            best = t
+    return best
@@ -0,0 +1,75 @@
+import math
+
+from simulation.arena import PROJECTILE_BOUNDS
+
+# The playable floor is 40 × 23 units; 4-unit cells give a 10 × 6 grid where a
+# 2×2 cover touches at most 4 cells and a player or shot usually 1 or 2.
+CELL_SIZE = 4
+
+
+class StaticGrid:
+    """
+    Uniform grid over the arena indexing static boxes (x, z, half_x, half_z),
+    so collision tests only look at the walls / covers near a shape instead of
+    all of them. Anything outside the grid is clamped into the border cells,
+    which keeps queries correct for the walls that stick out of the floor.
+    """
+
+    def __init__(self, half_x=PROJECTILE_BOUNDS[0], half_z=PROJECTILE_BOUNDS[1], cell_size=CELL_SIZE):
+        self.min_x = -half_x
+        self.min_z = -half_z
+        self.cell_size = cell_size
+        self.cols = max(1, math.ceil(2 * half_x / cell_size))
+        self.rows = max(1, math.ceil(2 * half_z / cell_size))
+        self.cells = [[] for _ in range(self.cols * self.rows)]
+
+    def _col(self, x):
+        return min(self.cols - 1, max(0, int((x - self.min_x) // self.cell_size)))
+
+    def _row(self, z):
+        return min(self.rows - 1, max(0, int((z - self.min_z) // self.cell_size)))
+
+    def _cells_in(self, x0, z0, x1, z1):
+        for col in range(self._col(x0), self._col(x1) + 1):
+            base = col * self.rows
+            for row in range(self._row(z0), self._row(z1) + 1):
+                yield self.cells[base + row]
+
+    # ─── UPDATES ────────────────────────────────────────────────────────────────
+
+    def insert(self, box):
+        x, z, hx, hz = box
+        for cell in self._cells_in(x - hx, z - hz, x + hx, z + hz):
+            cell.append(box)
+
+    def remove(self, box):
+        x, z, hx, hz = box
+        for cell in self._cells_in(x - hx, z - hz, x + hx, z + hz):
+            cell.remove(box)
+
+    # ─── QUERIES ────────────────────────────────────────────────────────────────
+
+    def query_rect(self, x0, z0, x1, z1):
+        """
+        Boxes in the cells overlapping the rectangle [x0, x1] × [z0, z1] (no duplicates).
+        """
+        found = []
+        for cell in self._cells_in(x0, z0, x1, z1):
+            for box in cell:
+                if box not in found:
+                    found.append(box)
+        return found
+
+    def query_circle(self, x, z, r):
+        """
+        Candidate boxes for a circle at (x, z).
+        """
+        return self.query_rect(x - r, z - r, x + r, z + r)
+
+    def query_segment(self, x0, z0, mx, mz, r):
+        """
+        Candidate boxes for a circle moving from (x0, z0) by (mx, mz) (one tick of motion).
+        """
+        x1 = x0 + mx
+        z1 = z0 + mz
+        return self.query_rect(min(x0, x1) - r, min(z0, z1) - r, max(x0, x1) + r, max(z0, z1) + r)
@@ -0,0 +1,216 @@
+import os
+import math
+import random
+import struct
+import hashlib
+from array import array
+
+from simulation.arena import (
+    COVER_XS, COVER_ZS, COVER_COUNT, COVER_MIN_SPACING, SPAWN_CLEARANCE, spawn_exclusions,
+)
+
+# Every valid cover layout, precomputed. A layout is a bitmask over the 7×5 candidate
+# grid (bit i = CANDIDATES[i]), so the whole bank is a flat array of integers and
+# picking a layout at match start is O(1) instead of rejection sampling.
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+BANK_PATH = os.path.join(HERE, '..', 'data', 'cover_layouts.bin')
+
+CANDIDATES = [(x, z) for x in COVER_XS for z in COVER_ZS]
+
+_MAGIC = b'CLB1'
+
+
+def mask_to_positions(mask):
+    """
+    (x, z) cover positions of a layout bitmask.
+    """
+    return [pos for i, pos in enumerate(CANDIDATES) if mask >> i & 1]
+
+
+def positions_to_mask(positions):
+    mask = 0
+    for pos in positions:
+        mask |= 1 << CANDIDATES.index(tuple(pos))
+    return mask
+
+
+def enumerate_layouts(exclude_positions):
+    """
+    All layouts of COVER_COUNT[0]..COVER_COUNT[1] covers that keep clear of the spawns
+    and are COVER_MIN_SPACING apart, as {cover count: [masks]}.
+    """
+    safe = [
+        i for i, (x, z) in enumerate(CANDIDATES)
+        if not any(abs(x - sx) < SPAWN_CLEARANCE and abs(z - sz) < SPAWN_CLEARANCE
+                   for sx, sz in exclude_positions)
+    ]
+    # Bits too close to each candidate
+    conflicts = {}
+    for i in safe:
+        conflicts[i] = 0
+        for j in safe:
+            if j != i and math.hypot(CANDIDATES[i][0] - CANDIDATES[j][0],
+                                     CANDIDATES[i][1] - CANDIDATES[j][1]) < COVER_MIN_SPACING:
+                conflicts[i] |= 1 << j
+
+    low, high = COVER_COUNT
+    layouts = {count: [] for count in range(low, high + 1)}
+
+    def extend(start, mask, banned, count):
+        if count >= low:
+            layouts[count].append(mask)
+        if count == high:
+            return
+        for k in range(start, len(safe)):
+            i = safe[k]
+            if not banned >> i & 1:
+                extend(k + 1, mask | 1 << i, banned | conflicts[i], count + 1)
+
+    extend(0, 0, 0, 0)
+    return layouts
+
+
+def _read_exact(f, size):
+    data = f.read(size)
+    if len(data) != size:
+        raise ValueError('truncated cover layout bank')
+    return data
+
+
+def _bank_key(exclude_positions):
+    # Anything that changes which layouts are valid invalidates the file on disk
+    params = repr((CANDIDATES, COVER_COUNT, COVER_MIN_SPACING, SPAWN_CLEARANCE,
+                   sorted(exclude_positions)))
+    return hashlib.sha1(params.encode()).digest()
+
+
+class _Alias:
+    """
+    Walker's alias table: O(1) weighted choice among n items.
+    """
+
+    def __init__(self, weights):
+        n = len(weights)
+        total = sum(weights)
+        scaled = [w * n / total for w in weights]
+        self.prob = [1.0] * n
+        self.alias = list(range(n))
+        small = [i for i, p in enumerate(scaled) if p < 1]
+        large = [i for i, p in enumerate(scaled) if p >= 1]
+        while small and large:
+            s, l = small.pop(), large.pop()
+            self.prob[s] = scaled[s]
+            self.alias[s] = l
+            scaled[l] -= 1 - scaled[s]
+            (small if scaled[l] < 1 else large).append(l)
+
+    def pick(self, rng):
+        i = rng.randrange(len(self.prob))
+        return i if rng.random() < self.prob[i] else self.alias[i]
+
+
+class LayoutBank:
+    """
+    The precomputed layouts, grouped by cover count.
+    pick() draws a cover count uniformly (like the old 4-to-6 roll), then a layout
+    of that size, either uniformly or weighted with set_weights().
+    """
+
+    def __init__(self, layouts):
+        # {count: array('Q') of masks}
+        self.layouts = {count: array('Q', masks) for count, masks in layouts.items() if masks}
+        self.counts = sorted(self.layouts)
+        self._tables = {}
+
+    def __len__(self):
+        return sum(len(masks) for masks in self.layouts.values())
+
+    @classmethod
+    def build(cls, exclude_positions=None):
+        if exclude_positions is None:
+            exclude_positions = spawn_exclusions()
+        return cls(enumerate_layouts(exclude_positions))
+
+    @classmethod
+    def load_or_build(cls, exclude_positions=None, path=BANK_PATH):
+        """
+        Load the bank from disk, or enumerate it and save it if the file is missing
+        or was built for different arena parameters.
+        """
+        if exclude_positions is None:
+            exclude_positions = spawn_exclusions()
+        key = _bank_key(exclude_positions)
+        path = os.path.abspath(path)
+        try:
+            return cls.load(path, key)
+        except (OSError, ValueError):
+            bank = cls.build(exclude_positions)
+            try:
+                bank.save(path, key)
+            except OSError as e:
+                print(f'[layouts] could not save {path}: {e}')
+            return bank
+
+    @classmethod
+    def load(cls, path, key):
+        with open(path, 'rb') as f:
+            if f.read(4) != _MAGIC or f.read(len(key)) != key:
+                raise ValueError('stale cover layout bank')
+            (groups,) = struct.unpack('<I', _read_exact(f, 4))
+            layouts = {}
+            for _ in range(groups):
+                count, size = struct.unpack('<II', _read_exact(f, 8))
+                masks = array('Q')
+                masks.frombytes(_read_exact(f, size * masks.itemsize))
+                layouts[count] = masks
+            if f.read(1):
+                raise ValueError('trailing data in cover layout bank')
+        return cls(layouts)
+
+    def save(self, path, key):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(_MAGIC + key)
+            f.write(struct.pack('<I', len(self.layouts)))
+            for count in self.counts:
+                masks = self.layouts[count]
+                f.write(struct.pack('<II', count, len(masks)))
+                f.write(masks.tobytes())
+        os.replace(tmp_path, path)
+
+    def set_weights(self, score):
+        """
+        Weight layouts by score(mask) -> float >= 0, e.g. a balance score from
+        self-play results. Layouts scored 0 are never picked; None restores uniform picks.
+        """
+        self._tables = {}
+        if score is None:
+            return
+        for count in self.counts:
+            weights = [max(0.0, score(mask)) for mask in self.layouts[count]]
+            if sum(weights) > 0:
+                self._tables[count] = _Alias(weights)
+            else:
+                # nothing fair at this size: never pick it
+                self._tables[count] = None
+
+    def pick_mask(self, rng=random):
+        counts = [c for c in self.counts if self._tables.get(c, True) is not None]
+        if not counts:
+            # every size weighted out: fall back to uniform picks rather than no layout
+            self._tables = {}
+            counts = self.counts
+        count = counts[rng.randrange(len(counts))]
+        masks = self.layouts[count]
+        table = self._tables.get(count)
+        if table is None:
+            return masks[rng.randrange(len(masks))]
+        return masks[table.pick(rng)]
+
+    def pick(self, rng=random):
+        """
+        (x, z) cover positions of a random layout.
+        """
+        return mask_to_positions(self.pick_mask(rng))
@@ -0,0 +1,289 @@
+import math
+from collections import namedtuple
+
+from simulation.arena import (
+    P1_SPAWN, P2_SPAWN, P1_SPAWN_ROTATION, P2_SPAWN_ROTATION,
+    PLAYER_BOUNDS, PROJECTILE_BOUNDS, WALL_SPECS, COVER_SCALE,
+)
+from simulation.collision import aabb_from_spec, circle_vs_aabbs, sweep_circle_vs_circle, sweep_circle_vs_aabbs
+from simulation.grid import StaticGrid
+
+# Default simulation rate (ticks per second)
+TICK_RATE = 120
+
+# One player's controls for a single tick:
+#   turn  : -1..1, positive turns right (rotation_y increases)
+#   move  : -1..1, positive moves forward
+#   shoot : True while the fire button is held
+PlayerInput = namedtuple('PlayerInput', ['turn', 'move', 'shoot'])
+IDLE_INPUT = PlayerInput(0.0, 0.0, False)
+
+# Collision radii on the (x, z) plane
+PLAYER_RADIUS = 0.5       # 1×1 cube
+PROJECTILE_RADIUS = 0.15  # 0.3 sphere
+PROJECTILE_SPAWN_OFFSET = 1.1
+
+
+class PlayerState:
+    """
+    Everything the simulation knows about one player: position on the floor,
+    facing, stats (overridden from settings on each match) and health.
+    """
+
+    def __init__(self, name, spawn, spawn_rotation):
+        self.name = name
+        self.spawn = (spawn[0], spawn[2])
+        self.spawn_rotation = spawn_rotation
+
+        # Stats (overridden by apply_stats)
+        self.turn_speed = 120
+        self.move_speed = 5
+        self.health_max = 100
+        self.health = 100
+        self.shoot_cooldown = 0.3
+        self.shot_power = 10
+        self.projectile_speed = 10
+
+        self.reset()
+
+    def apply_stats(self, stats):
+        """
+        stats: one player's entry of load_settings(), e.g. settings['Player 1'].
+        """
+        self.turn_speed = stats['rotation_speed']
+        self.move_speed = stats['movement_speed']
+        self.health_max = stats['health_points']
+        self.shoot_cooldown = stats['shot_delay']
+        self.shot_power = stats['shot_power']
+        self.projectile_speed = stats['projectile_speed']
+
+    def reset(self):
+        self.x, self.z = self.spawn
+        self.rotation_y = self.spawn_rotation
+        self.health = self.health_max
+        self.last_shot = -math.inf
+
+    def forward(self):
+        """
+        Unit (x, z) facing vector, matching Ursina's Entity.forward for rotation_y.
+        """
+        rad = math.radians(self.rotation_y)
+        return math.sin(rad), math.cos(rad)
+
+
+class ProjectileState:
+    """
+    A shot travelling in a straight line on the floor.
+    """
+    __slots__ = ('id', 'owner', 'x', 'z', 'dx', 'dz', 'speed', 'damage', 'alive')
+
+    def __init__(self, id, owner, x, z, dx, dz, speed, damage):
+        self.id = id
+        self.owner = owner    # index of the shooting player
+        self.x = x
+        self.z = z
+        self.dx = dx
+        self.dz = dz
+        self.speed = speed
+        self.damage = damage
+        self.alive = True
+
+
+class MatchSimulation:
+    """
+    Headless, fixed-timestep model of one TopDown match.
+    No Ursina / Panda3D here: GameManager feeds it PlayerInputs and copies the
+    resulting state onto the entities, and tools can run matches without a window.
+
+    batched_projectiles: keep shots in a NumPy ProjectileBatch (simulation/projectiles.py)
+    instead of one ProjectileState per shot; worth it with hundreds of shots in flight.
+    """
+
+    def __init__(self, tick_rate=TICK_RATE, batched_projectiles=False):
+        self.dt = 1.0 / tick_rate
+        self.batch = None
+        if batched_projectiles:
+            # NumPy is only needed for the batched engine
+            from simulation.projectiles import ProjectileBatch
+            self.batch = ProjectileBatch()
+        self.players = [
+            PlayerState('Player 1', P1_SPAWN, P1_SPAWN_ROTATION),
+            PlayerState('Player 2', P2_SPAWN, P2_SPAWN_ROTATION),
+        ]
+        # Static boxes as (x, z, half_x, half_z), indexed by a uniform grid
+        self.walls = [aabb_from_spec(pos, scale) for pos, scale in WALL_SPECS]
+        self.covers = []
+        self.static_boxes = list(self.walls)
+        self.grid = StaticGrid()
+        for box in self.walls:
+            self.grid.insert(box)
+        self.projectiles = []
+        self.reset()
+
+    def reset(self, cover_positions=()):
+        """
+        Start a new match: players back to spawn with full health, no shots in
+        flight, covers at the given (x, z) positions.
+        """
+        # Swap the covers in the grid; walls stay indexed across matches
+        hx, hz = COVER_SCALE[0] / 2, COVER_SCALE[2] / 2
+        for box in self.covers:
+            self.grid.remove(box)
+        self.covers = [(x, z, hx, hz) for x, z in cover_positions]
+        for box in self.covers:
+            self.grid.insert(box)
+        self.static_boxes = self.walls + self.covers
+        self.projectiles = []
+        self._next_projectile_id = 0
+        if self.batch is not None:
+            self.batch.clear()
+            self.batch.set_static_boxes(self.static_boxes)
+        for p in self.players:
+            p.reset()
+        self.tick = 0
+        self.time = 0.0
+        self.winner = None   # index of the winning player once the match is over
+
+    @property
+    def over(self):
+        return self.winner is not None
+
+    # ─── STEP ───────────────────────────────────────────────────────────────────
+
+    def step(self, inputs):
+        """
+        Advance the match by one tick. inputs: one PlayerInput per player.
+        """
+        if self.over:
+            return
+
+        self.time += self.dt
+        self.tick += 1
+
+        for index, (player, control) in enumerate(zip(self.players, inputs)):
+            self._update_player(index, player, control)
+
+        if self.batch is not None:
+            self._update_batch()
+        else:
+            for proj in self.projectiles:
+                if proj.alive:
+                    self._update_projectile(proj)
+                    if self.over:
+                        break
+            self.projectiles = [proj for proj in self.projectiles if proj.alive]
+
+        # If both died simultaneously, default winner = p1
+        if not self.over and all(p.health <= 0 for p in self.players):
+            self.winner = 0
+
+    def play(self, policies, max_ticks):
+        """
+        Run a whole match headlessly. policies: one callable per player,
+        policy(sim, index) -> PlayerInput. Returns the winner index (or None on timeout).
+        """
+        while not self.over and self.tick < max_ticks:
+            self.step([policy(self, i) for i, policy in enumerate(policies)])
+        return self.winner
+
+    def live_projectiles(self):
+        """
+        (id, owner, x, z) for every shot in flight, whichever engine holds them.
+        """
+        if self.batch is not None:
+            return self.batch.live()
+        return [(proj.id, proj.owner, proj.x, proj.z) for proj in self.projectiles]
+
+    def _update_player(self, index, player, control):
+        dt = self.dt
+
+        # 1) Rotation
+        if control.turn:
+            player.rotation_y += control.turn * player.turn_speed * dt
+
+        # 2) Movement forward/back
+        if control.move:
+            fx, fz = player.forward()
+            step = control.move * player.move_speed * dt
+            new_x = player.x + fx * step
+            new_z = player.z + fz * step
+
+            # clamp within bounds, then refuse moves into walls or covers
+            if abs(new_x) <= PLAYER_BOUNDS[0] and abs(new_z) <= PLAYER_BOUNDS[1]:
+                nearby = self.grid.query_circle(new_x, new_z, PLAYER_RADIUS)
+                if circle_vs_aabbs(new_x, new_z, PLAYER_RADIUS, nearby) is None:
+                    player.x, player.z = new_x, new_z
+
+        # 3) Shooting
+        if control.shoot and self.time - player.last_shot >= player.shoot_cooldown:
+            self._shoot(index, player)
+            player.last_shot = self.time
+
+    def _shoot(self, index, player):
+        fx, fz = player.forward()
+        x = player.x + fx * PROJECTILE_SPAWN_OFFSET
+        z = player.z + fz * PROJECTILE_SPAWN_OFFSET
+        if self.batch is not None:
+            self.batch.spawn(index, x, z, fx, fz, player.projectile_speed, player.shot_power)
+            return
+        self.projectiles.append(ProjectileState(
+            id=self._next_projectile_id,
+            owner=index,
+            x=x,
+            z=z,
+            dx=fx,
+            dz=fz,
+            speed=player.projectile_speed,
+            damage=player.shot_power,
+        ))
+        self._next_projectile_id += 1
+
+    def _update_projectile(self, proj):
+        # This tick's motion, swept so fast shots cannot skip over a wall or player
+        mx = proj.dx * proj.speed * self.dt
+        mz = proj.dz * proj.speed * self.dt
+
+        # 1) Earliest contact with the other player...
+        hit_t, target = None, None
+        for index, player in enumerate(self.players):
+            if index == proj.owner:
+                continue
+            t = sweep_circle_vs_circle(proj.x, proj.z, mx, mz, PROJECTILE_RADIUS,
+                                       player.x, player.z, PLAYER_RADIUS)
+            if t is not None and (hit_t is None or t < hit_t):
+                hit_t, target = t, player
+
+        # 2) ...unless a wall or cover is in the way first
+        nearby = self.grid.query_segment(proj.x, proj.z, mx, mz, PROJECTILE_RADIUS)
+        wall_t = sweep_circle_vs_aabbs(proj.x, proj.z, mx, mz, PROJECTILE_RADIUS, nearby)
+        if wall_t is not None and (hit_t is None or wall_t < hit_t):
+            hit_t, target = wall_t, None
+
+        if hit_t is not None:
+            proj.x += mx * hit_t
+            proj.z += mz * hit_t
+            proj.alive = False
+            if target is not None:
+                target.health -= proj.damage
+                if target.health <= 0:
+                    self.winner = proj.owner
+            return
+
+        # 3) Move forward; out of bounds?
+        proj.x += mx
+        proj.z += mz
+        if abs(proj.z) > PROJECTILE_BOUNDS[1] or abs(proj.x) > PROJECTILE_BOUNDS[0]:
+            proj.alive = False
+
+    def _update_batch(self):
+        hits = self.batch.step(
+            self.dt, PROJECTILE_BOUNDS,
+            [(p.x, p.z) for p in self.players], PLAYER_RADIUS, PROJECTILE_RADIUS,
+        )
+        # Apply damage in spawn order; the first kill decides the match
+        for owner, target, damage in hits:
+            player = self.players[target]
+            player.health -= damage
+            if player.health <= 0:
+                self.winner = owner
+                return
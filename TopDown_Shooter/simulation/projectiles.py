@@ -0,0 +1,169 @@
+import numpy as np
+
+# Vectorized forms of the swept tests in simulation/collision.py: arguments broadcast
+# (shots along axis 0, shapes along axis 1) and misses come back as +inf.
+
+def _enter_rects(x0, z0, mx, mz, cx, cz, hx, hz):
+    t_min = 0.0
+    t_max = 1.0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for p, m, c, h in ((x0, mx, cx, hx), (z0, mz, cz, hz)):
+            inside = np.abs(p - c) < h
+            t1 = (c - h - p) / m
+            t2 = (c + h - p) / m
+            moving = m != 0
+            lo = np.where(moving, np.minimum(t1, t2), np.where(inside, -np.inf, np.inf))
+            hi = np.where(moving, np.maximum(t1, t2), np.where(inside, np.inf, -np.inf))
+            t_min = np.maximum(t_min, lo)
+            t_max = np.minimum(t_max, hi)
+    return np.where(t_min < t_max, t_min, np.inf)
+
+
+def _enter_circles(x0, z0, mx, mz, cx, cz, radius):
+    fx = x0 - cx
+    fz = z0 - cz
+    c = fx * fx + fz * fz - radius * radius
+    b = fx * mx + fz * mz
+    a = mx * mx + mz * mz
+    disc = b * b - a * c
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t = (-b - np.sqrt(np.maximum(disc, 0))) / a
+    hit = (b < 0) & (disc > 0) & (t <= 1)
+    return np.where(c < 0, 0.0, np.where(hit, t, np.inf))
+
+
+def _enter_aabbs(x0, z0, mx, mz, r, boxes):
+    bx, bz, hx, hz = boxes[None, :, 0], boxes[None, :, 1], boxes[None, :, 2], boxes[None, :, 3]
+    return np.minimum.reduce([
+        _enter_rects(x0, z0, mx, mz, bx, bz, hx + r, hz),
+        _enter_rects(x0, z0, mx, mz, bx, bz, hx, hz + r),
+        _enter_circles(x0, z0, mx, mz, bx - hx, bz - hz, r),
+        _enter_circles(x0, z0, mx, mz, bx + hx, bz - hz, r),
+        _enter_circles(x0, z0, mx, mz, bx - hx, bz + hz, r),
+        _enter_circles(x0, z0, mx, mz, bx + hx, bz + hz, r),
+    ])
+
+
+class ProjectileBatch:
+    """
+    Struct-of-arrays projectile store: positions, velocities, damage, owners and ids
+    live in NumPy arrays, and step() moves, bounds-culls and hit-tests every shot
+    at once, swept like the per-object engine. Dead slots are compacted away after
+    each step, keeping live shots in spawn order at the front of the arrays.
+    Used by MatchSimulation(batched_projectiles=True) for high-density play.
+    """
+
+    def __init__(self, capacity=256):
+        self.count = 0
+        self._next_id = 0
+        self.x = self.z = self.vx = self.vz = self.damage = self.owner = self.ids = None
+        self._allocate(capacity)
+        self.set_static_boxes([])
+
+    def _allocate(self, capacity):
+        def grown(arr, dtype):
+            new = np.zeros(capacity, dtype=dtype)
+            if arr is not None:
+                new[:self.count] = arr[:self.count]
+            return new
+
+        self.x = grown(self.x, np.float64)
+        self.z = grown(self.z, np.float64)
+        self.vx = grown(self.vx, np.float64)
+        self.vz = grown(self.vz, np.float64)
+        self.damage = grown(self.damage, np.float64)
+        self.owner = grown(self.owner, np.int8)
+        self.ids = grown(self.ids, np.int64)
+
+    def clear(self):
+        self.count = 0
+        self._next_id = 0
+
+    def set_static_boxes(self, boxes):
+        """
+        boxes: (x, z, half_x, half_z) tuples of the walls and covers for this match.
+        """
+        self.boxes = np.array(boxes, dtype=np.float64).reshape(-1, 4)
+
+    def spawn(self, owner, x, z, dx, dz, speed, damage):
+        """
+        Add a shot and return its id.
+        """
+        if self.count == len(self.x):
+            self._allocate(len(self.x) * 2)
+        i = self.count
+        self.x[i] = x
+        self.z[i] = z
+        self.vx[i] = dx * speed
+        self.vz[i] = dz * speed
+        self.damage[i] = damage
+        self.owner[i] = owner
+        self.ids[i] = self._next_id
+        self._next_id += 1
+        self.count += 1
+        return self.ids[i]
+
+    def step(self, dt, bounds, player_positions, player_radius, radius):
+        """
+        Advance every shot by dt and resolve hits.
+        bounds: (half_x, half_z) beyond which shots are culled.
+        player_positions: one (x, z) per player, indexed like the owner ids.
+        Returns [(owner, target, damage), ...] player hits in spawn order.
+        """
+        n = self.count
+        if n == 0:
+            return []
+
+        x = self.x[:n]
+        z = self.z[:n]
+        mx = self.vx[:n] * dt
+        mz = self.vz[:n] * dt
+        owner = self.owner[:n]
+        x0, z0, mx0, mz0 = x[:, None], z[:, None], mx[:, None], mz[:, None]
+
+        # 1) Earliest contact with another player: (n, players) swept circle-vs-circle
+        players = np.asarray(player_positions, dtype=np.float64)
+        t_players = _enter_circles(x0, z0, mx0, mz0, players[None, :, 0], players[None, :, 1],
+                                   radius + player_radius)
+        t_players[owner[:, None] == np.arange(len(players))[None, :]] = np.inf
+        targets = t_players.argmin(axis=1)
+        t_player = t_players[np.arange(n), targets]
+
+        # 2) Earliest contact with a wall or cover: (n, boxes) swept circle-vs-AABB
+        if len(self.boxes):
+            t_static = _enter_aabbs(x0, z0, mx0, mz0, radius, self.boxes).min(axis=1)
+        else:
+            t_static = np.full(n, np.inf)
+
+        # A player only counts as hit if no wall comes first
+        hit_player = np.isfinite(t_player) & (t_player <= t_static)
+        hit_static = np.isfinite(t_static) & ~hit_player
+        t_hit = np.where(hit_player, t_player, np.where(hit_static, t_static, 1.0))
+        x += mx * t_hit
+        z += mz * t_hit
+
+        # 3) Out of bounds
+        in_bounds = (np.abs(x) <= bounds[0]) & (np.abs(z) <= bounds[1])
+
+        hit_idx = np.flatnonzero(hit_player)
+        hits = list(zip(owner[hit_idx].tolist(), targets[hit_idx].tolist(), self.damage[hit_idx].tolist()))
+
+        self._compact(in_bounds & ~hit_player & ~hit_static)
+        return hits
+
+    def _compact(self, keep_mask):
+        keep = np.flatnonzero(keep_mask)
+        m = len(keep)
+        if m == self.count:
+            return
+        for arr in (self.x, self.z, self.vx, self.vz, self.damage, self.owner, self.ids):
+            arr[:m] = arr[keep]
+        self.count = m
+
+    def live(self):
+        """
+        (id, owner, x, z) for every shot in flight.
+        """
+        n = self.count
+        return list(zip(self.ids[:n].tolist(), self.owner[:n].tolist(),
+                        self.x[:n].tolist(), self.z[:n].tolist()))
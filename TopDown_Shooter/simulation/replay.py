@@ -0,0 +1,273 @@
+import os
+import sys
+import time
+import struct
+
+from simulation.match import MatchSimulation, PlayerInput
+from simulation.layouts import mask_to_positions, positions_to_mask
+from utils.persistence import atomic_write
+
+# Compact match replays: the simulation is deterministic, so a match is fully
+# described by its tick rate, both players' stats, the cover layout and the
+# PlayerInput fed to every tick. Inputs are stored as runs: only the ticks where
+# a player's input changes are written, as varints / zigzag deltas.
+#
+# Layout (all integers are unsigned LEB128 varints):
+#   b'TDR1'
+#   tick_rate, seed, cover mask, ticks, winner + 1 (0 = none)
+#   stats: 2 × len(STAT_KEYS) little-endian doubles
+#   events until the end: tick delta since the previous event, changed-player bitmask,
+#   then per changed player a flags byte (1 = turn, 2 = move, 4 = shoot held)
+#   followed by the zigzag deltas of the changed turn / move steps
+
+_MAGIC = b'TDR1'
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+REPLAY_DIR = os.path.join(HERE, '..', 'data', 'replays')
+# Oldest replays are deleted beyond this many
+REPLAY_KEEP = 200
+
+# Analog inputs are quantized to 1/INPUT_STEPS before they reach the simulation,
+# so what gets recorded is exactly what was simulated. Keyboard input (-1, 0, 1) is exact.
+INPUT_STEPS = 32
+
+# PlayerState stat attributes, in settings order
+STAT_KEYS = (
+    ('rotation_speed', 'turn_speed'),
+    ('movement_speed', 'move_speed'),
+    ('health_points', 'health_max'),
+    ('shot_delay', 'shoot_cooldown'),
+    ('shot_power', 'shot_power'),
+    ('projectile_speed', 'projectile_speed'),
+)
+
+
+def quantize_input(control):
+    """
+    The PlayerInput a replay can reproduce exactly (turn / move rounded to 1/INPUT_STEPS).
+    """
+    return PlayerInput(
+        round(control.turn * INPUT_STEPS) / INPUT_STEPS,
+        round(control.move * INPUT_STEPS) / INPUT_STEPS,
+        bool(control.shoot),
+    )
+
+
+def _packed(control):
+    return round(control.turn * INPUT_STEPS), round(control.move * INPUT_STEPS), bool(control.shoot)
+
+
+# ─── VARINTS ────────────────────────────────────────────────────────────────────
+
+def _write_varint(out, value):
+    while value >= 0x80:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data, pos):
+    value = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+def _zigzag(value):
+    return value * 2 if value >= 0 else -value * 2 - 1
+
+
+def _unzigzag(value):
+    return value >> 1 if not value & 1 else -(value >> 1) - 1
+
+
+# ─── REPLAY ─────────────────────────────────────────────────────────────────────
+
+class Replay:
+    """
+    One recorded match.
+      - stats: [{settings key: value}, ...] per player, as passed to PlayerState.apply_stats
+      - events: [(tick, [packed input per player])] where inputs change, packed = (turn, move, shoot)
+        with turn / move in 1/INPUT_STEPS steps
+    """
+
+    def __init__(self, tick_rate, seed, cover_positions, stats, events, ticks, winner):
+        self.tick_rate = tick_rate
+        self.seed = seed
+        self.cover_positions = [tuple(pos) for pos in cover_positions]
+        self.stats = stats
+        self.events = events
+        self.ticks = ticks
+        self.winner = winner
+
+    def inputs(self):
+        """
+        Yield the list of PlayerInputs for every tick, in order.
+        """
+        current = [PlayerInput(0.0, 0.0, False)] * len(self.stats)
+        events = iter(self.events)
+        next_event = next(events, None)
+        for tick in range(self.ticks):
+            while next_event is not None and next_event[0] == tick:
+                current = [PlayerInput(turn / INPUT_STEPS, move / INPUT_STEPS, shoot)
+                           for turn, move, shoot in next_event[1]]
+                next_event = next(events, None)
+            yield current
+
+    # ─── ENCODING ───────────────────────────────────────────────────────────────
+
+    def to_bytes(self):
+        out = bytearray(_MAGIC)
+        for value in (self.tick_rate, self.seed, positions_to_mask(self.cover_positions),
+                      self.ticks, 0 if self.winner is None else self.winner + 1):
+            _write_varint(out, value)
+        for player_stats in self.stats:
+            out += struct.pack('<' + 'd' * len(STAT_KEYS), *(player_stats[key] for key, _ in STAT_KEYS))
+
+        last_tick = 0
+        last = [(0, 0, False)] * len(self.stats)
+        for tick, packed in self.events:
+            changed = [i for i, (new, old) in enumerate(zip(packed, last)) if new != old]
+            if not changed:
+                continue
+            _write_varint(out, tick - last_tick)
+            _write_varint(out, sum(1 << i for i in changed))
+            for i in changed:
+                (turn, move, shoot), (old_turn, old_move, _) = packed[i], last[i]
+                out.append((turn != old_turn) | (move != old_move) << 1 | shoot << 2)
+                if turn != old_turn:
+                    _write_varint(out, _zigzag(turn - old_turn))
+                if move != old_move:
+                    _write_varint(out, _zigzag(move - old_move))
+            last_tick, last = tick, list(packed)
+        return bytes(out)
+
+    @classmethod
+    def from_bytes(cls, data):
+        if data[:4] != _MAGIC:
+            raise ValueError('not a TopDown replay')
+        pos = 4
+        header = []
+        for _ in range(5):
+            value, pos = _read_varint(data, pos)
+            header.append(value)
+        tick_rate, seed, mask, ticks, winner = header
+
+        stats = []
+        size = struct.calcsize('<' + 'd' * len(STAT_KEYS))
+        for _ in range(2):
+            values = struct.unpack_from('<' + 'd' * len(STAT_KEYS), data, pos)
+            pos += size
+            stats.append({key: value for (key, _), value in zip(STAT_KEYS, values)})
+
+        events = []
+        tick = 0
+        last = [(0, 0, False)] * len(stats)
+        while pos < len(data):
+            delta, pos = _read_varint(data, pos)
+            changed, pos = _read_varint(data, pos)
+            tick += delta
+            packed = list(last)
+            for i in range(len(stats)):
+                if not changed >> i & 1:
+                    continue
+                flags = data[pos]
+                pos += 1
+                turn, move, _ = last[i]
+                if flags & 1:
+                    value, pos = _read_varint(data, pos)
+                    turn += _unzigzag(value)
+                if flags & 2:
+                    value, pos = _read_varint(data, pos)
+                    move += _unzigzag(value)
+                packed[i] = (turn, move, bool(flags & 4))
+            events.append((tick, packed))
+            last = packed
+
+        return cls(tick_rate, seed, mask_to_positions(mask), stats, events, ticks,
+                   None if winner == 0 else winner - 1)
+
+    def save(self, path):
+        data = self.to_bytes()
+        atomic_write(path, lambda f: f.write(data), binary=True)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as f:
+            return cls.from_bytes(f.read())
+
+
+class ReplayRecorder:
+    """
+    Collects a match as it is played: call record() with the inputs of every
+    simulated tick (already passed through quantize_input), then finish().
+    """
+
+    def __init__(self, sim, seed, cover_positions):
+        self.tick_rate = round(1 / sim.dt)
+        self.seed = seed
+        self.cover_positions = list(cover_positions)
+        self.stats = [{key: getattr(p, attr) for key, attr in STAT_KEYS} for p in sim.players]
+        self.events = []
+        self.ticks = 0
+        self._last = [(0, 0, False)] * len(sim.players)
+
+    def record(self, inputs):
+        packed = [_packed(control) for control in inputs]
+        if packed != self._last:
+            self.events.append((self.ticks, packed))
+            self._last = packed
+        self.ticks += 1
+
+    def finish(self, winner):
+        return Replay(self.tick_rate, self.seed, self.cover_positions, self.stats,
+                      self.events, self.ticks, winner)
+
+
+def replay_path(match_id, folder=REPLAY_DIR):
+    """
+    Where the replay of a match-history row is kept.
+    """
+    return os.path.abspath(os.path.join(folder, f'match_{match_id}.tdr'))
+
+
+def prune_replays(folder=REPLAY_DIR, keep=REPLAY_KEEP):
+    try:
+        names = [n for n in os.listdir(folder) if n.endswith('.tdr')]
+    except OSError:
+        return
+    paths = sorted((os.path.join(folder, n) for n in names), key=os.path.getmtime)
+    for path in paths[:-keep]:
+        os.remove(path)
+
+
+def play(replay, batched_projectiles=False):
+    """
+    Re-simulate a replay headlessly, as fast as the CPU allows.
+    Returns the MatchSimulation in its final state.
+    """
+    sim = MatchSimulation(tick_rate=replay.tick_rate, batched_projectiles=batched_projectiles)
+    for player, stats in zip(sim.players, replay.stats):
+        player.apply_stats(stats)
+    sim.reset(replay.cover_positions)
+    for inputs in replay.inputs():
+        sim.step(inputs)
+    return sim
+
+
+if __name__ == '__main__':
+    # python -m simulation.replay data/replays/<file>.tdr ...
+    for path in sys.argv[1:]:
+        replay = Replay.load(path)
+        start = time.perf_counter()
+        sim = play(replay)
+        elapsed = time.perf_counter() - start
+        match_seconds = replay.ticks / replay.tick_rate
+        status = 'ok' if sim.winner == replay.winner else f'MISMATCH (recorded {replay.winner})'
+        print(f'{path}: {replay.ticks} ticks, winner {sim.winner} {status}, '
+              f'{match_seconds:.1f}s of play in {elapsed * 1000:.1f} ms '
+              f'({match_seconds / max(elapsed, 1e-9):.0f}x real time)')
@@ -0,0 +1,37 @@
+# Match score, shared by GameManager.end_game and the headless balance tools.
+
+BASE_SCORE = 1000
+# Points lost per simulated second
+TIME_PENALTY = 5
+# The stats multiplier is clamped to this range
+MULTIPLIER_MIN = 0.1
+MULTIPLIER_MAX = 2.0
+
+
+def stats_multiplier(stats, defaults):
+    """
+    Product of per-stat ratios against the defaults, clamped: stronger stats than
+    the defaults (or a shorter shot_delay) score less, weaker ones more.
+    """
+    product = 1.0
+    for stat, df in defaults.items():
+        cur = stats[stat]
+        if stat == 'shot_delay':
+            # higher delay = disadvantage → multiplier >1; lower = advantage → <1
+            m = cur / df if df != 0 else 1.0
+        else:
+            # higher stat = advantage → multiplier <1; lower = disadvantage → >1
+            m = df / cur if cur != 0 else 1.0
+        product *= m
+    return max(MULTIPLIER_MIN, min(product, MULTIPLIER_MAX))
+
+
+def match_score(elapsed, hp_lost, hp_penalty, stats, defaults):
+    """
+    (score, multiplier) of the winner: base score minus time and lost health,
+    scaled by stats_multiplier(stats, defaults).
+    """
+    raw = BASE_SCORE - int(elapsed * TIME_PENALTY) - (hp_lost * hp_penalty)
+    raw = max(0, raw)
+    multiplier = stats_multiplier(stats, defaults)
+    return max(0, int(raw * multiplier)), multiplier
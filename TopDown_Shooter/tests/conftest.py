@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Game modules are imported from TopDown_Shooter/, like when main.py runs
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
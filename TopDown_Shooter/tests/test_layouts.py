@@ -0,0 +1,106 @@
+import math
+import random
+import itertools
+
+import pytest
+
+from simulation.arena import COVER_COUNT, COVER_MIN_SPACING, SPAWN_CLEARANCE, spawn_exclusions
+from simulation.layouts import (
+    CANDIDATES, LayoutBank, enumerate_layouts, mask_to_positions, positions_to_mask, _bank_key,
+)
+
+
+def _brute_force_counts(exclude_positions):
+    safe = [
+        i for i, (x, z) in enumerate(CANDIDATES)
+        if not any(abs(x - sx) < SPAWN_CLEARANCE and abs(z - sz) < SPAWN_CLEARANCE
+                   for sx, sz in exclude_positions)
+    ]
+    too_close = {
+        (i, j) for i, j in itertools.combinations(safe, 2)
+        if math.dist(CANDIDATES[i], CANDIDATES[j]) < COVER_MIN_SPACING
+    }
+    return {
+        count: sum(1 for combo in itertools.combinations(safe, count)
+                   if not any(pair in too_close for pair in itertools.combinations(combo, 2)))
+        for count in range(COVER_COUNT[0], COVER_COUNT[1] + 1)
+    }
+
+
+@pytest.fixture(scope='module')
+def layouts():
+    return enumerate_layouts(spawn_exclusions())
+
+
+@pytest.fixture(scope='module')
+def bank_file(tmp_path_factory):
+    return str(tmp_path_factory.mktemp('layouts') / 'cover_layouts.bin')
+
+
+def test_enumeration_counts_match_brute_force(layouts):
+    counts = {count: len(masks) for count, masks in layouts.items()}
+    assert counts == _brute_force_counts(spawn_exclusions())
+
+
+def test_every_layout_is_valid_and_unique(layouts):
+    for count, masks in layouts.items():
+        assert len(set(masks)) == len(masks)
+        for mask in masks[::97]:
+            positions = mask_to_positions(mask)
+            assert len(positions) == count
+            assert positions_to_mask(positions) == mask
+            for a, b in itertools.combinations(positions, 2):
+                assert math.dist(a, b) >= COVER_MIN_SPACING
+
+
+def test_save_load_round_trip(bank_file):
+    key = _bank_key(spawn_exclusions())
+    bank = LayoutBank.build()
+    bank.save(bank_file, key)
+    loaded = LayoutBank.load(bank_file, key)
+    assert loaded.counts == bank.counts
+    assert loaded.layouts == bank.layouts
+
+
+def test_stale_key_is_rejected(bank_file):
+    LayoutBank.build().save(bank_file, _bank_key(spawn_exclusions()))
+    with pytest.raises(ValueError):
+        LayoutBank.load(bank_file, _bank_key([(0, 0)]))
+
+
+@pytest.mark.parametrize('corrupt', [
+    lambda data: data[:30],            # cut in the middle of a group header
+    lambda data: data[:-5],            # cut in the middle of the masks
+    lambda data: data + b'\0',         # trailing garbage
+    lambda data: b'',                  # empty file
+])
+def test_corrupt_file_is_rebuilt(bank_file, corrupt):
+    key = _bank_key(spawn_exclusions())
+    bank = LayoutBank.build()
+    bank.save(bank_file, key)
+    with open(bank_file, 'rb') as f:
+        data = f.read()
+    with open(bank_file, 'wb') as f:
+        f.write(corrupt(data))
+
+    with pytest.raises(ValueError):
+        LayoutBank.load(bank_file, key)
+    rebuilt = LayoutBank.load_or_build(path=bank_file)
+    assert rebuilt.layouts == bank.layouts
+    # and the rebuilt bank was written back
+    assert LayoutBank.load(bank_file, key).layouts == bank.layouts
+
+
+def test_pick_with_every_size_weighted_out_falls_back_to_uniform():
+    bank = LayoutBank.build()
+    bank.set_weights(lambda mask: 0)
+    positions = bank.pick(random.Random(1))
+    assert COVER_COUNT[0] <= len(positions) <= COVER_COUNT[1]
+
+
+def test_weights_exclude_zero_scored_layouts():
+    bank = LayoutBank.build()
+    allowed = set(bank.layouts[COVER_COUNT[0]][:3])
+    bank.set_weights(lambda mask: 1.0 if mask in allowed else 0.0)
+    rng = random.Random(2)
+    assert all(bank.pick_mask(rng) in allowed for _ in range(200))
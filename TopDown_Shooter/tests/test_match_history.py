@@ -0,0 +1,66 @@
+import datetime
+
+import pytest
+
+from utils.match_history import MatchHistory
+from utils.persistence import flush_pending_writes
+
+NOW = datetime.datetime(2026, 10, 14, 12).timestamp()   # a Wednesday
+LAST_WEEK = NOW - 7 * 86400
+
+
+@pytest.fixture
+def history(tmp_path):
+    history = MatchHistory(str(tmp_path / 'history.sqlite3'), leaderboard_csv='')
+    yield history
+    history.close()
+
+
+def _record(history, name, score, played_at=NOW):
+    match_id = history.record_match('Player 1', score, 30.0, 10.0, 1.0, played_at=played_at)
+    if name:
+        history.set_name(match_id, name)
+    return match_id
+
+
+def test_ids_are_handed_out_before_the_rows_are_written(history):
+    first = _record(history, None, 10)
+    second = _record(history, None, 20)
+    assert second == first + 1
+
+
+def test_names_show_up_before_and_after_the_writer_commits(history):
+    _record(history, 'AAA', 300)
+    _record(history, None, 999)          # not saved: never on the board
+    _record(history, 'BBB', 200, played_at=LAST_WEEK)
+    expected = {
+        'all': [{'name': 'AAA', 'score': 300}, {'name': 'BBB', 'score': 200}],
+        'week': [{'name': 'AAA', 'score': 300}],
+        'day': [{'name': 'AAA', 'score': 300}],
+    }
+    for period, entries in expected.items():
+        assert history.top_scores(period, now=NOW) == entries
+    flush_pending_writes()
+    for period, entries in expected.items():
+        assert history.top_scores(period, now=NOW) == entries
+
+
+def test_name_saved_after_the_insert_was_committed(history):
+    match_id = _record(history, None, 50)
+    flush_pending_writes()
+    history.set_name(match_id, 'CCC')
+    assert history.top_scores(now=NOW) == [{'name': 'CCC', 'score': 50}]
+
+
+def test_limit_and_reopen(tmp_path):
+    path = str(tmp_path / 'history.sqlite3')
+    history = MatchHistory(path, leaderboard_csv='')
+    for score in range(15):
+        _record(history, f'P{score}', score)
+    assert [e['score'] for e in history.top_scores(limit=3, now=NOW)] == [14, 13, 12]
+    history.close()
+
+    reopened = MatchHistory(path, leaderboard_csv='')
+    assert [e['score'] for e in reopened.top_scores(limit=3, now=NOW)] == [14, 13, 12]
+    assert _record(reopened, None, 0) == 16
+    reopened.close()
@@ -0,0 +1,60 @@
+import time
+import threading
+
+from utils import persistence
+from utils.persistence import CachedFile, flush_pending_writes, write_behind
+
+
+def test_exit_flush_runs_jobs_the_writer_already_took(monkeypatch):
+    monkeypatch.setattr(persistence, 'WRITE_DELAY', 0.0)
+    started = threading.Event()
+    done = []
+
+    def job(i):
+        def run():
+            started.set()
+            time.sleep(0.05)
+            done.append(i)
+        return run
+
+    for i in range(3):
+        write_behind(job(i), f'job {i}')
+    # the writer thread has taken the whole batch and is inside the first job
+    assert started.wait(2)
+    flush_pending_writes()
+    assert done == [0, 1, 2]
+
+
+def test_job_runs_once():
+    calls = []
+    job = write_behind(lambda: calls.append(1), 'once')
+    job.flush()
+    job.flush()
+    flush_pending_writes()
+    assert calls == [1]
+
+
+
+def test_invalidate_rereads_the_file(tmp_path):
+    path = tmp_path / 'value.txt'
+    path.write_text('1')
+    reads = []
+
+    def read(f):
+        reads.append(1)
+        return f.read()
+
+    cached = CachedFile(str(path), read, lambda f, data: f.write(data), default=str)
+    try:
+        assert cached.get() == '1'
+        assert cached.get() == '1'
+        assert len(reads) == 1
+        cached.invalidate()
+        assert cached.get() == '1'
+        assert len(reads) == 2
+        # a change not written yet is still what get() returns
+        cached.set('2')
+        cached.invalidate()
+        assert cached.get() == '2'
+    finally:
+        cached.close()
@@ -0,0 +1,102 @@
+import random
+
+import pytest
+
+from simulation.bots import Bot
+from simulation.replay import (
+    INPUT_STEPS, Replay, ReplayRecorder, STAT_KEYS, play, quantize_input,
+    _read_varint, _unzigzag, _write_varint, _zigzag,
+)
+from simulation.match import MatchSimulation, PlayerInput
+from utils.settings_manager import DEFAULTS
+
+VALUES = [0, 1, 127, 128, 255, 300, 16383, 16384, 2 ** 32 - 1, 2 ** 63 + 5]
+
+
+@pytest.mark.parametrize('value', VALUES)
+def test_varint_round_trip(value):
+    out = bytearray()
+    _write_varint(out, value)
+    assert len(out) == max(1, (value.bit_length() + 6) // 7)
+    assert _read_varint(bytes(out), 0) == (value, len(out))
+
+
+def test_varints_back_to_back():
+    out = bytearray(b'xx')
+    for value in VALUES:
+        _write_varint(out, value)
+    pos, decoded = 2, []
+    while pos < len(out):
+        value, pos = _read_varint(out, pos)
+        decoded.append(value)
+    assert decoded == VALUES
+
+
+@pytest.mark.parametrize('value', [0, 1, -1, 2, -2, 63, -64, 1000, -1000])
+def test_zigzag_round_trip(value):
+    encoded = _zigzag(value)
+    assert encoded >= 0
+    assert _unzigzag(encoded) == value
+    # small magnitudes stay small
+    assert encoded <= 2 * abs(value)
+
+
+def _replay():
+    stats = [{key: float(i + j) for j, (key, _) in enumerate(STAT_KEYS)} for i in range(2)]
+    events = [
+        (0, [(INPUT_STEPS, 0, True), (0, 0, False)]),
+        (5, [(INPUT_STEPS, -INPUT_STEPS, True), (-3, 7, False)]),
+        (900, [(0, 0, False), (-3, 7, True)]),
+    ]
+    return Replay(120, 2 ** 31 + 7, [(-10, 0), (15, 8)], stats, events, 1000, 1)
+
+
+def test_replay_bytes_round_trip():
+    replay = _replay()
+    decoded = Replay.from_bytes(replay.to_bytes())
+    for attr in ('tick_rate', 'seed', 'cover_positions', 'stats', 'events', 'ticks', 'winner'):
+        assert getattr(decoded, attr) == getattr(replay, attr)
+
+
+def test_replay_inputs_follow_the_events():
+    inputs = list(_replay().inputs())
+    assert len(inputs) == 1000
+    assert inputs[0] == inputs[4] == [PlayerInput(1.0, 0.0, True), PlayerInput(0.0, 0.0, False)]
+    assert inputs[5][1] == PlayerInput(-3 / INPUT_STEPS, 7 / INPUT_STEPS, False)
+    assert inputs[999][0] == PlayerInput(0.0, 0.0, False)
+
+
+def test_replay_save_load(tmp_path):
+    path = str(tmp_path / 'match_1.tdr')
+    replay = _replay()
+    replay.save(path)
+    assert Replay.load(path).events == replay.events
+    assert not [p for p in tmp_path.iterdir() if p.name.endswith('.tmp')]
+
+
+def test_not_a_replay():
+    with pytest.raises(ValueError):
+        Replay.from_bytes(b'nope')
+
+
+@pytest.mark.parametrize('seed', [1, 2, 3])
+def test_recorded_bot_match_replays_identically(seed):
+    # Recorded the way GameManager records a real match
+    rng = random.Random(seed)
+    covers = [(-10, 0), (0, 8), (15, 0), (0, -8)]
+    sim = MatchSimulation()
+    for player in sim.players:
+        player.apply_stats(DEFAULTS[player.name])
+    sim.reset(covers)
+    recorder = ReplayRecorder(sim, seed, covers)
+    bots = [Bot(random.Random(rng.getrandbits(32))) for _ in range(2)]
+    while not sim.over and sim.tick < 120 * 60:
+        inputs = [quantize_input(bot(sim, i)) for i, bot in enumerate(bots)]
+        recorder.record(inputs)
+        sim.step(inputs)
+    assert sim.over
+
+    replayed = play(Replay.from_bytes(recorder.finish(sim.winner).to_bytes()))
+    assert (replayed.tick, replayed.winner) == (sim.tick, sim.winner)
+    for a, b in zip(replayed.players, sim.players):
+        assert (a.x, a.z, a.rotation_y, a.health) == (b.x, b.z, b.rotation_y, b.health)
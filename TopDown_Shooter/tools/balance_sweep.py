@@ -0,0 +1,205 @@
+"""
+Bot-vs-bot balance sweeps over the player stats (utils/settings_manager.STAT_LIMITS).
+
+    python -m tools.balance_sweep                       # one stat at a time, 200 matches per value
+    python -m tools.balance_sweep --mode random --configs 500 --matches 50
+    python -m tools.balance_sweep --stats shot_power shot_delay --workers 4
+
+Each config gives the tested player some stats and faces an opponent on the
+defaults; seats alternate so spawn side does not skew the result. Matches run
+headlessly (simulation/ + simulation/bots.py) on a process pool using every
+core, and each result is appended to a JSON-lines file as soon as it comes back,
+so an interrupted sweep keeps what it finished. A per-config summary (win rate,
+mean match time, score percentiles with the end_game formula) is printed and
+written as CSV next to it.
+"""
+import os
+import sys
+import csv
+import json
+import time
+import random
+import argparse
+import itertools
+import multiprocessing
+
+from simulation.match import MatchSimulation, TICK_RATE
+from simulation.bots import Bot
+from simulation.layouts import LayoutBank
+from simulation.scoring import match_score
+from utils.settings_manager import STAT_LIMITS, DEFAULTS
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+OUTPUT_DIR = os.path.join(HERE, '..', 'data', 'balance')
+
+# Matches still running after this many simulated seconds count as draws
+MAX_MATCH_TIME = 120
+# GameManager gives both players the same penalty per HP lost
+HP_PENALTY = 2
+
+_bank = None
+
+
+def _grid(stat):
+    low, high, step = STAT_LIMITS[stat]
+    count = int(round((high - low) / step))
+    return [round(low + i * step, 6) for i in range(count + 1)]
+
+
+def axis_configs(stats):
+    """
+    Defaults with one stat changed, for every value of every stat in stats.
+    """
+    base = DEFAULTS['Player 1']
+    configs = []
+    for stat in stats:
+        for value in _grid(stat):
+            configs.append({**base, stat: value})
+    return configs
+
+
+def random_configs(count, rng):
+    return [{stat: rng.choice(_grid(stat)) for stat in STAT_LIMITS} for _ in range(count)]
+
+
+def _init_worker(bank):
+    global _bank
+    _bank = bank
+
+
+def play_match(job):
+    """
+    One headless match of the tested stats against the defaults. job is
+    (config id, stats, seed, tick rate); returns a JSON-able result dict.
+    """
+    config_id, stats, seed, tick_rate = job
+    rng = random.Random(seed)
+    seat = seed % 2    # seat of the tested player
+    sim = MatchSimulation(tick_rate=tick_rate)
+    sim.players[seat].apply_stats(stats)
+    sim.players[1 - seat].apply_stats(DEFAULTS['Player 1'])
+    sim.reset(_bank.pick(rng))
+    bots = [Bot(random.Random(rng.getrandbits(32))) for _ in range(2)]
+    winner = sim.play(bots, max_ticks=int(MAX_MATCH_TIME * tick_rate))
+
+    elapsed = sim.tick * sim.dt
+    result = {'config': config_id, 'seed': seed, 'seat': seat, 'time': round(elapsed, 4),
+              'outcome': 'draw', 'score': None}
+    if winner is not None:
+        won = winner == seat
+        result['outcome'] = 'win' if won else 'loss'
+        player = sim.players[winner]
+        winner_stats = stats if won else DEFAULTS['Player 1']
+        score, _ = match_score(elapsed, player.health_max - player.health, HP_PENALTY,
+                               winner_stats, DEFAULTS['Player 1'])
+        result['score'] = score
+    return result
+
+
+class _Summary:
+    """
+    Running per-config totals of the streamed results.
+    """
+
+    def __init__(self, configs):
+        self.configs = configs
+        self.outcomes = {i: {'win': 0, 'loss': 0, 'draw': 0} for i in range(len(configs))}
+        self.time = {i: 0.0 for i in range(len(configs))}
+        self.win_scores = {i: [] for i in range(len(configs))}
+
+    def add(self, result):
+        i = result['config']
+        self.outcomes[i][result['outcome']] += 1
+        self.time[i] += result['time']
+        if result['outcome'] == 'win':
+            self.win_scores[i].append(result['score'])
+
+    def rows(self):
+        base = DEFAULTS['Player 1']
+        for i, stats in enumerate(self.configs):
+            o = self.outcomes[i]
+            played = sum(o.values())
+            if not played:
+                continue
+            scores = sorted(self.win_scores[i])
+            pct = lambda f: scores[min(len(scores) - 1, int(f * len(scores)))] if scores else ''
+            changed = {s: v for s, v in stats.items() if v != base[s]}
+            yield {
+                'config': i,
+                'changed': ' '.join(f'{s}={v:g}' for s, v in changed.items()) or 'defaults',
+                'matches': played,
+                'win_rate': round(o['win'] / played, 4),
+                'draw_rate': round(o['draw'] / played, 4),
+                'mean_time': round(self.time[i] / played, 3),
+                'score_p10': pct(0.1),
+                'score_p50': pct(0.5),
+                'score_p90': pct(0.9),
+                **stats,
+            }
+
+
+def run_sweep(configs, matches, workers, out_path, tick_rate=TICK_RATE, seed=0):
+    jobs = [(config_id, stats, seed + config_id * matches + m, tick_rate)
+            for config_id, stats in enumerate(configs) for m in range(matches)]
+    summary = _Summary(configs)
+    bank = LayoutBank.load_or_build()
+
+    os.makedirs(os.path.dirname(out_path), exist_ok=True)
+    start = time.perf_counter()
+    with open(out_path, 'w') as out, multiprocessing.Pool(workers, _init_worker, (bank,)) as pool:
+        for done, result in enumerate(pool.imap_unordered(play_match, jobs, chunksize=32), 1):
+            out.write(json.dumps(result) + '\n')
+            summary.add(result)
+            if done % 1000 == 0 or done == len(jobs):
+                out.flush()
+                rate = done / (time.perf_counter() - start)
+                print(f'\r{done}/{len(jobs)} matches ({rate:.0f}/s)', end='', flush=True)
+    print()
+    return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='TopDown self-play balance sweep')
+    parser.add_argument('--mode', choices=('axis', 'random'), default='axis',
+                        help='axis: one stat at a time over its range; random: random stat sets')
+    parser.add_argument('--stats', nargs='+', choices=list(STAT_LIMITS), default=list(STAT_LIMITS),
+                        help='stats to sweep in axis mode')
+    parser.add_argument('--configs', type=int, default=200, help='number of random configs')
+    parser.add_argument('--matches', type=int, default=200, help='matches per config')
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--tick-rate', type=int, default=TICK_RATE)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--out', help='results file (.jsonl); default data/balance/sweep_<time>.jsonl')
+    args = parser.parse_args(argv)
+
+    if args.mode == 'axis':
+        configs = axis_configs(args.stats)
+    else:
+        configs = random_configs(args.configs, random.Random(args.seed))
+    out_path = args.out or os.path.join(OUTPUT_DIR, time.strftime('sweep_%Y%m%d_%H%M%S.jsonl'))
+    out_path = os.path.abspath(out_path)
+    print(f'{len(configs)} configs × {args.matches} matches on {args.workers} workers → {out_path}')
+
+    summary = run_sweep(configs, args.matches, args.workers, out_path, args.tick_rate, args.seed)
+    rows = list(summary.rows())
+    if not rows:
+        print('no matches finished, nothing to summarize')
+        return 1
+
+    csv_path = os.path.splitext(out_path)[0] + '_summary.csv'
+    with open(csv_path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+    # Most unbalanced first
+    print(f"{'config':<40}{'win%':>7}{'draw%':>7}{'time':>8}{'p10':>7}{'p50':>7}{'p90':>7}")
+    for row in sorted(rows, key=lambda r: -abs(r['win_rate'] - 0.5)):
+        print(f"{row['changed']:<40}{row['win_rate']:>7.1%}{row['draw_rate']:>7.1%}{row['mean_time']:>8.1f}"
+              f"{row['score_p10']!s:>7}{row['score_p50']!s:>7}{row['score_p90']!s:>7}")
+    print(f'summary written to {csv_path}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
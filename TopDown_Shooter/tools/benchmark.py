@@ -0,0 +1,315 @@
+"""
+Headless benchmarks for the TopDown hot paths (no window, no Ursina).
+
+    python -m tools.benchmark                    # run, compare with the baseline
+    python -m tools.benchmark --save-baseline    # run and store the results as the baseline
+    python -m tools.benchmark --filter projectiles --json results.json
+
+Each benchmark reports the best per-operation time over a few repeats, in
+microseconds. When a baseline exists, any benchmark slower than it by more than
+--tolerance fails the run (exit code 1), so a regression cannot go unnoticed.
+Baselines are machine-specific: store one on the machine you compare on.
+"""
+import os
+import sys
+import math
+import json
+import time
+import random
+import shutil
+import argparse
+import tempfile
+
+from simulation.arena import PLAYER_BOUNDS, spawn_exclusions
+from simulation.match import MatchSimulation, ProjectileState, PlayerInput, IDLE_INPUT
+from simulation.layouts import LayoutBank
+from utils.persistence import CachedFile
+from utils.file_manager import _read_leaderboard, _write_leaderboard
+from utils.settings_manager import _read_settings, _write_settings, DEFAULTS
+from utils.match_history import MatchHistory, _day_and_week
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+BASELINE_PATH = os.path.join(HERE, 'benchmark_baseline.json')
+
+# Slower than the baseline by more than this fraction = regression
+TOLERANCE = 0.25
+REPEATS = 5
+
+BENCHMARKS = []
+_bank = None
+
+
+def benchmark(name):
+    """
+    Register fn(rng) -> (run, ops): run() is timed and performs ops operations.
+    Whatever fn does before returning run is setup and is not timed.
+    """
+    def register(fn):
+        BENCHMARKS.append((name, fn))
+        return fn
+    return register
+
+
+def _measure(setup, repeats):
+    best = None
+    for i in range(repeats):
+        run, ops = setup(random.Random(i))
+        start = time.perf_counter()
+        run()
+        per_op = (time.perf_counter() - start) / ops
+        best = per_op if best is None else min(best, per_op)
+    return best * 1e6
+
+
+def _layout_bank():
+    # Built in memory once, so benchmarking never writes the game's data folder
+    global _bank
+    if _bank is None:
+        _bank = LayoutBank.build()
+    return _bank
+
+
+# ─── SIMULATION ─────────────────────────────────────────────────────────────────
+
+def _random_point(rng, margin=1.0):
+    return (rng.uniform(-PLAYER_BOUNDS[0] + margin, PLAYER_BOUNDS[0] - margin),
+            rng.uniform(-PLAYER_BOUNDS[1] + margin, PLAYER_BOUNDS[1] - margin))
+
+
+def _projectile_setup(count, batched):
+    steps = 20
+
+    def setup(rng):
+        sim = MatchSimulation(batched_projectiles=batched)
+        sim.reset(_layout_bank().pick(rng))
+        # slow shots, so nearly all of them stay alive over the timed ticks
+        for i in range(count):
+            x, z = _random_point(rng)
+            angle = rng.uniform(0, 2 * math.pi)
+            dx, dz = math.sin(angle), math.cos(angle)
+            if batched:
+                sim.batch.spawn(i % 2, x, z, dx, dz, 1.0, 0)
+            else:
+                sim.projectiles.append(ProjectileState(i, i % 2, x, z, dx, dz, 1.0, 0))
+
+        def run():
+            for _ in range(steps):
+                sim.step((IDLE_INPUT, IDLE_INPUT))
+        return run, steps
+    return setup
+
+
+for _count in (10, 100, 1000, 10000):
+    benchmark(f'projectiles.objects.{_count}')(_projectile_setup(_count, False))
+    benchmark(f'projectiles.batched.{_count}')(_projectile_setup(_count, True))
+
+
+def _movement_setup(covers):
+    ticks = 2000
+
+    def setup(rng):
+        sim = MatchSimulation()
+        # arbitrary (overlapping allowed) cover boxes, denser than real layouts
+        sim.reset([_random_point(rng, margin=2) for _ in range(covers)])
+        # both players turn while walking forward, bumping into whatever is there
+        inputs = (PlayerInput(0.3, 1.0, False), PlayerInput(-0.5, 1.0, False))
+
+        def run():
+            for _ in range(ticks):
+                sim.step(inputs)
+        return run, ticks
+    return setup
+
+
+for _covers in (0, 6, 20, 50):
+    benchmark(f'movement.covers.{_covers}')(_movement_setup(_covers))
+
+
+# ─── COVER LAYOUTS ──────────────────────────────────────────────────────────────
+
+@benchmark('covers.pick')
+def _covers_pick(rng):
+    bank = _layout_bank()
+    picks = 10000
+
+    def run():
+        for _ in range(picks):
+            bank.pick(rng)
+    return run, picks
+
+
+@benchmark('covers.build')
+def _covers_build(rng):
+    exclude = spawn_exclusions()
+    return (lambda: LayoutBank.build(exclude)), 1
+
+
+# ─── FILES ──────────────────────────────────────────────────────────────────────
+
+def _leaderboard_file(folder, rows, rng):
+    path = os.path.join(folder, 'leaderboard.csv')
+    entries = [{'name': f'P{i}', 'score': rng.randrange(5000)} for i in range(rows)]
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        _write_leaderboard(f, entries)
+    return path
+
+
+def _leaderboard_setup(rows, mode):
+    def setup(rng):
+        folder = tempfile.mkdtemp(prefix='topdown-bench-')
+        path = _leaderboard_file(folder, rows, rng)
+        cached = CachedFile(path, _read_leaderboard, _write_leaderboard, default=list)
+        cached.get()
+        loops = 1 if mode != 'hot' else 1000
+
+        def run():
+            try:
+                for _ in range(loops):
+                    if mode == 'cold':
+                        cached.invalidate()   # force a parse, as after an external edit
+                        cached.get()
+                    elif mode == 'hot':
+                        cached.get()
+                    else:
+                        cached.set(cached.get())
+                        cached.flush()
+            finally:
+                cached.close()
+                shutil.rmtree(folder, ignore_errors=True)
+        return run, loops
+    return setup
+
+
+for _rows in (10, 10000, 100000):
+    benchmark(f'leaderboard.load_cold.{_rows}')(_leaderboard_setup(_rows, 'cold'))
+benchmark('leaderboard.load_hot')(_leaderboard_setup(10, 'hot'))
+benchmark('leaderboard.save')(_leaderboard_setup(10, 'save'))
+
+
+@benchmark('history.top_scores.100000')
+def _history_top_scores(rng):
+    folder = tempfile.mkdtemp(prefix='topdown-bench-')
+    history = MatchHistory(os.path.join(folder, 'history.sqlite3'), leaderboard_csv='')
+    now = time.time()
+    rows = []
+    for i in range(100000):
+        played_at = now - rng.uniform(0, 30 * 86400)
+        day, week = _day_and_week(played_at)
+        # a third of the matches had their score saved
+        name = f'P{i}' if i % 3 == 0 else None
+        rows.append((played_at, day, week, 'Player 1', name, rng.randrange(5000)))
+    with history.conn:
+        history.conn.executemany(
+            'INSERT INTO matches (played_at, day, week, winner, name, score) VALUES (?, ?, ?, ?, ?, ?)', rows
+        )
+    queries = 300
+
+    def run():
+        try:
+            for i in range(queries):
+                history.top_scores(('all', 'day', 'week')[i % 3], now=now)
+        finally:
+            history.close()
+            shutil.rmtree(folder, ignore_errors=True)
+    return run, queries
+
+
+def _settings_setup(mode):
+    def setup(rng):
+        folder = tempfile.mkdtemp(prefix='topdown-bench-')
+        path = os.path.join(folder, 'settings.csv')
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            _write_settings(f, DEFAULTS)
+        cached = CachedFile(path, _read_settings, _write_settings, default=lambda: DEFAULTS)
+        cached.get()
+        loops = 1000
+
+        def run():
+            try:
+                for _ in range(loops):
+                    if mode == 'cold':
+                        cached.invalidate()
+                    cached.get()
+            finally:
+                cached.close()
+                shutil.rmtree(folder, ignore_errors=True)
+        return run, loops
+    return setup
+
+
+benchmark('settings.load_cold')(_settings_setup('cold'))
+benchmark('settings.load_hot')(_settings_setup('hot'))
+
+
+# ─── RUNNER ─────────────────────────────────────────────────────────────────────
+
+def run_benchmarks(name_filter=None, repeats=REPEATS):
+    results = {}
+    for name, setup in BENCHMARKS:
+        if name_filter and name_filter not in name:
+            continue
+        results[name] = _measure(setup, repeats)
+        print(f'{name:<36}{results[name]:>14.2f} us')
+    return results
+
+
+def compare(results, baseline, tolerance=TOLERANCE):
+    """
+    Print each result against the baseline; returns the names that regressed.
+    """
+    regressions = []
+    for name, value in results.items():
+        base = baseline.get(name)
+        if base is None:
+            print(f'{name:<36}{value:>14.2f} us   (new)')
+            continue
+        change = value / base - 1 if base else 0.0
+        flag = ''
+        if change > tolerance:
+            flag = '  REGRESSION'
+            regressions.append(name)
+        print(f'{name:<36}{value:>14.2f} us {change:>+8.1%}{flag}')
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='TopDown headless benchmarks')
+    parser.add_argument('--filter', help='only run benchmarks whose name contains this')
+    parser.add_argument('--repeats', type=int, default=REPEATS)
+    parser.add_argument('--json', help='also write the results to this file')
+    parser.add_argument('--baseline', default=BASELINE_PATH)
+    parser.add_argument('--save-baseline', action='store_true',
+                        help='store these results as the baseline (merged with existing entries)')
+    parser.add_argument('--tolerance', type=float, default=TOLERANCE)
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.filter, args.repeats)
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    if args.save_baseline:
+        baseline.update(results)
+        with open(args.baseline, 'w') as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+        print(f'baseline saved to {args.baseline}')
+        return 0
+
+    if not baseline:
+        print('no baseline yet: run with --save-baseline to store one')
+        return 0
+    print()
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print(f'{len(regressions)} regression(s) over {args.tolerance:.0%}: {", ".join(regressions)}')
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,9 +1,77 @@
-from ursina import Text, Vec2, color
+import time
+from ursina import Entity, Mesh, Text, Vec2, color
+
+# Health bars, in camera.ui units, drawn just under the HP texts
+BAR_WIDTH = 0.25
+BAR_HEIGHT = 0.015
+BAR_OFFSET_Y = -0.05
+
+
+class HealthBar:
+    """
+    A dark background quad with a fill quad on top. The fill is a 4-vertex Mesh
+    whose inner edge is moved in place when health changes, so no new geometry
+    is created during a match.
+    - grow_right: the fill is anchored on the left edge (P1); otherwise on the right (P2)
+    """
+
+    def __init__(self, position, fill_color, grow_right=True):
+        self.grow_right = grow_right
+        self.fraction = None   # last drawn fill fraction
+        self.background = Entity(
+            parent=None,
+            model='quad',
+            origin=(-0.5 if grow_right else 0.5, 0),
+            scale=(BAR_WIDTH, BAR_HEIGHT),
+            position=position,
+            color=color.dark_gray,
+            enabled=False
+        )
+        self.mesh = Mesh(
+            vertices=self._vertices(1.0),
+            # mirrored bars keep the winding facing the camera
+            triangles=[(0, 1, 2), (0, 2, 3)] if grow_right else [(0, 2, 1), (0, 3, 2)],
+            static=False
+        )
+        self.fill = Entity(
+            parent=None,
+            model=self.mesh,
+            position=(position[0], position[1], -0.01),   # in front of the background
+            color=fill_color,
+            enabled=False
+        )
+
+    def _vertices(self, fraction):
+        # Quad corners in camera.ui units, relative to the anchored edge
+        w = BAR_WIDTH * fraction if self.grow_right else -BAR_WIDTH * fraction
+        h = BAR_HEIGHT / 2
+        return [(0, -h, 0), (w, -h, 0), (w, h, 0), (0, h, 0)]
+
+    def attach_to_ui(self, ui_parent):
+        self.background.parent = ui_parent
+        self.fill.parent = ui_parent
+
+    def set_enabled(self, enabled):
+        self.background.enabled = enabled
+        self.fill.enabled = enabled
+
+    def set_fraction(self, fraction):
+        fraction = min(1.0, max(0.0, fraction))
+        if fraction == self.fraction:
+            return
+        self.fraction = fraction
+        self.mesh.vertices = self._vertices(fraction)
+        self.mesh.generate()
 
 
 class HUD:
     """
     Displays the timer and each player’s HP in the corners.
+    Retained mode: update() only touches a Text when the value it shows changes
+    (Ursina rebuilds a Text's glyph geometry on every .text assignment), the timer
+    is compared at its displayed 0.1 s precision, and text_rebuilds_per_second
+    reports how many rebuilds actually happened (shown by the profiler overlay and
+    written to its dump as the hud.text_rebuilds_per_s counter).
     """
 
     def __init__(self):
@@ -35,6 +103,20 @@ class HUD:
             color=color.white,
             enabled=False
         )
+        # Health bars under the HP texts (P2's is anchored on the screen edge side)
+        self.p1_hp_bar = HealthBar((-0.45, 0.45 + BAR_OFFSET_Y), color.azure)
+        self.p2_hp_bar = HealthBar((0.45 + BAR_WIDTH, 0.45 + BAR_OFFSET_Y), color.orange, grow_right=False)
+
+        # Last values written to each Text (matching the initial texts above)
+        self._shown_tenths = 0
+        self._shown_p1_hp = 100
+        self._shown_p2_hp = 100
+
+        # Text rebuild counter
+        self.text_rebuilds = 0
+        self.text_rebuilds_per_second = 0
+        self._rebuilds_window_start = time.perf_counter()
+        self._rebuilds_in_window = 0
 
     def attach_to_ui(self, ui_parent):
         """
@@ -44,23 +126,52 @@ class HUD:
         self.timer_text.parent = ui_parent
         self.p1_hp_text.parent = ui_parent
         self.p2_hp_text.parent = ui_parent
+        self.p1_hp_bar.attach_to_ui(ui_parent)
+        self.p2_hp_bar.attach_to_ui(ui_parent)
 
     def enable(self):
         self.timer_text.enabled = True
         self.p1_hp_text.enabled = True
         self.p2_hp_text.enabled = True
+        self.p1_hp_bar.set_enabled(True)
+        self.p2_hp_bar.set_enabled(True)
 
     def disable(self):
         self.timer_text.enabled = False
         self.p1_hp_text.enabled = False
         self.p2_hp_text.enabled = False
+        self.p1_hp_bar.set_enabled(False)
+        self.p2_hp_bar.set_enabled(False)
+
+    def _set_text(self, text_entity, text):
+        text_entity.text = text
+        self.text_rebuilds += 1
+        self._rebuilds_in_window += 1
 
-    def update(self, elapsed, p1_hp, p2_hp):
+    def update(self, elapsed, p1_hp, p2_hp, p1_hp_max=100, p2_hp_max=100):
         """
         Call every frame (if game_state == 'playing'):
         - elapsed: float seconds since match start
         - p1_hp, p2_hp: current health integers
+        - p1_hp_max, p2_hp_max: full health, for the bars
         """
-        self.timer_text.text = f'Time: {elapsed:.1f}s'
-        self.p1_hp_text.text = f'P1 HP: {p1_hp}'
-        self.p2_hp_text.text = f'P2 HP: {p2_hp}'
+        # Quantize to what is displayed (one decimal), so only a new tenth rebuilds the text
+        tenths = round(elapsed * 10)
+        if tenths != self._shown_tenths:
+            self._shown_tenths = tenths
+            self._set_text(self.timer_text, f'Time: {tenths / 10:.1f}s')
+        if p1_hp != self._shown_p1_hp:
+            self._shown_p1_hp = p1_hp
+            self._set_text(self.p1_hp_text, f'P1 HP: {p1_hp}')
+        if p2_hp != self._shown_p2_hp:
+            self._shown_p2_hp = p2_hp
+            self._set_text(self.p2_hp_text, f'P2 HP: {p2_hp}')
+
+        self.p1_hp_bar.set_fraction(p1_hp / p1_hp_max if p1_hp_max else 0)
+        self.p2_hp_bar.set_fraction(p2_hp / p2_hp_max if p2_hp_max else 0)
+
+        now = time.perf_counter()
+        if now - self._rebuilds_window_start >= 1.0:
+            self.text_rebuilds_per_second = self._rebuilds_in_window / (now - self._rebuilds_window_start)
+            self._rebuilds_window_start = now
+            self._rebuilds_in_window = 0
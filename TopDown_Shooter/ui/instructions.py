@@ -8,29 +8,29 @@ class InstructionsScreen:
 
     def __init__(self, ui_parent, on_back):
         self.on_back = on_back
+        # Every widget hangs off one root, so showing/hiding is a single toggle
+        self.root = Entity(parent=ui_parent, enabled=False)
 
         # Semi-transparent background
         self.instructions_panel = Entity(
-            parent=ui_parent,
+            parent=self.root,
             model='quad',
             color=color.rgba(0, 0, 0, 0.6),
-            scale=(1, 1),
-            enabled=False
+            scale=(1, 1)
         )
 
         # Title
         self.title_text = Text(
-            parent=ui_parent,
+            parent=self.root,
             text='Instructions',
             scale=2,
             position=(0, 0.4),
-            color=color.white,
-            enabled=False
+            color=color.white
         )
 
         # Body instructions
         self.body_text = Text(
-            parent=ui_parent,
+            parent=self.root,
             text=(
                 "Player 1 (Blue):\n"
                 "  Move: Joystick #1\n"
@@ -50,31 +50,24 @@ class InstructionsScreen:
             origin=(0, 0),
             scale=1.2,
             color=color.white,
-            enabled=False,
             line_height=1.3
         )
 
         # Back button
         self.btn_back = Button(
-            parent=ui_parent,
+            parent=self.root,
             text='Back',
             scale=(0.2, 0.1),
             position=(0, -0.4, 0),
             color=color.azure,
-            on_click=on_back,
-            enabled=False
+            on_click=on_back
         )
 
         self.buttons = [self.btn_back]
+        self.focus_index = 0
 
     def show(self):
-        self.instructions_panel.enabled = True
-        self.title_text.enabled = True
-        self.body_text.enabled = True
-        self.btn_back.enabled = True
+        self.root.enabled = True
 
     def hide(self):
-        self.instructions_panel.enabled = False
-        self.title_text.enabled = False
-        self.body_text.enabled = False
-        self.btn_back.enabled = False
\ No newline at end of file
+        self.root.enabled = False
@@ -1,19 +1,28 @@
 from ursina import Entity, Text, Button, color
 
 
+# Period tabs: (period passed to load_entries, button label)
+PERIOD_TABS = [('all', 'All Time'), ('day', 'Today'), ('week', 'This Week')]
+
+
 class LeaderboardScreen:
     """
     Full‐screen panel that shows up to 10 high‐score entries,
-    plus a Back button to return to the previous screen.
+    period tabs (all time / today / this week), plus a Back button
+    to return to the previous screen.
+    load_entries(period) returns the entries to show for a tab.
     """
 
-    def __init__(self, ui_parent, on_back):
+    def __init__(self, ui_parent, on_back, load_entries):
+        self.load_entries = load_entries
+        self.period = 'all'
+        # Every widget hangs off one root, so showing/hiding is a single toggle
+        self.root = Entity(parent=ui_parent, enabled=False)
         self.leaderboard_panel = Entity(
-            parent=ui_parent,
+            parent=self.root,
             model='quad',
             color=color.rgba(0, 0, 0, 0.6),
-            scale=(1, 1),
-            enabled=False
+            scale=(1, 1)
         )
         # 10 lines, stacked vertically
         self.entry_texts = []
@@ -21,33 +30,55 @@ class LeaderboardScreen:
         y_spacing = 0.06
         for i in range(10):
             t = Text(
-                parent=ui_parent,
+                parent=self.root,
                 text='',
                 position=(0, y_start - i * y_spacing),
                 origin=(0, 0),
                 scale=1.2,
-                color=color.white,
-                enabled=False
+                color=color.white
             )
             self.entry_texts.append(t)
 
+        # Period tabs across the top
+        self.tab_buttons = {}
+        for i, (period, label) in enumerate(PERIOD_TABS):
+            self.tab_buttons[period] = Button(
+                parent=self.root,
+                text=label,
+                scale=(0.2, 0.06),
+                position=(-0.25 + i * 0.25, 0.44, 0),
+                color=color.dark_gray,
+                on_click=lambda p=period: self.select_period(p)
+            )
+
         self.btn_back = Button(
-            parent=ui_parent,
+            parent=self.root,
             text='Back',
             scale=(0.2, 0.1),
             position=(0, -0.4, 0),
             color=color.orange,
-            on_click=on_back,
-            enabled=False
+            on_click=on_back
         )
 
-        self.buttons = [self.btn_back]
+        self.buttons = list(self.tab_buttons.values()) + [self.btn_back]
+        # Back is focused whenever the screen opens; the tabs are one move away
+        self.back_index = len(self.buttons) - 1
+        # Button GameManager last focused here, restored when the screen comes back
+        self.focus_index = self.back_index
+
+    def select_period(self, period):
+        """
+        Switch tab and reload the entries for it.
+        """
+        self.show(self.load_entries(period), period)
 
-    def show(self, leaderboard_data):
+    def show(self, leaderboard_data, period='all'):
         """
-        Display the top‐10 entries from leaderboard_data (list of dicts).
+        Display the top‐10 entries from leaderboard_data (list of dicts) under the given period tab.
         """
-        self.leaderboard_panel.enabled = True
+        self.period = period
+        for p, btn in self.tab_buttons.items():
+            btn.color = color.violet if p == period else color.dark_gray
         for i, t in enumerate(self.entry_texts):
             if i < len(leaderboard_data):
                 entry = leaderboard_data[i]
@@ -56,10 +87,7 @@ class LeaderboardScreen:
                 t.enabled = True
             else:
                 t.enabled = False
-        self.btn_back.enabled = True
+        self.root.enabled = True
 
     def hide(self):
-        self.leaderboard_panel.enabled = False
-        for t in self.entry_texts:
-            t.enabled = False
-        self.btn_back.enabled = False
\ No newline at end of file
+        self.root.enabled = False
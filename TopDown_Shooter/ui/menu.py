@@ -2,39 +2,42 @@ from ursina import Entity, Button, color, Text
 
 class MainMenu:
     def __init__(self, ui_parent, on_play, on_settings, on_instructions, on_leaderboard, on_quit):
+        # Every widget hangs off one root, so showing/hiding is a single toggle
+        self.root = Entity(parent=ui_parent, enabled=False)
+
         self.menu_panel = Entity(
-            parent=ui_parent, model='quad',
-            color=color.rgba(0,0,0,0.6), scale=(1,1), enabled=False)
+            parent=self.root, model='quad',
+            color=color.rgba(0,0,0,0.6), scale=(1,1))
 
         self.title = Text(
-            parent=ui_parent, text='Top-Down Shooter',
-            scale=2, position=(0, 0.45), color=color.white, enabled=False)
+            parent=self.root, text='Top-Down Shooter',
+            scale=2, position=(0, 0.45), color=color.white)
 
         # Adjusted Y positions by 0.15 steps
         self.btn_play = Button(
-            parent=ui_parent, text='Play',
+            parent=self.root, text='Play',
             scale=(0.25,0.1), position=(0, 0.2, 0),
-            color=color.azure, on_click=on_play, enabled=False)
+            color=color.azure, on_click=on_play)
 
         self.btn_settings = Button(
-            parent=ui_parent, text='Settings',
+            parent=self.root, text='Settings',
             scale=(0.25,0.1), position=(0, 0.05, 0),
-            color=color.green, on_click=on_settings, enabled=False)
+            color=color.green, on_click=on_settings)
 
         self.btn_instructions = Button(
-            parent=ui_parent, text='Instructions',
+            parent=self.root, text='Instructions',
             scale=(0.25,0.1), position=(0, -0.1, 0),
-            color=color.yellow, on_click=on_instructions, enabled=False)
+            color=color.yellow, on_click=on_instructions)
 
         self.btn_leaderboard = Button(
-            parent=ui_parent, text='Leaderboard',
+            parent=self.root, text='Leaderboard',
             scale=(0.25,0.1), position=(0, -0.25, 0),
-            color=color.violet, on_click=on_leaderboard, enabled=False)
+            color=color.violet, on_click=on_leaderboard)
 
         self.btn_quit = Button(
-            parent=ui_parent, text='Quit',
+            parent=self.root, text='Quit',
             scale=(0.25,0.1), position=(0, -0.4, 0),
-            color=color.red, on_click=on_quit, enabled=False)
+            color=color.red, on_click=on_quit)
 
         # Include Settings in navigation order
         self.buttons = [
@@ -44,15 +47,11 @@ class MainMenu:
             self.btn_leaderboard,
             self.btn_quit
         ]
+        # Button GameManager last focused here, restored when the menu comes back
+        self.focus_index = 0
 
     def show(self):
-        self.menu_panel.enabled = True
-        self.title.enabled = True
-        for btn in self.buttons:
-            btn.enabled = True
+        self.root.enabled = True
 
     def hide(self):
-        self.menu_panel.enabled = False
-        self.title.enabled = False
-        for btn in self.buttons:
-            btn.enabled = False
+        self.root.enabled = False
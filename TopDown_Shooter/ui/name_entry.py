@@ -8,24 +8,24 @@ class NameEntryScreen:
 
     def __init__(self, ui_parent, on_finish):
         self.on_finish = on_finish
+        # Every widget hangs off one root, so showing/hiding is a single toggle
+        self.root = Entity(parent=ui_parent, enabled=False)
 
         # Background
         self.name_panel = Entity(
-            parent=ui_parent,
+            parent=self.root,
             model='quad',
             color=color.rgba(0, 0, 0, 0.6),
-            scale=(1, 1),
-            enabled=False
+            scale=(1, 1)
         )
         # Instructions
         self.name_instr = Text(
-            parent=ui_parent,
+            parent=self.root,
             text='Stick UP/DOWN : letter  LEFT/RIGHT : slot   Button A : confirm',
             position=(0, 0.4),
             origin=(0, 0),
             scale=1,
-            color=color.white,
-            enabled=False
+            color=color.white
         )
         # Six character slots
         self.slot_texts = []
@@ -33,13 +33,12 @@ class NameEntryScreen:
         slot_spacing = 0.06
         for i in range(6):
             t = Text(
-                parent=ui_parent,
+                parent=self.root,
                 text='_',  # blank
                 position=(slot_start_x + i * slot_spacing, 0.2),
                 origin=(0, 0),
                 scale=2,
-                color=color.white,
-                enabled=False
+                color=color.white
             )
             self.slot_texts.append(t)
 
@@ -53,27 +52,21 @@ class NameEntryScreen:
         self.name_slots = [''] * 6
         self.current_slot_index = 0
 
-        # Show UI
-        self.name_panel.enabled = True
-        self.name_instr.enabled = True
         for t in self.slot_texts:
             t.text = '_'          # blank
             t.color = color.white
-            t.enabled = True
 
         # Highlight first slot
         self.slot_texts[0].color = color.yellow
+        self.root.enabled = True
 
     def hide(self):
         """Hide the entry UI."""
-        self.name_panel.enabled = False
-        self.name_instr.enabled = False
-        for t in self.slot_texts:
-            t.enabled = False
+        self.root.enabled = False
 
     def input(self, key):
         """Handle inputs when the entry UI is active."""
-        if not self.name_panel.enabled:
+        if not self.root.enabled:
             return
 
         i = self.current_slot_index
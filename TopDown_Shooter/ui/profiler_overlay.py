@@ -0,0 +1,61 @@
+import time
+from ursina import Text, color
+
+# Seconds between overlay refreshes (each refresh rebuilds the text once)
+REFRESH_INTERVAL = 0.5
+
+
+class ProfilerOverlay:
+    """
+    Small text block in the bottom-left corner listing p50 / p95 / p99 per
+    profiler scope (utils/profiler.py), then the profiler counters. Toggled with F3 by GameManager;
+    showing it also turns the profiler on.
+    """
+
+    def __init__(self, ui_parent, profiler):
+        self.profiler = profiler
+        self.last_refresh = 0.0
+        self.text = Text(
+            parent=ui_parent,
+            text='',
+            position=(-0.85, -0.2),
+            origin=(-0.5, 0.5),
+            scale=0.75,
+            font='VeraMono.ttf',
+            color=color.lime,
+            background=True,
+            enabled=False
+        )
+
+    @property
+    def visible(self):
+        return self.text.enabled
+
+    def toggle(self):
+        show = not self.text.enabled
+        self.text.enabled = show
+        self.profiler.set_enabled(show)
+        if show:
+            self.profiler.reset()
+            self.text.text = 'profiling…'
+
+    def update(self):
+        if not self.text.enabled:
+            return
+        now = time.perf_counter()
+        if now - self.last_refresh < REFRESH_INTERVAL:
+            return
+        self.last_refresh = now
+
+        stats = self.profiler.summary()
+        lines = [f"{'scope':<16}{'p50':>8}{'p95':>8}{'p99':>8}  ms"]
+        # whole frame first, then the costliest scopes
+        for name in sorted(stats, key=lambda n: (n != 'frame', -stats[n]['p95'])):
+            s = stats[name]
+            lines.append(f"{name:<16}{s['p50']:>8.2f}{s['p95']:>8.2f}{s['p99']:>8.2f}")
+        counters = self.profiler.counters
+        for name in sorted(counters):
+            value = counters[name]
+            shown = f'{value:.1f}' if isinstance(value, float) else str(value)
+            lines.append(f"{name:<32}{shown:>8}")
+        self.text.text = '\n'.join(lines)
@@ -16,18 +16,19 @@ class SettingsScreen:
         self.p2_idx = 0
         self.p1_locked = False
         self.p2_locked = False
+        # Every widget hangs off one root, so showing/hiding is a single toggle
+        self.root = Entity(parent=ui_parent, enabled=False)
 
         # Background panel
         self.panel = Entity(
-            parent=ui_parent, model='quad',
-            color=color.rgba(0,0,0,0.6), scale=(1.5, 1.1),
-            enabled=False
+            parent=self.root, model='quad',
+            color=color.rgba(0,0,0,0.6), scale=(1.5, 1.1)
         )
 
         # Title
         self.title = Text(
-            parent=ui_parent, text='Settings',
-            scale=2, y=0.45, color=color.white, enabled=False
+            parent=self.root, text='Settings',
+            scale=2, y=0.45, color=color.white
         )
 
         # Load initial settings
@@ -38,11 +39,11 @@ class SettingsScreen:
         lbl_x, val_x = -0.65, -0.35
         for i, stat in enumerate(self.stats):
             y = 0.25 - i*0.1
-            lbl = Text(parent=ui_parent, text=f'{stat}:', x=lbl_x, y=y,
-                       scale=1, color=color.white, enabled=False)
-            val = Text(parent=ui_parent,
+            lbl = Text(parent=self.root, text=f'{stat}:', x=lbl_x, y=y,
+                       scale=1, color=color.white)
+            val = Text(parent=self.root,
                        text=self.format_val(self.data['Player 1'][stat]),
-                       x=val_x, y=y, scale=1, color=color.white, enabled=False)
+                       x=val_x, y=y, scale=1, color=color.white)
             self.p1_lbls.append((lbl, val))
 
         # Player 2 side labels + values
@@ -50,18 +51,18 @@ class SettingsScreen:
         lbl2_x, val2_x = 0.15, 0.55
         for i, stat in enumerate(self.stats):
             y = 0.25 - i*0.1
-            lbl = Text(parent=ui_parent, text=f'{stat}:', x=lbl2_x, y=y,
-                       scale=1, color=color.white, enabled=False)
-            val = Text(parent=ui_parent,
+            lbl = Text(parent=self.root, text=f'{stat}:', x=lbl2_x, y=y,
+                       scale=1, color=color.white)
+            val = Text(parent=self.root,
                        text=self.format_val(self.data['Player 2'][stat]),
-                       x=val2_x, y=y, scale=1, color=color.white, enabled=False)
+                       x=val2_x, y=y, scale=1, color=color.white)
             self.p2_lbls.append((lbl, val))
 
         # OK buttons, default unlocked = red
-        self.ok1 = Button(parent=ui_parent, text='OK', x=-0.45, y=-0.4,
-                          scale=(0.1, 0.05), color=color.red, enabled=False)
-        self.ok2 = Button(parent=ui_parent, text='OK', x= 0.45, y=-0.4,
-                          scale=(0.1, 0.05), color=color.red, enabled=False)
+        self.ok1 = Button(parent=self.root, text='OK', x=-0.45, y=-0.4,
+                          scale=(0.1, 0.05), color=color.red)
+        self.ok2 = Button(parent=self.root, text='OK', x= 0.45, y=-0.4,
+                          scale=(0.1, 0.05), color=color.red)
 
         # Store original scales for OK buttons
         self.ok1_orig_scale = self.ok1.scale
@@ -75,22 +76,14 @@ class SettingsScreen:
 
     def show(self):
         self.load()
-        self.panel.enabled = True
-        self.title.enabled = True
 
-        # Show stats
+        # Refresh stats
         for (lbl, val), stat in zip(self.p1_lbls, self.stats):
-            lbl.enabled = True
             val.text = self.format_val(self.data['Player 1'][stat])
-            val.enabled = True
         for (lbl, val), stat in zip(self.p2_lbls, self.stats):
-            lbl.enabled = True
             val.text = self.format_val(self.data['Player 2'][stat])
-            val.enabled = True
 
-        # Enable OK buttons, reset color & scale
-        self.ok1.enabled = True
-        self.ok2.enabled = True
+        # Reset OK buttons' color & scale
         self.ok1.color = color.red
         self.ok2.color = color.red
         self.ok1.scale = self.ok1_orig_scale
@@ -105,15 +98,10 @@ class SettingsScreen:
         # Highlight initial fields
         self._highlight(1)
         self._highlight(2)
+        self.root.enabled = True
 
     def hide(self):
-        self.panel.enabled = False
-        self.title.enabled = False
-        for lbl, val in self.p1_lbls + self.p2_lbls:
-            lbl.enabled = False
-            val.enabled = False
-        self.ok1.enabled = False
-        self.ok2.enabled = False
+        self.root.enabled = False
 
     def _highlight(self, player):
         # Choose list and OK button based on player
@@ -177,7 +165,7 @@ class SettingsScreen:
         val.text = self.format_val(self.data[key][stat])
 
     def input(self, key):
-        if not self.panel.enabled:
+        if not self.root.enabled:
             return
 
         # Player 1
@@ -0,0 +1,143 @@
+import time
+from collections import deque, namedtuple
+
+import pygame
+
+# Joystick input for the whole game, read once per frame on the main thread (SDL only
+# updates joystick state while pumping events, and pumping must stay on the thread that
+# initialised it). Every queued button / axis event is replayed in order instead of only
+# looking at the state at the end of the frame, so a tap pressed and released within one
+# frame still produces its edges and its press.
+
+# An axis "edge" is the stick crossing this threshold (same as the menu deadzone)
+AXIS_EDGE_THRESHOLD = 0.5
+# Oldest edges are dropped past this many unread ones (nobody draining the queue)
+MAX_QUEUED_EDGES = 256
+
+# Events pump() consumes; hats and balls are not used by the game and are dropped
+_JOY_EVENTS = (pygame.JOYAXISMOTION, pygame.JOYBUTTONDOWN, pygame.JOYBUTTONUP,
+               pygame.JOYHATMOTION, pygame.JOYBALLMOTION)
+
+# One joystick after a pump: axes / buttons as tuples, presses = down edges per button
+# since the service started, time = time.perf_counter() of the pump
+PadState = namedtuple('PadState', ['axes', 'buttons', 'presses', 'time'])
+
+# Edge events, shaped like the pygame events process_joystick_event already handles
+# (type, joy, axis / button, value), plus the time of the pump that read them
+JoystickEdge = namedtuple('JoystickEdge', ['type', 'joy', 'axis', 'button', 'value', 'time'])
+
+_EMPTY_STATE = PadState((), (), (), 0.0)
+
+
+def _axis_zone(value):
+    if value <= -AXIS_EDGE_THRESHOLD:
+        return -1
+    if value >= AXIS_EDGE_THRESHOLD:
+        return 1
+    return 0
+
+
+class Pad:
+    """
+    View of one joystick for the players, with the same get_axis / get_button calls
+    as pygame.joystick.Joystick, read from the state of the last pump().
+    """
+
+    def __init__(self, service, joy):
+        self.service = service
+        self.joy = joy
+        self._seen_presses = {}
+
+    @property
+    def state(self):
+        return self.service.snapshot[self.joy]
+
+    def get_axis(self, axis):
+        axes = self.state.axes
+        return axes[axis] if axis < len(axes) else 0.0
+
+    def get_button(self, button):
+        buttons = self.state.buttons
+        return buttons[button] if button < len(buttons) else False
+
+    def take_press(self, button):
+        """
+        True once for each batch of presses of button since the last call, even when
+        the button was already released again within the same frame.
+        """
+        presses = self.state.presses
+        count = presses[button] if button < len(presses) else 0
+        seen = self._seen_presses.get(button, 0)
+        self._seen_presses[button] = count
+        return count > seen
+
+    def sync_presses(self):
+        """
+        Mark every press so far as seen, so presses made in the menus don't fire in-game.
+        """
+        self._seen_presses = dict(enumerate(self.state.presses))
+
+
+class InputService:
+    """
+    Reads the pygame joysticks once per frame with pump() (main thread only).
+      - snapshot: tuple of PadState, one per joystick, replaced whole on every pump
+      - drain_edges(): button down/up and axis threshold crossings, oldest first
+      - pads: one Pad per joystick, to hand to the players
+    """
+
+    def __init__(self, joysticks):
+        self.joysticks = list(joysticks)
+        self.snapshot = tuple(_EMPTY_STATE for _ in self.joysticks)
+        self.pads = [Pad(self, joy) for joy in range(len(self.joysticks))]
+        self._edges = deque(maxlen=MAX_QUEUED_EDGES)
+        # pygame 2 events name their joystick by instance id, not by index
+        self._index = {}
+        for joy, js in enumerate(self.joysticks):
+            get_id = getattr(js, 'get_instance_id', None)
+            self._index[get_id() if get_id else joy] = joy
+
+    def pump(self):
+        """
+        Let SDL refresh the joysticks, turn their queued events into edges and press
+        counts (in the order they happened), then publish the new snapshot.
+        """
+        pygame.event.pump()
+        now = time.perf_counter()
+        axes = [list(state.axes) for state in self.snapshot]
+        presses = [list(state.presses) for state in self.snapshot]
+
+        for event in pygame.event.get(_JOY_EVENTS):
+            joy = self._index.get(getattr(event, 'instance_id', None), getattr(event, 'joy', None))
+            if joy is None or joy >= len(self.joysticks):
+                continue
+            if event.type == pygame.JOYAXISMOTION:
+                pad_axes = axes[joy]
+                if event.axis >= len(pad_axes):
+                    pad_axes.extend([0.0] * (event.axis + 1 - len(pad_axes)))
+                if _axis_zone(event.value) != _axis_zone(pad_axes[event.axis]):
+                    self._edges.append(JoystickEdge(pygame.JOYAXISMOTION, joy, event.axis, None, event.value, now))
+                pad_axes[event.axis] = event.value
+            elif event.type == pygame.JOYBUTTONDOWN:
+                pad_presses = presses[joy]
+                if event.button >= len(pad_presses):
+                    pad_presses.extend([0] * (event.button + 1 - len(pad_presses)))
+                pad_presses[event.button] += 1
+                self._edges.append(JoystickEdge(pygame.JOYBUTTONDOWN, joy, None, event.button, 1, now))
+            elif event.type == pygame.JOYBUTTONUP:
+                self._edges.append(JoystickEdge(pygame.JOYBUTTONUP, joy, None, event.button, 0, now))
+
+        # Held state comes from SDL itself, now that the pump applied every event
+        states = []
+        for joy, js in enumerate(self.joysticks):
+            buttons = tuple(bool(js.get_button(i)) for i in range(js.get_numbuttons()))
+            pad_presses = presses[joy] + [0] * (len(buttons) - len(presses[joy]))
+            states.append(PadState(tuple(js.get_axis(i) for i in range(js.get_numaxes())),
+                                   buttons, tuple(pad_presses), now))
+        self.snapshot = tuple(states)
+
+    def drain_edges(self):
+        edges = []
+        while self._edges:
+            edges.append(self._edges.popleft())
+        return edges
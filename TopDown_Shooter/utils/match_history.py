@@ -0,0 +1,163 @@
+import os
+import time
+import sqlite3
+import datetime
+import threading
+from .file_manager import LEADERBOARD_PATH, load_leaderboard
+from .persistence import write_behind
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+HISTORY_PATH = os.path.join(HERE, '..', 'data', 'match_history.sqlite3')
+
+# Leaderboard periods offered by LeaderboardScreen
+PERIODS = ('all', 'day', 'week')
+
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS matches (
+    id          INTEGER PRIMARY KEY,
+    played_at   REAL NOT NULL,      -- unix time the match ended
+    day         INTEGER NOT NULL,   -- local date ordinal, for daily boards
+    week        INTEGER NOT NULL,   -- ordinal of that week's Monday, for weekly boards
+    winner      TEXT,               -- 'Player 1' / 'Player 2' (NULL for imported rows)
+    name        TEXT,               -- name saved from the game-over screen, NULL if not saved
+    score       INTEGER NOT NULL,
+    duration    REAL,               -- simulated seconds
+    hp_lost     REAL,
+    multiplier  REAL                -- stats multiplier applied to the score
+);
+-- Partial indexes: only saved scores appear on the leaderboard
+CREATE INDEX IF NOT EXISTS idx_matches_all  ON matches(score DESC)       WHERE name IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_matches_day  ON matches(day, score DESC)  WHERE name IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_matches_week ON matches(week, score DESC) WHERE name IS NOT NULL;
+"""
+
+
+def _day_and_week(played_at):
+    date = datetime.date.fromtimestamp(played_at)
+    day = date.toordinal()
+    return day, day - date.weekday()
+
+
+class MatchHistory:
+    """
+    Every finished match, kept in SQLite, with indexed top-N queries
+    for the all-time, daily and weekly leaderboards.
+    The old top-10 leaderboard.csv is imported the first time the database is created.
+    Inserts and names are committed on the write-behind thread; match ids are handed
+    out up front so the game can refer to a match before its row is written, and
+    top_scores() merges rows still waiting for the writer from memory.
+    """
+
+    def __init__(self, path=HISTORY_PATH, leaderboard_csv=LEADERBOARD_PATH):
+        self.path = os.path.abspath(path)
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        # shared with the writer thread, one statement at a time under _lock
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._lock = threading.Lock()
+        # WAL + NORMAL: commits append to the log without an fsync each time
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self._migrate(leaderboard_csv)
+        self._next_id = self.conn.execute('SELECT COALESCE(MAX(id), 0) + 1 FROM matches').fetchone()[0]
+        self._jobs = []      # queued writes, oldest first
+        self._rows = {}      # id -> {'day', 'week', 'name', 'score'} of matches recorded this session
+        self._unsaved = {}   # id -> queued writes to that row not committed yet (under _lock)
+
+    def _migrate(self, leaderboard_csv):
+        version = self.conn.execute('PRAGMA user_version').fetchone()[0]
+        if version >= SCHEMA_VERSION:
+            return
+        with self.conn:
+            self.conn.executescript(_SCHEMA)
+            # v1: import the CSV leaderboard as name-only matches
+            if os.path.exists(leaderboard_csv):
+                played_at = os.path.getmtime(leaderboard_csv)
+                day, week = _day_and_week(played_at)
+                self.conn.executemany(
+                    'INSERT INTO matches (played_at, day, week, name, score) VALUES (?, ?, ?, ?, ?)',
+                    [(played_at, day, week, e['name'], e['score']) for e in load_leaderboard()]
+                )
+            self.conn.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+
+    def record_match(self, winner, score, duration, hp_lost, multiplier, played_at=None):
+        """
+        Store a finished match and return its id (used to attach a name later).
+        """
+        if played_at is None:
+            played_at = time.time()
+        day, week = _day_and_week(played_at)
+        match_id = self._next_id
+        self._next_id += 1
+        self._rows[match_id] = {'day': day, 'week': week, 'name': None, 'score': score}
+        self._queue(
+            match_id,
+            'INSERT INTO matches (id, played_at, day, week, winner, score, duration, hp_lost, multiplier)'
+            ' VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            (match_id, played_at, day, week, winner, score, duration, hp_lost, multiplier)
+        )
+        return match_id
+
+    def set_name(self, match_id, name):
+        """
+        Put a match on the leaderboard under name (Save Score on the game-over screen).
+        """
+        if match_id in self._rows:
+            self._rows[match_id]['name'] = name
+        self._queue(match_id, 'UPDATE matches SET name = ? WHERE id = ?', (name, match_id))
+
+    def _queue(self, match_id, sql, params):
+        def run():
+            with self._lock:
+                with self.conn:
+                    self.conn.execute(sql, params)
+                # committed: top_scores() reads this row from the database again
+                self._unsaved[match_id] -= 1
+                if not self._unsaved[match_id]:
+                    del self._unsaved[match_id]
+        with self._lock:
+            self._unsaved[match_id] = self._unsaved.get(match_id, 0) + 1
+        self._jobs = [job for job in self._jobs if not job.done]
+        self._jobs.append(write_behind(run, self.path))
+
+    def flush(self):
+        """
+        Commit the queued writes now, in order (those the writer already ran are skipped).
+        """
+        for job in self._jobs:
+            job.flush()
+        self._jobs = []
+
+    def top_scores(self, period='all', limit=10, now=None):
+        """
+        Best saved scores as [{'name': str, 'score': int}], for period 'all', 'day' or 'week'.
+        Rows with writes still queued come from memory, so a name saved a moment ago
+        shows up without waiting on the writer thread.
+        """
+        day, week = _day_and_week(time.time() if now is None else now)
+        with self._lock:
+            unsaved = [self._rows[match_id] for match_id in self._unsaved if match_id in self._rows]
+            # the database may still hold an older state of those rows: leave them out
+            skip = set(self._unsaved)
+            if period == 'all':
+                rows = self.conn.execute(
+                    'SELECT id, name, score FROM matches WHERE name IS NOT NULL'
+                    ' ORDER BY score DESC LIMIT ?', (limit + len(skip),)
+                ).fetchall()
+            else:
+                column, value = ('day', day) if period == 'day' else ('week', week)
+                rows = self.conn.execute(
+                    f'SELECT id, name, score FROM matches WHERE name IS NOT NULL AND {column} = ?'
+                    ' ORDER BY score DESC LIMIT ?', (value, limit + len(skip))
+                ).fetchall()
+        entries = [{'name': name, 'score': score} for match_id, name, score in rows if match_id not in skip]
+        for row in unsaved:
+            if row['name'] is not None and (period == 'all' or row[period] == (day if period == 'day' else week)):
+                entries.append({'name': row['name'], 'score': row['score']})
+        entries.sort(key=lambda e: e['score'], reverse=True)
+        return entries[:limit]
+
+    def close(self):
+        self.flush()
+        self.conn.close()
@@ -0,0 +1,237 @@
+import os
+import copy
+import atexit
+import tempfile
+import threading
+
+# In-memory copies of the small CSV files (leaderboard, settings) with write-behind:
+# reads come from memory unless the file changed on disk (mtime), and writes are
+# handed to a background thread that batches them and replaces the file atomically,
+# so the render thread never waits on the cabinet's SD card. One-off writes (replays,
+# match history rows) go through the same thread with write_behind().
+
+# Seconds the writer waits after the first change so bursts end up in one write
+WRITE_DELAY = 0.5
+
+
+def atomic_write(path, write_rows, binary=False):
+    """
+    Write the file through write_rows(f) into a temp file next to it, then rename it
+    over path: readers see either the old file or the new one, never half of it.
+    f is a text file, or a bytes file with binary=True.
+    """
+    folder = os.path.dirname(os.path.abspath(path))
+    os.makedirs(folder, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=folder, prefix='.' + os.path.basename(path), suffix='.tmp')
+    try:
+        with (os.fdopen(fd, 'wb') if binary else os.fdopen(fd, 'w', newline='', encoding='utf-8')) as f:
+            write_rows(f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def _mtime(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+class CachedFile:
+    """
+    One file's data kept in memory.
+      - read(f) parses an open file into data; default() is used when there is no file
+      - write(f, data) serializes data into an open file
+    get() returns a copy, so callers can edit it freely and hand it back with set(),
+    and invalidate() makes the next get() parse the file again.
+    """
+
+    def __init__(self, path, read, write, default):
+        self.path = os.path.abspath(path)
+        self._read = read
+        self._write = write
+        self._default = default
+        self._lock = threading.Lock()      # guards the in-memory state
+        self._io_lock = threading.Lock()   # one write at a time; get() never waits on it
+        self._data = None
+        self._mtime = None
+        self._loaded = False
+        self._dirty = False
+        _writer.register(self)
+
+    def get(self):
+        with self._lock:
+            # Pending changes win over whatever is on disk
+            if not self._dirty:
+                mtime = _mtime(self.path)
+                if not self._loaded or mtime != self._mtime:
+                    self._load(mtime)
+            return copy.deepcopy(self._data)
+
+    def set(self, data):
+        with self._lock:
+            self._data = copy.deepcopy(data)
+            self._loaded = True
+            self._dirty = True
+        _writer.schedule(self)
+
+    def invalidate(self):
+        """
+        Drop the parsed copy so the next get() reads the file again, as after an edit
+        the mtime check cannot see. Pending changes still win until they are written.
+        """
+        with self._lock:
+            self._loaded = False
+
+    def close(self):
+        """
+        Stop tracking the file (pending changes are dropped). For short-lived instances.
+        """
+        _writer.unregister(self)
+
+    def _load(self, mtime):
+        if mtime is None:
+            self._data = self._default()
+        else:
+            with open(self.path, newline='', encoding='utf-8') as f:
+                self._data = self._read(f)
+        self._mtime = mtime
+        self._loaded = True
+
+    def flush(self):
+        """
+        Write pending changes now (normally called from the writer thread).
+        """
+        with self._io_lock:
+            with self._lock:
+                if not self._dirty:
+                    return
+                # set() always stores a fresh copy, so this one stays untouched
+                data = self._data
+                self._dirty = False
+            try:
+                atomic_write(self.path, lambda f: self._write(f, data))
+            except OSError:
+                with self._lock:
+                    self._dirty = True
+                raise
+            with self._lock:
+                if not self._dirty:
+                    self._mtime = _mtime(self.path)
+
+
+class _Job:
+    """
+    A one-off write queued with write_behind(); flush() runs it once, on whichever
+    thread gets there first (the writer, or an exit / read that needs it done).
+    """
+
+    _lock = threading.Lock()   # jobs run one at a time, in the order they were queued
+
+    def __init__(self, run, path):
+        self._run = run
+        self.path = path
+        self.done = False
+
+    def flush(self):
+        with _Job._lock:
+            if self.done:
+                return
+            self.done = True
+            self._run()
+
+
+class _WriteBehind:
+    """
+    Background thread flushing dirty CachedFiles and queued jobs, started on first use.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._files = []
+        self._pending = []
+        self._in_flight = []   # batch the thread is writing
+        self._thread = None
+
+    def register(self, cached_file):
+        with self._cond:
+            self._files.append(cached_file)
+
+    def unregister(self, cached_file):
+        with self._cond:
+            if cached_file in self._files:
+                self._files.remove(cached_file)
+            if cached_file in self._pending:
+                self._pending.remove(cached_file)
+
+    def schedule(self, cached_file):
+        with self._cond:
+            if cached_file not in self._pending:
+                self._pending.append(cached_file)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='write-behind', daemon=True)
+                self._thread.start()
+            self._cond.notify()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._pending:
+                    self._cond.wait()
+                # let a burst of changes accumulate into a single write
+                self._cond.wait(WRITE_DELAY)
+                # the batch stays visible to flush() until every write in it has run
+                batch = self._in_flight = self._pending
+                self._pending = []
+            for pending in batch:
+                self._write(pending)
+            with self._cond:
+                self._in_flight = []
+
+    @staticmethod
+    def _write(pending):
+        try:
+            pending.flush()
+        except Exception as e:
+            print(f'[persistence] could not write {pending.path}: {e}')
+
+    def flush(self):
+        """
+        Synchronously write everything still pending (used at exit), including the
+        batch the thread has taken but not finished. A write already running on the
+        thread holds its lock (the job lock, or the file's io lock), so this waits
+        for it; jobs the thread already ran are skipped.
+        """
+        with self._cond:
+            batch = self._in_flight + self._pending
+            self._pending = []
+        for pending in batch:
+            if isinstance(pending, _Job):
+                self._write(pending)
+        with self._cond:
+            files = list(self._files)
+        for cached_file in files:
+            cached_file.flush()
+
+
+_writer = _WriteBehind()
+atexit.register(_writer.flush)
+
+
+def flush_pending_writes():
+    _writer.flush()
+
+
+def write_behind(run, path):
+    """
+    Run run() on the writer thread (path only names it in error messages).
+    Returns the job; job.flush() runs it right away if it has not run yet.
+    """
+    job = _Job(run, path)
+    _writer.schedule(job)
+    return job
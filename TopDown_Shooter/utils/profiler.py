@@ -0,0 +1,194 @@
+import os
+import csv
+import json
+import time
+from collections import deque
+from functools import wraps
+
+from .persistence import atomic_write
+
+# Per-subsystem frame timing. Code wraps its work in named scopes:
+#
+#     with profiler.scope('simulation'):
+#         ...
+#
+# Scope times are summed over a frame and pushed into a ring buffer per name when
+# the frame ends (GameManager.update calls next_frame() once per frame), which
+# summary() turns into p50 / p95 / p99. Disabled, scope() returns a shared no-op
+# context manager, so instrumented code pays one attribute check per scope.
+# Values that are not durations (HUD text rebuilds per second...) go through
+# set_counter(), which keeps the latest value per name.
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+PROFILE_PATH = os.path.join(HERE, '..', 'data', 'profile.json')
+
+# Frames kept per scope (10 s at 60 fps)
+HISTORY_FRAMES = 600
+# Seconds between automatic dumps while enabled (None = only on request)
+DUMP_INTERVAL = 30
+
+# Start enabled with TOPDOWN_PROFILE=1 (F3 in game toggles it too)
+ENABLED_AT_START = os.environ.get('TOPDOWN_PROFILE') == '1'
+
+
+class _NullScope:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SCOPE = _NullScope()
+
+
+class _Scope:
+    __slots__ = ('profiler', 'name', 'start')
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        frame = self.profiler._frame
+        frame[self.name] = frame.get(self.name, 0.0) + time.perf_counter() - self.start
+        return False
+
+
+def _percentile(ordered, fraction):
+    # nearest-rank on an already sorted list
+    index = min(len(ordered) - 1, max(0, int(round(fraction * len(ordered))) - 1))
+    return ordered[index]
+
+
+class Profiler:
+    """
+    Named scoped timers with a per-frame ring buffer per name.
+      - scope(name): context manager timing a block (nestable, names are flat)
+      - next_frame(): close the current frame (also records 'frame', the full frame time)
+      - summary(): {name: {'p50', 'p95', 'p99', 'max', 'frames'}} in milliseconds
+      - set_counter(name, value): latest value of a non-timing statistic (see counters)
+      - dump(path): summary and counters as .json, or .csv for any other extension
+    Scopes used outside frames (screen transitions, leaderboard I/O) land in the
+    frame they happen in, and only frames where a name ran count for it.
+    """
+
+    def __init__(self, enabled=False, history=HISTORY_FRAMES, dump_interval=DUMP_INTERVAL, dump_path=PROFILE_PATH):
+        self.enabled = enabled
+        self.history = history
+        self.dump_interval = dump_interval
+        self.dump_path = os.path.abspath(dump_path)
+        self.samples = {}    # name -> deque of per-frame seconds
+        self.counters = {}   # name -> latest value given to set_counter
+        self._frame = {}
+        self._scopes = {}
+        self._frame_start = None
+        self._last_dump = time.perf_counter()
+
+    def set_enabled(self, enabled):
+        self.enabled = enabled
+        self._frame = {}
+        self._frame_start = None
+
+    def scope(self, name):
+        if not self.enabled:
+            return _NULL_SCOPE
+        scope = self._scopes.get(name)
+        if scope is None:
+            scope = self._scopes[name] = _Scope(self, name)
+        return scope
+
+    def set_counter(self, name, value):
+        if self.enabled:
+            self.counters[name] = value
+
+    def next_frame(self):
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        if self._frame_start is not None:
+            self._frame['frame'] = now - self._frame_start
+            for name, seconds in self._frame.items():
+                buffer = self.samples.get(name)
+                if buffer is None:
+                    buffer = self.samples[name] = deque(maxlen=self.history)
+                buffer.append(seconds)
+        self._frame = {}
+        self._frame_start = now
+
+        if self.dump_interval and now - self._last_dump >= self.dump_interval:
+            self._last_dump = now
+            try:
+                self.dump(self.dump_path)
+            except OSError as e:
+                print(f'[profiler] could not write {self.dump_path}: {e}')
+
+    def reset(self):
+        self.samples = {}
+        self.counters = {}
+        self._frame = {}
+        self._frame_start = None
+
+    def summary(self):
+        stats = {}
+        for name, buffer in self.samples.items():
+            if not buffer:
+                continue
+            ordered = sorted(buffer)
+            stats[name] = {
+                'p50': _percentile(ordered, 0.50) * 1000,
+                'p95': _percentile(ordered, 0.95) * 1000,
+                'p99': _percentile(ordered, 0.99) * 1000,
+                'max': ordered[-1] * 1000,
+                'frames': len(ordered),
+            }
+        return stats
+
+    def dump(self, path):
+        stats = self.summary()
+        counters = dict(self.counters)
+        if path.endswith('.json'):
+            report = {'scopes': stats, 'counters': counters}
+            atomic_write(path, lambda f: json.dump(report, f, indent=2, sort_keys=True))
+            return
+
+        def write_rows(f):
+            writer = csv.writer(f)
+            writer.writerow(['name', 'p50_ms', 'p95_ms', 'p99_ms', 'max_ms', 'frames'])
+            for name in sorted(stats):
+                s = stats[name]
+                writer.writerow([name, f"{s['p50']:.4f}", f"{s['p95']:.4f}", f"{s['p99']:.4f}",
+                                 f"{s['max']:.4f}", s['frames']])
+            # counters as a second table under the timings
+            writer.writerow([])
+            writer.writerow(['counter', 'value'])
+            for name in sorted(counters):
+                writer.writerow([name, counters[name]])
+        atomic_write(path, write_rows)
+
+
+def profiled(name):
+    """
+    Decorator timing every call of a function under name (for methods that are
+    not per-frame, e.g. screen transitions).
+    """
+    def decorate(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not profiler.enabled:
+                return func(*args, **kwargs)
+            with profiler.scope(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+# Shared instance used across the game
+profiler = Profiler(enabled=ENABLED_AT_START)
@@ -1,5 +1,6 @@
 import os
 import csv
+from .persistence import CachedFile
 
 HERE = os.path.dirname(os.path.abspath(__file__))
 SETTINGS_PATH = os.path.join(HERE, '..', 'data', 'settings.csv')
@@ -19,30 +20,35 @@ DEFAULTS = {
     'Player 2': { stat: (min+max)/2 for stat, (min, max, _) in STAT_LIMITS.items() },
 }
 
-def load_settings():
-    if not os.path.exists(SETTINGS_PATH):
-        return DEFAULTS.copy()
+def _read_settings(f):
     settings = { 'Player 1':{}, 'Player 2':{} }
-    with open(SETTINGS_PATH, newline='') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            p = row['player']
-            if p in settings:
-                for stat in STAT_LIMITS:
-                    val = row.get(stat, '')
-                    try:
-                        settings[p][stat] = float(val)
-                    except:
-                        settings[p][stat] = DEFAULTS[p][stat]
+    reader = csv.DictReader(f)
+    for row in reader:
+        p = row['player']
+        if p in settings:
+            for stat in STAT_LIMITS:
+                val = row.get(stat, '')
+                try:
+                    settings[p][stat] = float(val)
+                except:
+                    settings[p][stat] = DEFAULTS[p][stat]
     return settings
 
+def _write_settings(f, settings):
+    fieldnames = ['player'] + list(STAT_LIMITS.keys())
+    writer = csv.DictWriter(f, fieldnames=fieldnames)
+    writer.writeheader()
+    for p in ['Player 1','Player 2']:
+        row = {'player':p}
+        row.update({stat:settings[p][stat] for stat in STAT_LIMITS})
+        writer.writerow(row)
+
+# Kept in memory; re-read only when the file changes, written in the background.
+# Every load returns a fresh copy, so editing it never touches DEFAULTS or the cache.
+_settings = CachedFile(SETTINGS_PATH, _read_settings, _write_settings, default=lambda: DEFAULTS)
+
+def load_settings():
+    return _settings.get()
+
 def save_settings(settings):
-    os.makedirs(os.path.dirname(SETTINGS_PATH), exist_ok=True)
-    with open(SETTINGS_PATH, 'w', newline='') as f:
-        fieldnames = ['player'] + list(STAT_LIMITS.keys())
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for p in ['Player 1','Player 2']:
-            row = {'player':p}
-            row.update({stat:settings[p][stat] for stat in STAT_LIMITS})
-            writer.writerow(row)
+    _settings.set(settings)